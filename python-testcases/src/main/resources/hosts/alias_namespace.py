@@ -0,0 +1,339 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Alias namespaces, so that test sets running at the same time
+            against one deployment use their own alias names, addresses
+            and alias config items. Namespaces are allocated from a pool
+            shared by the test processes through a locked state file.
+"""
+import contextlib
+import errno
+import fcntl
+import json
+import os
+import socket
+
+NAMESPACES_ENV_VAR = "LITP_HOSTS_ALIAS_NAMESPACES"
+STATE_FILE_ENV_VAR = "LITP_HOSTS_NAMESPACE_FILE"
+DEFAULT_STATE_FILE = "/tmp/litp_hosts_namespaces.json"
+# Suffix of the lock held while a test changes the model or runs a plan
+DEPLOYMENT_LOCK = ".deployment"
+# Addresses of namespace N keep their last octet in 122.123.N.0/24
+NAMESPACE_NETWORK = "122.123.{index}.{host}"
+# Keys of hosts_test_data alias dicts holding names or addresses
+ITEM_ID_KEYS = ("NAME",)
+NAME_KEYS = ("alias_names", "HOSTS_FILE_CHECK")
+ADDRESS_KEYS = ("address", "ADDRESS")
+
+
+class AliasNamespace(object):
+    """
+    Maps the alias names, addresses and config ids a test uses into the
+    namespace of one index. Namespace 0 maps everything to itself.
+    """
+    __slots__ = ("index",)
+
+    def __init__(self, index=0):
+        """
+        Kwargs:
+            index (int): Index of the namespace in the pool, 0 for the
+                         shared namespace of serial runs.
+        """
+        self.index = index
+
+    @property
+    def prefix(self):
+        """
+        str. Prefix of the alias names and item ids of the namespace.
+        """
+        return "ns{0}-".format(self.index) if self.index else ""
+
+    def name(self, name):
+        """
+        Description:
+            Returns a host name or item id in the namespace.
+
+        Args:
+            name (str): Name used by the test.
+
+        Returns:
+            str. The namespaced name.
+        """
+        return self.prefix + name
+
+    def names(self, names, separator=","):
+        """
+        Description:
+            Returns a list of names joined by separator in the namespace.
+
+        Args:
+            names (str): Names used by the test, e.g. "a,b".
+
+        Kwargs:
+            separator (str): Separator of the names.
+
+        Returns:
+            str. The namespaced names.
+        """
+        return separator.join(self.name(name)
+                              for name in names.split(separator))
+
+    def config_id(self, config_id):
+        """
+        Description:
+            Returns an alias config item id in the namespace.
+
+        Args:
+            config_id (str): Id used by the test, e.g. "alias_config".
+
+        Returns:
+            str. The namespaced id.
+        """
+        return "{0}_ns{1}".format(config_id, self.index) if self.index \
+            else config_id
+
+    def address(self, address):
+        """
+        Description:
+            Returns an IPv4 or IPv6 address, optionally with a prefix
+            length, in the namespace. IPv4 addresses move to the
+            namespace network keeping their last octet; IPv6 addresses
+            get the namespace index as their second group.
+
+        Args:
+            address (str): Address used by the test.
+
+        Returns:
+            str. The namespaced address.
+        """
+        if not self.index:
+            return address
+        address, slash, prefix_len = address.partition("/")
+        if ":" in address:
+            packed = bytearray(socket.inet_pton(socket.AF_INET6, address))
+            packed[2:4] = [self.index >> 8, self.index & 0xff]
+            address = socket.inet_ntop(socket.AF_INET6, bytes(packed))
+        else:
+            address = NAMESPACE_NETWORK.format(index=self.index,
+                                               host=address.split(".")[-1])
+        return address + slash + prefix_len
+
+    def alias(self, alias_data):
+        """
+        Description:
+            Returns a copy of a hosts_test_data alias dict in the
+            namespace.
+
+        Args:
+            alias_data (dict): Alias with "NAME" and "PROPS" keys, or
+                               "NAME" and "ADDRESS" for manual entries.
+
+        Returns:
+            dict. The namespaced copy.
+        """
+        namespaced = {}
+        for key, value in alias_data.items():
+            if isinstance(value, dict):
+                value = self.alias(value)
+            elif key in ITEM_ID_KEYS:
+                value = self.name(value)
+            elif key in NAME_KEYS:
+                value = self.names(value, "\t" if "\t" in value else ",")
+            elif key in ADDRESS_KEYS:
+                value = self.address(value)
+            namespaced[key] = value
+        return namespaced
+
+    def wrap_data(self, module):
+        """
+        Description:
+            Returns a view of a test data module in which the alias dicts
+            are in the namespace.
+
+        Args:
+            module (module): Test data module, e.g. hosts_test_data.
+
+        Returns:
+            NamespacedData. The view.
+        """
+        return NamespacedData(self, module)
+
+
+class NamespacedData(object):
+    """
+    Attribute view of a test data module: alias dicts, i.e. dicts with
+    a "NAME" key, are returned as namespaced copies, other values as
+    they are.
+    """
+
+    def __init__(self, namespace, module):
+        """
+        Args:
+            namespace (AliasNamespace): Namespace of the aliases.
+            module (module): Test data module.
+        """
+        self._namespace = namespace
+        self._module = module
+
+    def __getattr__(self, name):
+        value = getattr(self._module, name)
+        if isinstance(value, dict) and "NAME" in value:
+            return self._namespace.alias(value)
+        return value
+
+
+def _pid_alive(pid):
+    """
+    Returns True if a process of this host is running with the pid.
+    """
+    try:
+        os.kill(pid, 0)
+    except OSError as err:
+        return err.errno != errno.ESRCH
+    return True
+
+
+class NamespacePool(object):
+    """
+    Namespaces 1..size shared by the test processes of one host. The
+    owner of each namespace in use is kept in a JSON state file, only
+    read and written under an exclusive lock. Namespaces of processes
+    that died are reclaimed.
+    """
+
+    def __init__(self, size, state_file=DEFAULT_STATE_FILE):
+        """
+        Args:
+            size (int): Number of namespaces.
+
+        Kwargs:
+            state_file (str): Path of the state file.
+        """
+        self.size = size
+        self.state_file = state_file
+
+    def lock(self, suffix=""):
+        """
+        Description:
+            Waits for and takes an exclusive lock, on the lock file of
+            the state file by default, until it is passed to unlock.
+
+        Kwargs:
+            suffix (str): Suffix of another lock file, e.g.
+                          DEPLOYMENT_LOCK.
+
+        Returns:
+            file. The locked lock file.
+        """
+        lock_file = open(self.state_file + suffix + ".lock", "a")
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return lock_file
+
+    @staticmethod
+    def unlock(lock_file):
+        """
+        Description:
+            Releases a lock taken with lock.
+
+        Args:
+            lock_file (file): The locked lock file.
+        """
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        lock_file.close()
+
+    @contextlib.contextmanager
+    def locked(self, suffix=""):
+        """
+        Description:
+            Holds an exclusive lock for the enclosed block, see lock.
+
+        Kwargs:
+            suffix (str): Suffix of another lock file.
+        """
+        lock_file = self.lock(suffix)
+        try:
+            yield
+        finally:
+            self.unlock(lock_file)
+
+    def _read(self):
+        """
+        Returns the owners keyed by namespace index.
+        """
+        try:
+            with open(self.state_file) as state:
+                return dict((int(index), owner) for index, owner
+                            in json.load(state).items())
+        except (IOError, ValueError):
+            return {}
+
+    def _write(self, owners):
+        """
+        Writes the owners keyed by namespace index.
+        """
+        with open(self.state_file, "w") as state:
+            json.dump(owners, state, sort_keys=True)
+
+    def acquire(self, owner):
+        """
+        Description:
+            Allocates the lowest free namespace.
+
+        Args:
+            owner (str): Description of the owner, e.g. the test id.
+
+        Returns:
+            AliasNamespace. The namespace.
+
+        Raises:
+            RuntimeError. If all namespaces are in use.
+        """
+        with self.locked():
+            owners = dict((index, entry) for index, entry
+                          in self._read().items()
+                          if _pid_alive(entry["pid"]))
+            free = [index for index in range(1, self.size + 1)
+                    if index not in owners]
+            if not free:
+                raise RuntimeError("All {0} alias namespaces are in use: "
+                                   "{1}".format(self.size, owners))
+            owners[free[0]] = {"owner": owner, "pid": os.getpid()}
+            self._write(owners)
+        return AliasNamespace(free[0])
+
+    def release(self, namespace):
+        """
+        Description:
+            Returns a namespace to the pool.
+
+        Args:
+            namespace (AliasNamespace): Namespace from acquire.
+        """
+        with self.locked():
+            owners = self._read()
+            owners.pop(namespace.index, None)
+            self._write(owners)
+
+
+def get_namespace_pool():
+    """
+    Description:
+        Returns the namespace pool requested by the environment:
+        LITP_HOSTS_ALIAS_NAMESPACES set to the number of namespaces, and
+        optionally LITP_HOSTS_NAMESPACE_FILE to the state file.
+
+    Returns:
+        NamespacePool. The pool, or None when test sets run serially.
+    """
+    size = int(os.environ.get(NAMESPACES_ENV_VAR) or 0)
+    if not size:
+        return None
+    return NamespacePool(size, os.environ.get(STATE_FILE_ENV_VAR,
+                                              DEFAULT_STATE_FILE))
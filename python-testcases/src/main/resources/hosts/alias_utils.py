@@ -0,0 +1,276 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Rendering of alias items into LITP XML so that any number of
+            aliases can be provisioned with a single litp load, typed
+            alias specs and lazy ranges of generated aliases.
+"""
+import socket
+import struct
+from xml.sax.saxutils import escape, quoteattr
+
+ALIAS_CLUSTER_CONFIG = "alias-cluster-config"
+ALIAS_NODE_CONFIG = "alias-node-config"
+DEFAULT_ALIAS_CONFIG_ID = "alias_config"
+
+XML_HEADER = "<?xml version='1.0' encoding='utf-8'?>"
+XML_NAMESPACES = 'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" ' \
+                 'xmlns:litp="http://www.ericsson.com/litp" ' \
+                 'xsi:schemaLocation="http://www.ericsson.com/litp ' \
+                 'litp-xml-schema/litp.xsd"'
+
+
+def render_alias_xml(alias_data, indent="    "):
+    """
+    Description:
+        Renders a single alias item as LITP XML.
+
+    Args:
+        alias_data (dict): Alias in the hosts_test_data format, i.e. with
+                           "NAME" and "PROPS" keys.
+
+    Kwargs:
+        indent (str): Indentation of the <litp:alias> element.
+
+    Returns:
+        list. XML lines for the alias.
+    """
+    lines = ["{0}<litp:alias id={1}>".format(indent,
+                                             quoteattr(alias_data["NAME"]))]
+    for prop_name, prop_value in sorted(alias_data["PROPS"].items()):
+        lines.append("{0}  <{1}>{2}</{1}>".format(indent, prop_name,
+                                                  escape(str(prop_value))))
+    lines.append("{0}</litp:alias>".format(indent))
+    return lines
+
+
+def render_alias_config_xml(aliases, config_type=ALIAS_CLUSTER_CONFIG,
+                            config_id=DEFAULT_ALIAS_CONFIG_ID, names=None):
+    """
+    Description:
+        Renders an alias cluster/node config item containing all the
+        given aliases as one LITP XML document. The aliases are only
+        iterated once, so they can be generated as they are rendered.
+
+    Args:
+        aliases (iterable): Aliases in the hosts_test_data format, or
+                            AliasSpecs.
+
+    Kwargs:
+        config_type (str): ALIAS_CLUSTER_CONFIG or ALIAS_NODE_CONFIG.
+        config_id (str): Item id of the alias config.
+        names (list): If given, the item id of each alias is appended
+                      to it as the alias is rendered.
+
+    Returns:
+        list. XML document lines, suitable for create_file_on_node.
+    """
+    lines = [XML_HEADER,
+             "<litp:{0} {1} id={2}>".format(config_type, XML_NAMESPACES,
+                                            quoteattr(config_id)),
+             '  <litp:{0}-aliases-collection id="aliases">'.format(
+                 config_type)]
+    for alias in aliases:
+        spec = as_spec(alias)
+        lines.extend(spec.xml_lines)
+        if names is not None:
+            names.append(spec.name)
+    lines.append("  </litp:{0}-aliases-collection>".format(config_type))
+    lines.append("</litp:{0}>".format(config_type))
+    return lines
+
+
+class AliasSpec(object):
+    """
+    An alias item. Specs are immutable, so their CLI properties and XML
+    are rendered once, when first used, and then shared, unless the spec
+    is built not to cache them.
+    """
+    __slots__ = ("name", "address", "alias_names", "_cache", "_cli_props",
+                 "_xml_lines")
+
+    def __init__(self, name, address, alias_names, cache=True):
+        """
+        Args:
+            name (str): Item id of the alias.
+            address (str): IPv4 or IPv6 address, optionally with a prefix
+                           length.
+            alias_names (str): Comma separated names of the alias.
+
+        Kwargs:
+            cache (bool): If False the CLI properties and XML are
+                          rendered on each use, for specs that are
+                          generated and used once. Default is True.
+        """
+        set_slot = super(AliasSpec, self).__setattr__
+        set_slot("name", name)
+        set_slot("address", address)
+        set_slot("alias_names", alias_names)
+        set_slot("_cache", cache)
+        set_slot("_cli_props", None)
+        set_slot("_xml_lines", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("AliasSpec is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("AliasSpec is immutable")
+
+    def __eq__(self, other):
+        return isinstance(other, AliasSpec) and \
+            (self.name, self.address, self.alias_names) == \
+            (other.name, other.address, other.alias_names)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.name, self.address, self.alias_names))
+
+    def __repr__(self):
+        return "AliasSpec({0!r}, {1!r}, {2!r})".format(
+            self.name, self.address, self.alias_names)
+
+    @classmethod
+    def from_dict(cls, alias_data):
+        """
+        Description:
+            Returns the spec of an alias in the hosts_test_data format.
+
+        Args:
+            alias_data (dict): Alias with "NAME" and "PROPS" keys.
+
+        Returns:
+            AliasSpec. The spec.
+        """
+        return cls(alias_data["NAME"], alias_data["PROPS"]["address"],
+                   alias_data["PROPS"]["alias_names"])
+
+    @property
+    def props(self):
+        """
+        dict. Properties of the alias item.
+        """
+        return {"address": self.address, "alias_names": self.alias_names}
+
+    @property
+    def cli_props(self):
+        """
+        str. Properties for litp create/update -o.
+        """
+        if self._cli_props is not None:
+            return self._cli_props
+        cli_props = 'address="{0}" alias_names="{1}"'.format(
+            self.address, self.alias_names)
+        if self._cache:
+            super(AliasSpec, self).__setattr__("_cli_props", cli_props)
+        return cli_props
+
+    @property
+    def xml_lines(self):
+        """
+        tuple. LITP XML lines of the alias, see render_alias_xml.
+        """
+        if self._xml_lines is not None:
+            return self._xml_lines
+        xml_lines = tuple(render_alias_xml({"NAME": self.name,
+                                            "PROPS": self.props}))
+        if self._cache:
+            super(AliasSpec, self).__setattr__("_xml_lines", xml_lines)
+        return xml_lines
+
+
+def as_spec(alias):
+    """
+    Description:
+        Returns the AliasSpec of an alias given as a spec or in the
+        hosts_test_data format.
+
+    Args:
+        alias (AliasSpec or dict): The alias.
+
+    Returns:
+        AliasSpec. The spec.
+    """
+    if isinstance(alias, AliasSpec):
+        return alias
+    return AliasSpec.from_dict(alias)
+
+
+def _address_to_int(family, address):
+    """
+    Returns an IPv4 or IPv6 address as an integer.
+    """
+    high, low = struct.unpack("!QQ", socket.inet_pton(
+        family, address).rjust(16, b"\0"))
+    return high << 64 | low
+
+
+class AliasRange(object):
+    """
+    Sequence of generated aliases with unique names and addresses for
+    scale tests. Every ipv6_every-th alias gets an IPv6 address with a
+    prefix length, the others an IPv4 address. Aliases are only built
+    when accessed: their addresses are worked out by integer arithmetic
+    from the start addresses, so a range of millions costs nothing to
+    create or hold. The specs built do not cache their renderings, as
+    each access builds a new spec.
+    """
+
+    def __init__(self, count, name_prefix, ipv6_every=4, first_index=0,
+                 ipv4_start="10.0.0.1", ipv6_start="fd00:10::",
+                 ipv6_prefix_len=64):
+        """
+        Args:
+            count (int): Number of aliases.
+            name_prefix (str): Prefix of the alias item ids and names.
+
+        Kwargs:
+            ipv6_every (int): Interval of IPv6 aliases, 0 for IPv4 only.
+            first_index (int): Index of the first alias, so that several
+                               ranges can hold disjoint aliases.
+            ipv4_start (str): Address of the alias of index 0.
+            ipv6_start (str): Address of the alias of index 0.
+            ipv6_prefix_len (int): Prefix length of IPv6 addresses.
+        """
+        self.count = count
+        self.name_prefix = name_prefix
+        self.names_prefix = name_prefix.replace("_", "-") + "-"
+        self.ipv6_every = ipv6_every
+        self.first_index = first_index
+        self.ipv4_start = _address_to_int(socket.AF_INET, ipv4_start)
+        self.ipv6_start = _address_to_int(socket.AF_INET6, ipv6_start)
+        self.ipv6_suffix = "/{0}".format(ipv6_prefix_len)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += self.count
+        if not 0 <= position < self.count:
+            raise IndexError("AliasRange index out of range")
+        index = self.first_index + position
+        if self.ipv6_every and \
+                index % self.ipv6_every == self.ipv6_every - 1:
+            number = self.ipv6_start + index
+            address = socket.inet_ntop(socket.AF_INET6, struct.pack(
+                "!QQ", number >> 64, number & 0xffffffffffffffff)) + \
+                self.ipv6_suffix
+        else:
+            address = socket.inet_ntoa(struct.pack(
+                "!I", (self.ipv4_start + index) & 0xffffffff))
+        index = str(index)
+        return AliasSpec(self.name_prefix + "_" + index, address,
+                         self.names_prefix + index, cache=False)
+
+    def __iter__(self):
+        for position in range(self.count):
+            yield self[position]
@@ -0,0 +1,241 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Long lived SSH sessions per node. Commands run as channels on
+            the node's existing transport, so the SSH handshake is not
+            repeated for every command. Root commands run the same way
+            through sudo, reading the password from the channel, so no
+            terminal, prompt or output marker is involved.
+"""
+import pipes
+import threading
+
+DEFAULT_KEEPALIVE_SECS = 30
+DEFAULT_COMMAND_TIMEOUT_SECS = 600
+SUDO_CHECK_TIMEOUT_SECS = 30
+# -S reads the password from stdin, -k ignores cached credentials so that
+# the password is always read, -p '' prints no prompt
+SUDO_CMD = "/usr/bin/sudo -S -k -p '' -- /bin/sh -c {0}"
+
+
+class PoolError(Exception):
+    """
+    Raised when a pooled session cannot be opened or used.
+    """
+
+
+class ConnectError(PoolError):
+    """
+    Raised when a session cannot be opened, or root commands cannot be
+    run over it, i.e. before the command was sent to the node.
+    """
+
+
+class NodeSession(object):
+    """
+    One SSH transport to a node.
+    """
+
+    def __init__(self, host, username, password,
+                 keepalive_secs=DEFAULT_KEEPALIVE_SECS, port=22):
+        """
+        Args:
+            host (str): IP address of the node.
+            username (str): Login user.
+            password (str): Password of the login user, also given to
+                            sudo.
+
+        Kwargs:
+            keepalive_secs (int): Interval of SSH keep-alive packets.
+            port (int): SSH port.
+        """
+        import paramiko
+        self.client = paramiko.SSHClient()
+        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        self.client.connect(host, port=port, username=username,
+                            password=password, look_for_keys=False,
+                            allow_agent=False)
+        self.client.get_transport().set_keepalive(keepalive_secs)
+        self.password = password
+        self.sudo_checked = False
+        self.lock = threading.Lock()
+
+    @property
+    def alive(self):
+        """
+        bool. True while the SSH transport is usable.
+        """
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def close(self):
+        """
+        Closes the SSH transport.
+        """
+        self.client.close()
+
+    def execute(self, cmd, timeout=DEFAULT_COMMAND_TIMEOUT_SECS,
+                stdin_data=None):
+        """
+        Description:
+            Runs a command as the login user on a new channel of the
+            existing transport.
+
+        Kwargs:
+            timeout (int): Command timeout in seconds.
+            stdin_data (str): Data written to the stdin of the command,
+                              which is then closed.
+
+        Returns:
+            tuple. (stdout lines, stderr lines, return code)
+        """
+        stdin, stdout, stderr = self.client.exec_command(cmd,
+                                                         timeout=timeout)
+        if stdin_data is not None:
+            stdin.write(stdin_data)
+            stdin.flush()
+        stdin.channel.shutdown_write()
+        out = stdout.read().decode("utf-8", "replace").splitlines()
+        err = stderr.read().decode("utf-8", "replace").splitlines()
+        return out, err, stdout.channel.recv_exit_status()
+
+    def _sudo(self, cmd, timeout):
+        """
+        Runs a command as root through sudo on a new channel.
+
+        Returns:
+            tuple. (stdout lines, stderr lines, return code)
+        """
+        return self.execute(SUDO_CMD.format(pipes.quote(cmd)), timeout,
+                            stdin_data=self.password + "\n")
+
+    def execute_as_root(self, cmd, timeout=DEFAULT_COMMAND_TIMEOUT_SECS):
+        """
+        Description:
+            Runs a command as root on a new channel of the existing
+            transport. The first time, a no-op is run to check that the
+            login user may use sudo.
+
+        Returns:
+            tuple. (stdout lines, stderr lines, return code)
+
+        Raises:
+            ConnectError. If the login user cannot run commands as root
+            through sudo.
+        """
+        if not self.sudo_checked:
+            try:
+                out, err, rc = self._sudo("/usr/bin/id -u",
+                                          SUDO_CHECK_TIMEOUT_SECS)
+            except Exception as error:  # pylint: disable=broad-except
+                raise ConnectError("Failed to check sudo: {0}".format(error))
+            if rc != 0 or out != ["0"]:
+                raise ConnectError("Cannot run commands as root with sudo: "
+                                   "{0}".format(err or out))
+            self.sudo_checked = True
+        return self._sudo(cmd, timeout)
+
+
+class ConnectionPool(object):
+    """
+    NodeSessions keyed by node, reconnected on failure.
+    """
+
+    def __init__(self, credentials_func,
+                 keepalive_secs=DEFAULT_KEEPALIVE_SECS):
+        """
+        Args:
+            credentials_func (callable): Returns (host, username,
+                                         password) for a node.
+
+        Kwargs:
+            keepalive_secs (int): Interval of SSH keep-alive packets.
+        """
+        self.credentials_func = credentials_func
+        self.keepalive_secs = keepalive_secs
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def _get_session(self, node):
+        """
+        Returns the live session of a node, opening one if needed.
+        """
+        with self.lock:
+            session = self.sessions.get(node)
+            if session is not None and not session.alive:
+                session.close()
+                session = None
+            if session is None:
+                try:
+                    host, username, password = self.credentials_func(node)
+                    session = NodeSession(host, username, password,
+                                          self.keepalive_secs)
+                except Exception as err:  # pylint: disable=broad-except
+                    raise ConnectError("Failed to connect to {0}: "
+                                       "{1}".format(node, err))
+                self.sessions[node] = session
+            return session
+
+    def run(self, node, cmd, su_root=False,
+            timeout=DEFAULT_COMMAND_TIMEOUT_SECS):
+        """
+        Description:
+            Runs a command on a node over its pooled session, reopening
+            the session first if it has died. A command that fails once
+            it has been sent is not retried, as it may have run already;
+            the session is closed instead, since its state is unknown.
+
+        Args:
+            node (str): Node filename.
+            cmd (str): Command to run.
+
+        Kwargs:
+            su_root (bool): If True, run the command as root.
+            timeout (int): Command timeout in seconds.
+
+        Returns:
+            tuple. (stdout lines, stderr lines, return code)
+
+        Raises:
+            ConnectError. If the command could not be sent.
+        """
+        session = self._get_session(node)
+        try:
+            with session.lock:
+                if su_root:
+                    return session.execute_as_root(cmd, timeout)
+                return session.execute(cmd, timeout)
+        except ConnectError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            self.evict(node)
+            raise
+
+    def evict(self, node):
+        """
+        Description:
+            Closes and forgets the session of a node, e.g. before the
+            node is powered off.
+
+        Args:
+            node (str): Node filename.
+        """
+        with self.lock:
+            session = self.sessions.pop(node, None)
+        if session is not None:
+            session.close()
+
+    def close(self):
+        """
+        Description:
+            Closes every session in the pool.
+        """
+        for node in list(self.sessions):
+            self.evict(node)
@@ -0,0 +1,1321 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Common base class for the hosts test sets.
+"""
+import atexit
+import csv
+import inspect
+import itertools
+import json
+import logging
+import os
+import time
+from litp_generic_test import GenericTest
+from hosts_utils import HostsUtils, SHA256SUM_PATH, get_helper_cmd
+import model_utils
+from model_utils import ModelTree
+import plan_utils
+import alias_utils
+from parallel_utils import run_in_parallel
+from hosts_sim import SimulatedCluster, SimCmdUtils, sim_enabled
+from connection_pool import ConnectionPool, ConnectError
+from log_scanner import LogScanner
+from step_timer import StepTimer
+from interaction_log import get_interaction_log, InteractionProxy
+from round_trips import RoundTripCounter, counted_helper, get_limits
+from alias_namespace import AliasNamespace, DEPLOYMENT_LOCK, \
+    get_namespace_pool
+import xml_stream
+import hosts_verifier
+import test_constants as const
+
+
+class HostsGenericTest(GenericTest):
+    """
+        Base class providing the shared hosts verification helpers
+    """
+    # Set to False to send every find/get_props_from_url to the node
+    use_model_cache = True
+    # Recursive model dumps, keyed by (test class, node)
+    _model_trees = {}
+    # Subtrees of the model dumps changed since they were read, by key
+    _stale_model_paths = {}
+    # Longest time a single plan watch command runs on the MS
+    plan_watch_chunk_secs = 120
+    # Longest time to wait for a plan to stop after litp stop_plan
+    plan_stop_timeout_secs = 300
+    # Set to False to open a new SSH session for every run_command
+    use_connection_pool = True
+    # SSH sessions shared by every test in the run
+    _connection_pool = None
+    # run_command keyword arguments the connection pool can honour
+    pool_run_command_kwargs = ("su_root", "default_asserts", "logging")
+    # Set to False to fetch /etc/hosts and check expectations locally
+    verify_hosts_remotely = True
+    # Longest time assert_hosts_on_nodes waits for /etc/hosts to converge
+    hosts_converge_timeout_secs = 60
+    # Shortest and longest interval between two /etc/hosts checks
+    hosts_poll_min_secs = 0.5
+    hosts_poll_max_secs = 10
+    # Directory the per test step timing profiles are written to
+    profile_dir = os.environ.get("LITP_HOSTS_PROFILE_DIR",
+                                 "/tmp/litp_hosts_profiles")
+    # GenericTest helpers answered directly by the simulated cluster
+    sim_methods = ("get_management_node_filename",
+                   "get_managed_node_filenames", "get_node_url_from_filename",
+                   "get_file_len", "wait_for_log_msg", "turn_on_litp_debug",
+                   "run_puppet_once", "is_ip_pingable", "set_pws_new_node",
+                   "del_file_after_run", "get_item_state",
+                   "execute_cli_export_cmd", "execute_cli_show_cmd",
+                   "execute_cli_createplan_cmd", "execute_cli_stopplan_cmd")
+    # GenericTest helpers never recorded or replayed
+    unrecorded_methods = ("log",)
+
+    def setUp(self):
+        """
+            Runs before every single test. With LITP_HOSTS_SIM set, the
+            test runs against a SimulatedCluster instead of a deployment.
+            With LITP_HOSTS_RECORD set to a directory, the GenericTest
+            calls of the test and their results are recorded to a fixture
+            in it; with LITP_HOSTS_REPLAY set, they are answered from the
+            fixture instead of a deployment.
+        """
+        self.step_timer = StepTimer(self.id())
+        self.step_timer.start_step(None, "setUp")
+        self.round_trips = RoundTripCounter()
+        # With LITP_HOSTS_ALIAS_NAMESPACES set, tests running at the same
+        # time use their own alias namespace and take turns to change the
+        # model and run plans
+        self._namespace_pool = get_namespace_pool()
+        self._deployment_lock = None
+        self.alias_ns = AliasNamespace() if self._namespace_pool is None \
+            else self._namespace_pool.acquire(self.id())
+        if self._namespace_pool is not None:
+            # Other tests change the model while this one runs
+            self.use_model_cache = False
+        self.interactions = get_interaction_log(self.id())
+        replaying = self._replaying()
+        self.sim = SimulatedCluster() if sim_enabled() and not replaying \
+            else None
+        if self.sim is not None:
+            self.rhc = self.net = SimCmdUtils()
+        elif not replaying:
+            super(HostsGenericTest, self).setUp()
+        for name in self.sim_methods:
+            setattr(self, name, self._backend(name))
+        if self.interactions is not None:
+            # Each fixture must hold every model read of its test
+            self.invalidate_model_cache()
+            for name in ("rhc", "net"):
+                setattr(self, name, InteractionProxy(
+                    self.interactions, name, getattr(self, name, None)))
+        self.hosts = HostsUtils()
+        self._alias_xml_ids = itertools.count(1)
+        self._model_changed = False
+        # Subtrees changed by the test, whose states a plan changes again
+        self._changed_model_paths = set()
+        self.plan_phase_durations = []
+        self.hosts_convergence = []
+        # (file path, checksum per node, content per checksum)
+        self._file_snapshots = []
+
+    def tearDown(self):
+        """
+            Runs after every single test
+        """
+        self.step_timer.start_step(None, "tearDown")
+        if self._model_changed:
+            # The cleanup removes the items the test created
+            self._mark_model_stale(self._changed_model_paths)
+            self._hold_deployment()
+        try:
+            self.restore_file_snapshots()
+        finally:
+            try:
+                if self.sim is not None:
+                    self.sim.restore_backups()
+                elif not self._replaying():
+                    super(HostsGenericTest, self).tearDown()
+            finally:
+                self._release_deployment()
+                if self._namespace_pool is not None:
+                    self._namespace_pool.release(self.alias_ns)
+        if self.interactions is not None:
+            self.interactions.save()
+        self.step_timer.finish()
+        round_trips = self.round_trips.get_profile()
+        self.log("info", "Remote operations: {0}".format(
+            round_trips["totals"]))
+        self.step_timer.write_profile(
+            self.profile_dir, plan_phase_durations=self.plan_phase_durations,
+            hosts_convergence=self.hosts_convergence,
+            remote_operations=round_trips)
+
+    def check_round_trip_budget(self, limits, before, warn_only=False):
+        """
+        Description:
+            Checks the remote operations made since a point of the test
+            against a budget, see round_trips.round_trip_budget.
+
+        Args:
+            limits (dict): Most operations allowed per kind or in total,
+                           and per managed node.
+            before (dict): Totals of self.round_trips at that point.
+
+        Kwargs:
+            warn_only (bool): If True, log a warning instead of failing.
+        """
+        limits = get_limits(limits, len(self.get_managed_node_filenames()))
+        totals = self.round_trips.get_totals()
+        exceeded = ["{0}: {1} > {2}".format(kind, totals[kind] - before[kind],
+                                            limit)
+                    for kind, limit in sorted(limits.items())
+                    if totals[kind] - before[kind] > limit]
+        if not exceeded:
+            return
+        msg = "Remote operation budget exceeded: {0}. Per helper: {1}".format(
+            ", ".join(exceeded), self.round_trips.get_profile()["by_helper"])
+        if warn_only:
+            self.log("warning", msg)
+        else:
+            self.fail(msg)
+
+    def log(self, level, msg, *args, **kwargs):
+        """
+        Description:
+            GenericTest.log. "# N. ..." step markers also start a new
+            step of the step timer.
+        """
+        step_timer = getattr(self, "step_timer", None)
+        if step_timer is not None:
+            step_timer.mark(msg)
+        if self._replaying():
+            return logging.getLogger(type(self).__name__).log(
+                getattr(logging, level.upper(), logging.INFO), msg)
+        return self._backend("log")(level, msg, *args, **kwargs)
+
+    def _replaying(self):
+        """
+        Returns True if GenericTest calls are answered from a fixture.
+        """
+        interactions = getattr(self, "interactions", None)
+        return interactions is not None and interactions.replaying
+
+    def _backend(self, name):
+        """
+        Description:
+            Returns the implementation of a GenericTest method, taken from
+            the simulated cluster when the test runs against one, and
+            recorded or replayed when an interaction log is active.
+
+        Args:
+            name (str): Name of the GenericTest method.
+
+        Returns:
+            callable. The bound method.
+        """
+        if self.sim is not None:
+            func = getattr(self.sim, name)
+        elif self._replaying():
+            func = None
+        else:
+            func = getattr(super(HostsGenericTest, self), name)
+        return self.round_trips.wrap(name, self._interaction(name, func))
+
+    def _interaction(self, name, func):
+        """
+        Returns func, recorded or replayed under name when an interaction
+        log is active.
+        """
+        if self.interactions is None or name in self.unrecorded_methods:
+            return func
+        return self.interactions.wrap(name, func)
+
+    def _get_node_credentials(self, node):
+        """
+        Description:
+            Returns what the connection pool needs to log in to a node.
+
+        Args:
+            node (str): Node filename.
+
+        Returns:
+            tuple. (IP address, username, password)
+        """
+        return (self.get_node_att(node, "ipv4"),
+                self.get_node_att(node, "username"),
+                self.get_node_att(node, "password"))
+
+    def get_connection_pool(self):
+        """
+        Description:
+            Returns the connection pool shared by all hosts tests, creating
+            it on first use.
+
+        Returns:
+            ConnectionPool. The pool.
+        """
+        if HostsGenericTest._connection_pool is None:
+            pool = ConnectionPool(self._get_node_credentials)
+            atexit.register(pool.close)
+            HostsGenericTest._connection_pool = pool
+        return HostsGenericTest._connection_pool
+
+    def evict_connections(self, node):
+        """
+        Description:
+            Closes the pooled SSH session of a node, e.g. before the node
+            is powered off.
+
+        Args:
+            node (str): Node filename.
+        """
+        if HostsGenericTest._connection_pool is not None:
+            HostsGenericTest._connection_pool.evict(node)
+
+    def run_command(self, node, cmd, *args, **kwargs):
+        """
+        Description:
+            GenericTest.run_command, run over the pooled SSH session of the
+            node when the requested options allow it. If the pool cannot
+            connect, log in or run root commands through sudo, it is
+            switched off for the rest of the run and the GenericTest
+            implementation is used instead. A command
+            that failed after it was sent is not run again.
+        """
+        return self.round_trips.wrap("run_command", self._run_command)(
+            node, cmd, *args, **kwargs)
+
+    def _run_command(self, node, cmd, *args, **kwargs):
+        """
+        Runs a command for run_command.
+        """
+        if self.sim is None and self.use_connection_pool and not args and \
+                not self._replaying() and \
+                set(kwargs).issubset(self.pool_run_command_kwargs):
+            try:
+                result = self._interaction(
+                    "run_command", self._run_pooled_command)(node, cmd,
+                                                             **kwargs)
+            except ConnectError as err:
+                self.log("warning", "Connection pool disabled, failed to "
+                                    "send '{0}' to {1}: {2}".format(cmd, node,
+                                                                    err))
+                HostsGenericTest.use_connection_pool = False
+            else:
+                self.step_timer.record_round_trip(cmd, result[0], result[1])
+                return result
+
+        result = self._backend("run_command")(node, cmd, *args, **kwargs)
+        self.step_timer.record_round_trip(cmd, result[0], result[1])
+        return result
+
+    def _run_pooled_command(self, node, cmd, **kwargs):
+        """
+        Runs a command over the pooled SSH session of the node, logging
+        and asserting like GenericTest.run_command.
+        """
+        result = self.get_connection_pool().run(
+            node, cmd, su_root=kwargs.get("su_root", False))
+        if kwargs.get("logging", True):
+            self.log("info", "[{0}] # {1}".format(node, cmd))
+        if kwargs.get("default_asserts", False):
+            self.assertEqual([], result[1])
+            self.assertEqual(0, result[2])
+        return result
+
+    def poweroff_peer_node(self, node, node_to_poweroff, *args, **kwargs):
+        """
+        Description:
+            GenericTest.poweroff_peer_node, closing the pooled SSH session
+            of the node first.
+        """
+        self.evict_connections(node_to_poweroff)
+        return self._backend("poweroff_peer_node")(node, node_to_poweroff,
+                                                   *args, **kwargs)
+
+    def backup_file(self, *args, **kwargs):
+        """
+        Description:
+            GenericTest.backup_file
+        """
+        return self._backend("backup_file")(*args, **kwargs)
+
+    def create_file_on_node(self, *args, **kwargs):
+        """
+        Description:
+            GenericTest.create_file_on_node
+        """
+        return self._backend("create_file_on_node")(*args, **kwargs)
+
+    def get_model_tree(self, node):
+        """
+        Description:
+            Returns the cached model of a node, dumping it with a single
+            recursive litp show the first time it is needed by the test
+            class or after it has been invalidated. Subtrees changed
+            since are read again with one remote call.
+
+        Args:
+            node (str): Node to read the LITP model from, usually the MS.
+
+        Returns:
+            ModelTree. The parsed model.
+        """
+        key = (type(self).__name__, node)
+        stale = self._stale_model_paths.pop(key, None)
+        if key in self._model_trees and stale:
+            roots = sorted(path for path in stale
+                           if not [other for other in stale
+                                   if other != path and
+                                   path.startswith(other.rstrip("/") + "/")])
+            stdout, _, rc = self.run_command(node,
+                                             model_utils.get_show_cmd(roots))
+            if rc == 0:
+                self._model_trees[key].replace_subtrees(roots,
+                                                        ModelTree(stdout))
+            else:
+                del self._model_trees[key]
+        if key not in self._model_trees:
+            stdout, _, _ = self.execute_cli_show_cmd(node, "/", "-r")
+            self._model_trees[key] = ModelTree(stdout)
+        return self._model_trees[key]
+
+    def invalidate_model_cache(self):
+        """
+        Description:
+            Drops the cached model of every node for this test class.
+        """
+        for key in list(self._model_trees):
+            if key[0] == type(self).__name__:
+                del self._model_trees[key]
+                self._stale_model_paths.pop(key, None)
+
+    def _mark_model_stale(self, paths):
+        """
+        Description:
+            Marks subtrees of the cached models of this test class to be
+            read again.
+
+        Args:
+            paths (iterable): Paths of the subtrees.
+        """
+        for key in self._model_trees:
+            if key[0] == type(self).__name__:
+                self._stale_model_paths.setdefault(key, set()).update(paths)
+
+    def _model_updated(self, path=None):
+        """
+        Description:
+            Records that the LITP model has changed during the test.
+
+        Kwargs:
+            path (str): Path of the subtree that changed, None if it is
+                        not known, which drops the cached model.
+        """
+        self._model_changed = True
+        if path is None:
+            self.invalidate_model_cache()
+            return
+        self._changed_model_paths.add(path)
+        self._mark_model_stale([path])
+
+    def _hold_deployment(self):
+        """
+        Description:
+            Waits for and takes the deployment lock when tests share the
+            deployment in alias namespaces. It is held from the first
+            model change of the test until its plan has run successfully,
+            so that the plan of another test does not pick up changes
+            half made, and again during the cleanup of the test.
+        """
+        if self._namespace_pool is not None and \
+                self._deployment_lock is None:
+            self._deployment_lock = self._namespace_pool.lock(
+                DEPLOYMENT_LOCK)
+
+    def _release_deployment(self):
+        """
+        Description:
+            Releases the deployment lock if the test holds it.
+        """
+        if self._deployment_lock is not None:
+            self._namespace_pool.unlock(self._deployment_lock)
+            self._deployment_lock = None
+
+    def _plan_applied(self):
+        """
+        Description:
+            Records that a plan ran, which changes the states of the
+            items the test changed and removes those in ForRemoval.
+        """
+        self._model_changed = True
+        self._mark_model_stale(self._changed_model_paths)
+
+    @staticmethod
+    def _cli_path(args, kwargs, parent):
+        """
+        Returns the subtree changed by a litp create/update/remove/load
+        call: the parent of the item created or removed, as it may not
+        exist afterwards, or the item updated or loaded into.
+        """
+        url = kwargs.get("url", args[1] if len(args) > 1 else None)
+        if url is None:
+            return None
+        if not parent:
+            return url
+        return url.rstrip("/").rsplit("/", 1)[0] or "/"
+
+    def find(self, node, path, resource, rtn_type_children=True,
+             assert_not_empty=True, **kwargs):
+        """
+        Description:
+            GenericTest.find answered from the cached model tree. Lookups
+            of references or filtered services, and of paths missing from
+            the cached tree, go to the node.
+        """
+        tree = self.get_model_tree(node) \
+            if self.use_model_cache and not kwargs else None
+        if tree is None or path not in tree:
+            return self._backend("find")(node, path, resource,
+                                         rtn_type_children, assert_not_empty,
+                                         **kwargs)
+
+        paths = tree.find(path, resource, rtn_type_children)
+        if assert_not_empty:
+            self.assertNotEqual([], paths, "Could not find '{0}' items "
+                                "under '{1}'".format(resource, path))
+        return paths
+
+    def find_children_of_collect(self, node, path, resource, **kwargs):
+        """
+        Description:
+            GenericTest.find_children_of_collect answered from the cached
+            model tree, or by the node for paths missing from it.
+        """
+        tree = self.get_model_tree(node) \
+            if self.use_model_cache and not kwargs else None
+        if tree is None or path not in tree:
+            return self._backend("find_children_of_collect")(
+                node, path, resource, **kwargs)
+
+        return tree.find_children_of_collect(path, resource)
+
+    def get_props_from_url(self, node, url, filter_prop=None, **kwargs):
+        """
+        Description:
+            GenericTest.get_props_from_url answered from the cached model
+            tree.
+        """
+        props = None
+        if self.use_model_cache and not kwargs:
+            props = self.get_model_tree(node).get_props(url)
+        if props is None:
+            return self._backend("get_props_from_url")(node, url,
+                                                       filter_prop, **kwargs)
+
+        if filter_prop is not None:
+            return props.get(filter_prop)
+        return props
+
+    @counted_helper
+    def get_model_subtrees(self, node, paths):
+        """
+        Description:
+            Returns the model of several subtrees. It is the cached model
+            tree if it is loaded, otherwise all subtrees are read with one
+            remote call rather than one litp show per item.
+
+        Args:
+            node (str): Node to read the LITP model from, usually the MS.
+            paths (list): Paths of items or of subtree roots.
+
+        Returns:
+            ModelTree. The parsed model, holding at least the subtrees.
+        """
+        tree = self.get_model_tree(node) if self.use_model_cache and \
+            (type(self).__name__, node) in self._model_trees else None
+        if tree is None:
+            stdout, _, _ = self.run_command(
+                node, model_utils.get_show_cmd(paths), default_asserts=True)
+            tree = ModelTree(stdout)
+        return tree
+
+    @counted_helper
+    def get_props_from_urls(self, node, paths):
+        """
+        Description:
+            Returns the properties of every item in several subtrees of
+            the model, see get_model_subtrees.
+
+        Args:
+            node (str): Node to read the LITP model from, usually the MS.
+            paths (list): Paths of items or of subtree roots.
+
+        Returns:
+            dict. Item properties keyed by item path.
+        """
+        tree = self.get_model_subtrees(node, paths)
+        props = {}
+        for path in paths:
+            props.update(tree.get_props_under(path))
+        return props
+
+    def execute_cli_create_cmd(self, *args, **kwargs):
+        """
+        Description:
+            GenericTest.execute_cli_create_cmd, marking the changed
+            subtree of the cached model to be read again.
+        """
+        self._hold_deployment()
+        try:
+            return self._backend("execute_cli_create_cmd")(*args, **kwargs)
+        finally:
+            self._model_updated(self._cli_path(args, kwargs, True))
+
+    def execute_cli_update_cmd(self, *args, **kwargs):
+        """
+        Description:
+            GenericTest.execute_cli_update_cmd, marking the changed
+            subtree of the cached model to be read again.
+        """
+        self._hold_deployment()
+        try:
+            return self._backend("execute_cli_update_cmd")(*args, **kwargs)
+        finally:
+            self._model_updated(self._cli_path(args, kwargs, False))
+
+    def execute_cli_remove_cmd(self, *args, **kwargs):
+        """
+        Description:
+            GenericTest.execute_cli_remove_cmd, marking the changed
+            subtree of the cached model to be read again.
+        """
+        self._hold_deployment()
+        try:
+            return self._backend("execute_cli_remove_cmd")(*args, **kwargs)
+        finally:
+            self._model_updated(self._cli_path(args, kwargs, True))
+
+    def execute_cli_load_cmd(self, *args, **kwargs):
+        """
+        Description:
+            GenericTest.execute_cli_load_cmd, marking the changed
+            subtree of the cached model to be read again.
+        """
+        self._hold_deployment()
+        try:
+            return self._backend("execute_cli_load_cmd")(*args, **kwargs)
+        finally:
+            self._model_updated(self._cli_path(args, kwargs, False))
+
+    def execute_cli_runplan_cmd(self, *args, **kwargs):
+        """
+        Description:
+            GenericTest.execute_cli_runplan_cmd, marking the subtrees the
+            test changed to be read again, as the plan changes their
+            states and removes the items in ForRemoval state.
+        """
+        self._hold_deployment()
+        try:
+            return self._backend("execute_cli_runplan_cmd")(*args, **kwargs)
+        finally:
+            self._plan_applied()
+
+    def run_and_check_plan(self, *args, **kwargs):
+        """
+        Description:
+            GenericTest.run_and_check_plan, marking the subtrees the test
+            changed to be read again, see execute_cli_runplan_cmd.
+        """
+        self._hold_deployment()
+        try:
+            result = self._backend("run_and_check_plan")(*args, **kwargs)
+        finally:
+            self._plan_applied()
+        expected_plan_state = kwargs.get("expected_plan_state",
+                                         args[1] if len(args) > 1 else None)
+        if expected_plan_state == const.PLAN_COMPLETE:
+            self._release_deployment()
+        return result
+
+    @counted_helper
+    def get_hosts_snapshot(self, node):
+        """
+        Description:
+            Fetches the /etc/hosts file of a node in one remote call and
+            parses it locally.
+
+        Args:
+            node (str): Node to fetch the file from.
+
+        Returns:
+            HostsFile. The parsed file.
+        """
+        stdout, _, _ = self.run_command(node, self.hosts.get_cat_hosts_cmd(),
+                                        default_asserts=True)
+        return self.hosts.parse_hosts(stdout)
+
+    @counted_helper
+    def verify_hosts(self, node, expectations):
+        """
+        Description:
+            Checks /etc/hosts of a node against expectations. By default
+            the check runs on the node itself, which only sends back the
+            failed checks and the lines they concern.
+
+        Args:
+            node (str): Node to check.
+            expectations (list): Expectations built by
+                                 hosts_verifier.expectation.
+
+        Returns:
+            list. Failed checks, see hosts_verifier.verify.
+        """
+        return self._run_hosts_verifier(node, "verify", expectations)
+
+    def _run_hosts_verifier(self, node, command, options):
+        """
+        Runs a hosts_verifier command against /etc/hosts of a node, on
+        the node itself unless verify_hosts_remotely is False.
+
+        Returns:
+            The decoded result of the command.
+        """
+        if not self.verify_hosts_remotely:
+            stdout, _, _ = self.run_command(
+                node, self.hosts.get_cat_hosts_cmd(), default_asserts=True)
+            return json.loads(hosts_verifier.run(command, stdout, options))
+
+        cmd = get_helper_cmd(
+            hosts_verifier.HELPER_NAME, inspect.getsource(hosts_verifier),
+            [command, const.ETC_HOSTS,
+             json.dumps(options, separators=(",", ":"))])
+        stdout, _, _ = self.run_command(node, cmd, default_asserts=True)
+        return json.loads("\n".join(stdout))
+
+    @counted_helper
+    def verify_hosts_on_nodes(self, expectations):
+        """
+        Description:
+            Checks /etc/hosts of several nodes concurrently, each against
+            its own expectations.
+
+        Args:
+            expectations (dict): Expectations keyed by node.
+
+        Returns:
+            dict. Failed checks keyed by node.
+        """
+        nodes = sorted(expectations)
+        results = self.run_on_nodes(
+            nodes, lambda node: self.verify_hosts(node, expectations[node]))
+        return dict(zip(nodes, results))
+
+    @counted_helper
+    def wait_for_hosts_state(self, expected, nodes, timeout=None):
+        """
+        Description:
+            Waits until /etc/hosts of every node meets all expectations,
+            e.g. while puppet applies changes out of band, see
+            poll_hosts_state, and fails the test if a node did not
+            converge.
+
+        Args:
+            expected (list): Expectations built by
+                             hosts_verifier.expectation, or lists of them
+                             keyed by node.
+            nodes (list): Nodes to check.
+
+        Kwargs:
+            timeout (int): Maximum time to wait, in seconds. Default is
+                           hosts_converge_timeout_secs.
+
+        Returns:
+            dict. Seconds until convergence keyed by node.
+        """
+        if timeout is None:
+            timeout = self.hosts_converge_timeout_secs
+        if not isinstance(expected, dict):
+            expected = dict((node, expected) for node in nodes)
+        converged, failures = self.poll_hosts_state(
+            dict((node, expected[node]) for node in nodes), timeout)
+        errors = ["{0}: {1} {2}".format(node, failure["reason"],
+                                        failure["lines"])
+                  for node in sorted(failures)
+                  for failure in failures[node]]
+        self.assertEqual([], errors, "/etc/hosts did not converge within "
+                                     "{0}s: {1}".format(timeout, errors))
+        return converged
+
+    @counted_helper
+    def poll_hosts_state(self, expectations, timeout=None):
+        """
+        Description:
+            Checks /etc/hosts of every node until it meets its
+            expectations or the timeout passes. Nodes stop being checked
+            as soon as they converge. The interval between checks doubles
+            while no node converges and drops back to the minimum
+            whenever one does. The time to convergence of each node is
+            logged and appended to self.hosts_convergence.
+
+        Args:
+            expectations (dict): Expectations built by
+                                 hosts_verifier.expectation, keyed by
+                                 node.
+
+        Kwargs:
+            timeout (int): Maximum time to wait, in seconds. Default is
+                           hosts_converge_timeout_secs.
+
+        Returns:
+            tuple. Seconds until convergence keyed by node, and the
+            failed checks of the last check of the nodes that did not
+            converge, keyed by node.
+        """
+        if timeout is None:
+            timeout = self.hosts_converge_timeout_secs
+        start = time.time()
+        interval = self.hosts_poll_min_secs
+        pending = sorted(expectations)
+        converged = {}
+        while True:
+            failures = self.verify_hosts_on_nodes(
+                dict((node, expectations[node]) for node in pending))
+            elapsed = time.time() - start
+            for node in [node for node in pending if not failures[node]]:
+                converged[node] = round(elapsed, 3)
+                pending.remove(node)
+            if not pending or elapsed >= timeout:
+                break
+            if len(failures) > len(pending):
+                # Some node converged in this round, others may follow
+                interval = self.hosts_poll_min_secs
+            time.sleep(min(interval, max(timeout - elapsed, 0)))
+            interval = min(interval * 2, self.hosts_poll_max_secs)
+
+        self.hosts_convergence.append(converged)
+        self.log("info", "/etc/hosts convergence times: {0}".format(
+            converged))
+        return converged, dict((node, failures[node]) for node in pending)
+
+    @counted_helper
+    def assert_hosts_on_nodes(self, nodes, expectations, timeout=None):
+        """
+        Description:
+            Asserts that /etc/hosts of every node meets all expectations,
+            giving the nodes up to timeout seconds to converge.
+
+        Args:
+            nodes (list): Nodes to check.
+            expectations (list): Expectations built by
+                                 hosts_verifier.expectation.
+
+        Kwargs:
+            timeout (int): Maximum time to wait, in seconds. Default is
+                           hosts_converge_timeout_secs.
+        """
+        self.wait_for_hosts_state(expectations, nodes, timeout)
+
+    @counted_helper
+    def get_hosts_digest(self, node, ignore_names=(), ordered=False):
+        """
+        Description:
+            Returns a digest of the LITP managed entries of /etc/hosts of
+            a node, computed on the node. Manually added entries are not
+            part of the digest.
+
+        Args:
+            node (str): Node to check.
+
+        Kwargs:
+            ignore_names (list): Entries listing any of these names are
+                                 left out, e.g. node-level aliases.
+            ordered (bool): If True, the order of the entries is part of
+                            the digest.
+
+        Returns:
+            dict. "digest" and "count" of the managed entries.
+        """
+        return self._run_hosts_verifier(
+            node, "digest", {"ignore_names": list(ignore_names),
+                             "ordered": ordered})
+
+    @counted_helper
+    def check_hosts_consistency(self, nodes, ignore_names=(), ordered=False):
+        """
+        Description:
+            Compares the LITP managed entries of /etc/hosts across nodes.
+            Only digests are fetched from every node; the entries
+            themselves are only fetched from the nodes that differ from
+            the majority, and from one node of the majority to compare
+            them against.
+
+        Args:
+            nodes (list): Nodes whose managed entries should be identical.
+
+        Kwargs:
+            ignore_names (list): Entries listing any of these names are
+                                 left out, e.g. node-level aliases.
+            ordered (bool): If True, entries must also be in the same
+                            order.
+
+        Returns:
+            dict. Keyed by differing node, a dict with the "missing" and
+            "extra" entries compared to the majority. Empty if all nodes
+            are consistent.
+        """
+        nodes = list(nodes)
+        digests = self.run_on_nodes(nodes, self.get_hosts_digest,
+                                    ignore_names, ordered)
+        by_digest = {}
+        for node, digest in zip(nodes, digests):
+            by_digest.setdefault(digest["digest"], []).append(node)
+        if len(by_digest) < 2:
+            return {}
+
+        majority = max(by_digest.values(), key=len)
+        outliers = [node for node in nodes if node not in majority]
+        self.log("info", "/etc/hosts of {0} differs from {1} other "
+                         "node(s)".format(outliers, len(majority)))
+        options = {"ignore_names": list(ignore_names), "ordered": ordered}
+        fetched = self.run_on_nodes(
+            [majority[0]] + outliers,
+            lambda node: self._run_hosts_verifier(node, "lines", options))
+        reference = fetched[0]
+        differences = {}
+        for node, lines in zip(outliers, fetched[1:]):
+            differences[node] = {
+                "missing": [line for line in reference if line not in lines],
+                "extra": [line for line in lines if line not in reference]}
+            if ordered and not any(differences[node].values()):
+                differences[node]["extra"] = ["entries in another order"]
+        return differences
+
+    @counted_helper
+    def assert_hosts_consistent(self, nodes, ignore_names=(), ordered=False):
+        """
+        Description:
+            Asserts that the LITP managed entries of /etc/hosts are the
+            same on all nodes, see check_hosts_consistency.
+        """
+        differences = self.check_hosts_consistency(nodes, ignore_names,
+                                                   ordered)
+        self.assertEqual({}, differences, "/etc/hosts is not consistent "
+                                          "across nodes: {0}".format(
+                                              differences))
+
+    def run_on_nodes(self, nodes, func, *args, **kwargs):
+        """
+        Description:
+            Runs func(node, *args, **kwargs) on all nodes concurrently.
+
+        Args:
+            nodes (list): Nodes to run func against.
+            func (callable): Function taking the node as first argument.
+
+        Kwargs:
+            max_workers (int): Maximum number of concurrent calls.
+            Any other arguments are passed to func.
+
+        Returns:
+            list. Result of func for each node, in the order of nodes.
+        """
+        helper = self.round_trips.get_helper()
+
+        def run(node, *func_args, **func_kwargs):
+            """ Counts the operations of func for the calling helper. """
+            with self.round_trips.helper(helper):
+                return func(node, *func_args, **func_kwargs)
+        return run_in_parallel(run, nodes, *args, **kwargs)
+
+    @counted_helper
+    def get_hosts_snapshots(self, nodes):
+        """
+        Description:
+            Fetches and parses the /etc/hosts file of each node
+            concurrently.
+
+        Args:
+            nodes (list): Nodes to fetch the file from.
+
+        Returns:
+            list. HostsFile per node, in the order of nodes.
+        """
+        return self.run_on_nodes(nodes, self.get_hosts_snapshot)
+
+    @counted_helper
+    def get_file_checksums(self, nodes, filepath):
+        """
+        Description:
+            Returns the SHA-256 checksum of a file on all nodes,
+            computed concurrently on the nodes.
+
+        Args:
+            nodes (list): Nodes to check.
+            filepath (str): Path of the file.
+
+        Returns:
+            list. Checksum per node, in the order of nodes.
+        """
+        cmd = "{0} {1}".format(SHA256SUM_PATH, filepath)
+        results = self.run_on_nodes(nodes, self.run_command, cmd,
+                                    default_asserts=True)
+        return [stdout[0].split()[0] for stdout, _, _ in results]
+
+    @counted_helper
+    def snapshot_file_on_nodes(self, nodes, filepath):
+        """
+        Description:
+            Saves a file of several nodes, to be restored in tearDown on
+            the nodes where it has changed by then. Only checksums are
+            fetched from every node; the content is fetched once per
+            distinct checksum.
+
+        Args:
+            nodes (list): Nodes to save the file of.
+            filepath (str): Path of the file.
+        """
+        nodes = list(nodes)
+        checksums = dict(zip(nodes, self.get_file_checksums(nodes,
+                                                            filepath)))
+        sources = {}
+        for node in nodes:
+            sources.setdefault(checksums[node], node)
+        results = self.run_on_nodes(sources.values(), self.run_command,
+                                    "{0} {1}".format(const.CAT_PATH,
+                                                     filepath),
+                                    default_asserts=True)
+        contents = dict((checksums[node], stdout) for node, (stdout, _, _)
+                        in zip(sources.values(), results))
+        self._file_snapshots.append((filepath, checksums, contents))
+
+    @counted_helper
+    def restore_file_snapshots(self):
+        """
+        Description:
+            Restores the files saved by snapshot_file_on_nodes on the
+            nodes where their checksum has changed, concurrently.
+        """
+        while self._file_snapshots:
+            self._restore_file_snapshot(*self._file_snapshots.pop())
+
+    def _restore_file_snapshot(self, filepath, checksums, contents):
+        """
+        Restores one file saved by snapshot_file_on_nodes.
+        """
+        nodes = sorted(checksums)
+        changed = [node for node, checksum in
+                   zip(nodes, self.get_file_checksums(nodes, filepath))
+                   if checksum != checksums[node]]
+        if not changed:
+            return
+        self.log("info", "Restoring {0} on {1}".format(filepath, changed))
+        self.run_on_nodes(changed, lambda node: self.create_file_on_node(
+            node, filepath, contents[checksums[node]], su_root=True,
+            add_to_cleanup=False))
+
+    @counted_helper
+    def get_alias_config_path(self, config_path, config_type,
+                              default_path):
+        """
+        Description:
+            Returns the path of the alias cluster/node config to add
+            aliases to: the existing one, whatever its item id, or
+            default_path if there is none yet. In an alias namespace
+            the test only uses its own alias config.
+
+        Args:
+            config_path (str): Path of the collection-of-cluster-config or
+                               collection-of-node-config.
+            config_type (str): alias-cluster-config or alias-node-config.
+            default_path (str): Path of the alias config to create.
+
+        Returns:
+            str. Path to the alias cluster/node config.
+        """
+        if self.alias_ns.index:
+            return default_path
+        alias_config = self.find(self.get_management_node_filename(),
+                                 config_path, config_type,
+                                 assert_not_empty=False)
+        return alias_config[0] if alias_config else default_path
+
+    @counted_helper
+    def create_aliases(self, config_path, aliases,
+                       config_type=alias_utils.ALIAS_CLUSTER_CONFIG,
+                       config_id=alias_utils.DEFAULT_ALIAS_CONFIG_ID):
+        """
+        Description:
+            Creates any number of aliases, together with their alias
+            config item if it does not exist yet, using one XML file and
+            a single litp load --merge. The aliases are streamed into the
+            XML as they are iterated. The XML file is deleted by the test
+            cleanup.
+
+        Args:
+            config_path (str): Path of the collection-of-cluster-config or
+                               collection-of-node-config to load into.
+            aliases (iterable): Aliases in the hosts_test_data format, i.e.
+                                with "NAME" and "PROPS" keys, or
+                                AliasSpecs, e.g. an AliasRange.
+
+        Kwargs:
+            config_type (str): alias-cluster-config or alias-node-config.
+                               Default is alias-cluster-config.
+            config_id (str): Item id of the alias config.
+                             Default is "alias_config".
+
+        Returns:
+            list. Paths of the aliases, in the order given.
+        """
+        ms_node = self.get_management_node_filename()
+        names = []
+        xml_file = "/tmp/{0}_aliases_{1}.xml".format(
+            config_id, next(self._alias_xml_ids))
+        xml_lines = alias_utils.render_alias_config_xml(aliases, config_type,
+                                                        config_id, names)
+        self.assertTrue(self.create_file_on_node(ms_node, xml_file,
+                                                 xml_lines,
+                                                 add_to_cleanup=True),
+                        "Failed to create alias XML file on the MS")
+
+        self.execute_cli_load_cmd(ms_node, config_path, xml_file,
+                                  args="--merge")
+
+        return ["{0}/{1}/aliases/{2}".format(config_path, config_id, name)
+                for name in names]
+
+    @counted_helper
+    def wait_for_plan(self, node, expected_plan_state, plan_timeout_mins=10,
+                      fail_fast=True):
+        """
+        Description:
+            Waits for the running plan by watching its task and plan state
+            transitions on the MS, returning as soon as the plan reaches a
+            terminal state. A plan that has a failed task with fail_fast,
+            or that times out, is stopped and waited for before the test
+            fails, so that it does not run on into the next step. The
+            duration of each phase is logged and appended to
+            self.plan_phase_durations.
+
+        Args:
+            node (str): The MS.
+            expected_plan_state (int): Expected final plan state, e.g.
+                                       const.PLAN_COMPLETE.
+
+        Kwargs:
+            plan_timeout_mins (int): Maximum time to wait for the plan.
+                                     Default is 10.
+            fail_fast (bool): If True, fail on the first failed task
+                              instead of waiting for the plan to finish.
+                              Only applies when a successful plan is
+                              expected. Default is True.
+
+        Returns:
+            PlanWatchResult. The observed transitions.
+        """
+        expected_state = plan_utils.PLAN_STATES[expected_plan_state]
+        fail_fast = fail_fast and expected_state == "Successful"
+        result = plan_utils.PlanWatchResult()
+        start = time.time()
+        self._watch_plan(node, result, start, start + plan_timeout_mins * 60,
+                         fail_fast)
+        timed_out = not result.finished and not \
+            (fail_fast and result.failed_tasks)
+        if not result.finished:
+            self.log("info", "Stopping the plan")
+            self.execute_cli_stopplan_cmd(node)
+            self._watch_plan(node, result, start,
+                             time.time() + self.plan_stop_timeout_secs)
+            self.assertTrue(result.finished, "Plan still running {0}s after "
+                            "litp stop_plan".format(
+                                self.plan_stop_timeout_secs))
+
+        durations = result.get_phase_durations()
+        self.plan_phase_durations.append(durations)
+        self.log("info", "Plan finished in {0:.1f}s with state '{1}'. Phase "
+                         "durations: {2}".format(result.elapsed,
+                                                 result.plan_state,
+                                                 durations))
+
+        self.assertFalse(timed_out, "Plan did not finish within {0} "
+                         "minutes".format(plan_timeout_mins))
+        self.assertEqual([], result.failed_tasks if fail_fast else [],
+                         "Plan tasks failed: {0}".format(result.failed_tasks))
+        self.assertEqual(expected_state, result.plan_state,
+                         "Plan finished in state '{0}' instead of "
+                         "'{1}'".format(result.plan_state, expected_state))
+        if result.plan_state == "Successful":
+            self._release_deployment()
+        return result
+
+    def _watch_plan(self, node, result, start, deadline, fail_fast=False):
+        """
+        Description:
+            Adds the transitions of the running plan to result until it
+            reaches a terminal state, the deadline passes or, with
+            fail_fast, a task fails.
+
+        Args:
+            node (str): The MS.
+            result (PlanWatchResult): Transitions observed so far.
+            start (float): Time the plan was first watched.
+            deadline (float): Time to stop watching at.
+
+        Kwargs:
+            fail_fast (bool): If True, stop watching on a failed task.
+        """
+        while not result.finished and not \
+                (fail_fast and result.failed_tasks):
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+            cmd = plan_utils.get_watch_plan_cmd(
+                int(min(remaining, self.plan_watch_chunk_secs)) + 1,
+                fail_fast=fail_fast)
+            offset = time.time() - start
+            stdout, _, _ = self.run_command(node, cmd, default_asserts=True)
+            result.add_output(stdout, offset)
+
+    @counted_helper
+    def run_and_wait_plan(self, node, expected_plan_state,
+                          plan_timeout_mins=10):
+        """
+        Description:
+            Creates and runs a plan, then waits for it with wait_for_plan.
+            Use instead of run_and_check_plan to avoid the dead time of
+            fixed interval polling.
+
+        Args:
+            node (str): The MS.
+            expected_plan_state (int): Expected final plan state, e.g.
+                                       const.PLAN_COMPLETE.
+
+        Kwargs:
+            plan_timeout_mins (int): Maximum time to wait for the plan.
+                                     Default is 10.
+
+        Returns:
+            PlanWatchResult. The observed transitions.
+        """
+        self._hold_deployment()
+        self.execute_cli_createplan_cmd(node)
+        self.execute_cli_runplan_cmd(node)
+        try:
+            return self.wait_for_plan(node, expected_plan_state,
+                                      plan_timeout_mins)
+        finally:
+            self._plan_applied()
+
+    @counted_helper
+    def start_log_scan(self, node, log_path, patterns, excludes=()):
+        """
+        Description:
+            Creates a LogScanner that only reports lines logged from now
+            on.
+
+        Args:
+            node (str): Node the log is on.
+            log_path (str): Log file to scan.
+            patterns (list): Substrings of the lines to report.
+
+        Kwargs:
+            excludes (list): Substrings of the lines to ignore.
+
+        Returns:
+            LogScanner. The scanner, positioned at the end of the log.
+        """
+        scanner = LogScanner(log_path, patterns, excludes)
+        stdout, _, _ = self.run_command(node, scanner.get_size_cmd(),
+                                        su_root=True, default_asserts=True)
+        scanner.offset = int(stdout[0])
+        return scanner
+
+    @counted_helper
+    def scan_log(self, node, scanner):
+        """
+        Description:
+            Reads the log once from where the scanner last stopped and
+            matches all of its patterns in that pass.
+
+        Args:
+            node (str): Node the log is on.
+            scanner (LogScanner): Scanner returned by start_log_scan.
+
+        Returns:
+            list. LogHit per new matching line.
+        """
+        stdout, _, _ = self.run_command(node, scanner.get_scan_cmd(),
+                                        su_root=True, default_asserts=True)
+        return scanner.parse_scan_output(stdout)
+
+    @counted_helper
+    def rewrite_xml_on_node(self, node, in_path, out_path, rules):
+        """
+        Description:
+            Rewrites properties of an exported XML file on the node
+            itself. The file is streamed through xml_stream on the node,
+            so neither the document nor a tree of it is held by the test.
+
+        Args:
+            node (str): Node the file is on.
+            in_path (str): Exported XML file.
+            out_path (str): File to write the rewritten XML to.
+            rules (dict): New property text keyed by path, e.g.
+                          {"my_alias/address": "%%SITE_SPECIFIC%%"}. See
+                          xml_stream.parse_rules.
+
+        Returns:
+            dict. Number of replacements keyed by the matched path.
+        """
+        cmd = get_helper_cmd(xml_stream.HELPER_NAME,
+                             inspect.getsource(xml_stream),
+                             [in_path, out_path, json.dumps(rules)])
+        stdout, _, _ = self.run_command(node, cmd, default_asserts=True)
+        replaced = {}
+        for line in stdout:
+            _, count, path = line.split(" ", 2)
+            replaced[path] = int(count)
+        return replaced
+
+    def write_bench_results(self, file_name, columns, rows):
+        """
+        Description:
+            Logs benchmark results as a table and appends them to a CSV
+            file in the profile directory, so that runs against different
+            LITP releases can be compared.
+
+        Args:
+            file_name (str): Name of the CSV file.
+            columns (tuple): Column names, written when the file is new.
+            rows (list): Result rows, with a value per column.
+
+        Returns:
+            str. Path of the CSV file.
+        """
+        widths = [max(len(str(value)) for value in column)
+                  for column in zip(columns, *rows)]
+        for row in [columns] + list(rows):
+            self.log("info", "  ".join(str(value).ljust(width)
+                                       for value, width in zip(row, widths)))
+
+        if not os.path.isdir(self.profile_dir):
+            os.makedirs(self.profile_dir)
+        path = os.path.join(self.profile_dir, file_name)
+        new_file = not os.path.exists(path)
+        with open(path, "a") as results_file:
+            writer = csv.writer(results_file)
+            if new_file:
+                writer.writerow(columns)
+            writer.writerows(rows)
+        self.log("info", "Results appended to {0}".format(path))
+        return path
@@ -0,0 +1,590 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Batching of independent alias scenarios, so that the model
+            changes of all of them are applied by one shared plan per
+            phase and verified from one /etc/hosts snapshot per node, and
+            a scenario engine bringing alias configs to a declared state
+            with the minimal model changes, run as a batched scenario.
+"""
+import alias_utils
+import test_constants as const
+import hosts_verifier
+from hosts_verifier import canonical_address
+
+
+class HostsExpectation(object):
+    """
+    Expected state of one address in /etc/hosts, on some nodes.
+    """
+    __slots__ = ("address", "count", "names", "nodes", "absent")
+
+    def __init__(self, address, count, names=(), nodes=None, absent=()):
+        """
+        Args:
+            address (str): Address to check.
+            count (int): Number of lines expected for the address.
+
+        Kwargs:
+            names (list): Names that must only resolve to the address.
+            nodes (list): Nodes to check, None for the batch default.
+            absent (list): Names that must not be listed at all.
+        """
+        self.address = address
+        self.count = count
+        self.names = tuple(names)
+        self.nodes = nodes
+        self.absent = tuple(absent)
+
+    def to_dict(self):
+        """
+        Returns:
+            dict. The check as a hosts_verifier expectation.
+        """
+        return hosts_verifier.expectation(address=self.address,
+                                          count=self.count,
+                                          names=self.names,
+                                          absent=self.absent)
+
+
+class ScenarioPhase(object):
+    """
+    The model changes, commands and expectations of one phase of a
+    scenario.
+    """
+
+    def __init__(self):
+        # (config_path, config_type, config_id, aliases)
+        self.creates = []
+        self.removes = []
+        # (nodes, command), run as root before the model changes
+        self.commands = []
+        self.expectations = []
+
+
+class Scenario(object):
+    """
+    An alias scenario, split into phases that each end with a plan and
+    a check of /etc/hosts. Methods add to the current phase.
+    """
+
+    def __init__(self, name):
+        """
+        Args:
+            name (str): Name used when reporting the scenario.
+        """
+        self.name = name
+        self.phases = [ScenarioPhase()]
+
+    @property
+    def current(self):
+        """
+        ScenarioPhase. The phase being defined.
+        """
+        return self.phases[-1]
+
+    def next_phase(self):
+        """
+        Description:
+            Starts a new phase, applied by the next shared plan.
+
+        Returns:
+            Scenario. This scenario.
+        """
+        self.phases.append(ScenarioPhase())
+        return self
+
+    def create_aliases(self, config_path, aliases,
+                       config_type=alias_utils.ALIAS_CLUSTER_CONFIG,
+                       config_id=alias_utils.DEFAULT_ALIAS_CONFIG_ID):
+        """
+        Description:
+            Creates aliases, as HostsGenericTest.create_aliases.
+
+        Returns:
+            list. Paths of the aliases, in the order given.
+        """
+        aliases = [alias_utils.as_spec(alias) for alias in aliases]
+        self.current.creates.append((config_path, config_type, config_id,
+                                     aliases))
+        return ["{0}/{1}/aliases/{2}".format(config_path, config_id,
+                                             alias.name)
+                for alias in aliases]
+
+    def remove(self, path):
+        """
+        Description:
+            Removes an item from the model.
+
+        Returns:
+            Scenario. This scenario.
+        """
+        self.current.removes.append(path)
+        return self
+
+    def run_command(self, nodes, cmd):
+        """
+        Description:
+            Runs a command as root on nodes, before the model changes of
+            the phase.
+
+        Returns:
+            Scenario. This scenario.
+        """
+        self.current.commands.append((list(nodes), cmd))
+        return self
+
+    def expect(self, address, count, names=(), nodes=None):
+        """
+        Description:
+            Adds a HostsExpectation checked after the plan of the phase.
+
+        Returns:
+            Scenario. This scenario.
+        """
+        self.current.expectations.append(
+            HostsExpectation(address, count, names, nodes))
+        return self
+
+    def get_addresses(self):
+        """
+        Returns:
+            set. Canonical addresses the scenario checks.
+        """
+        return set(canonical_address(expectation.address)
+                   for phase in self.phases
+                   for expectation in phase.expectations)
+
+
+class ScenarioBatch(object):
+    """
+    Independent scenarios run together: phase N of every scenario is
+    applied by one plan and checked from one snapshot per node.
+    """
+
+    def __init__(self, test, nodes, plan_timeout_mins=10):
+        """
+        Args:
+            test (HostsGenericTest): Test running the batch.
+            nodes (list): Nodes checked by expectations without nodes.
+
+        Kwargs:
+            plan_timeout_mins (int): Maximum time to wait for each plan.
+        """
+        self.test = test
+        self.nodes = list(nodes)
+        self.plan_timeout_mins = plan_timeout_mins
+        self.scenarios = []
+        # Failures per scenario name
+        self.results = {}
+
+    def add(self, scenario):
+        """
+        Description:
+            Adds a scenario. Scenarios must be independent: two scenarios
+            checking the same address could not be told apart.
+
+        Args:
+            scenario (Scenario): The scenario.
+
+        Raises:
+            ValueError. If the scenario shares an address or a name with
+            a scenario already in the batch.
+        """
+        for other in self.scenarios:
+            shared = scenario.get_addresses() & other.get_addresses()
+            if shared or scenario.name == other.name:
+                raise ValueError("Scenario '{0}' is not independent of "
+                                 "'{1}': {2}".format(scenario.name,
+                                                     other.name,
+                                                     sorted(shared)))
+        self.scenarios.append(scenario)
+        self.results[scenario.name] = []
+
+    def _apply_phase(self, phases):
+        """
+        Runs the commands and model changes of the given phases, loading
+        all aliases of one alias config with a single litp load.
+
+        Returns:
+            bool. True if the model was changed.
+        """
+        ms_node = self.test.get_management_node_filename()
+        for phase in phases:
+            for nodes, cmd in phase.commands:
+                results = self.test.run_on_nodes(nodes, self.test.run_command,
+                                                 cmd, su_root=True)
+                for node, (_, stderr, rc) in zip(nodes, results):
+                    self.test.assertEqual(0, rc, "'{0}' failed on {1}: "
+                                          "{2}".format(cmd, node, stderr))
+
+        configs = []
+        aliases = {}
+        for phase in phases:
+            for config_path, config_type, config_id, config_aliases in \
+                    phase.creates:
+                key = (config_path, config_type, config_id)
+                if key not in aliases:
+                    configs.append(key)
+                    aliases[key] = []
+                aliases[key].extend(config_aliases)
+        for key in configs:
+            config_path, config_type, config_id = key
+            self.test.create_aliases(config_path, aliases[key],
+                                     config_type=config_type,
+                                     config_id=config_id)
+
+        removes = [path for phase in phases for path in phase.removes]
+        for path in removes:
+            self.test.execute_cli_remove_cmd(ms_node, path)
+        return bool(configs or removes)
+
+    def _verify_phase(self, number, phases):
+        """
+        Checks the expectations of the given (scenario, phase) pairs with
+        one hosts_verifier run per node, giving the nodes time to
+        converge.
+        """
+        checks = {}
+        expectations = {}
+        for scenario, phase in phases:
+            for expectation in phase.expectations:
+                for node in expectation.nodes or self.nodes:
+                    checks.setdefault(node, []).append(scenario)
+                    expectations.setdefault(node, []).append(
+                        expectation.to_dict())
+        _, failures = self.test.poll_hosts_state(expectations)
+
+        errors = dict((scenario, []) for scenario, _ in phases)
+        for node, node_failures in failures.items():
+            for failure in node_failures:
+                errors[checks[node][failure["index"]]].append(
+                    "{0}: {1} {2}".format(node, failure["reason"],
+                                          failure["lines"]))
+        for scenario, _ in phases:
+            self.results[scenario.name].extend(
+                "phase {0}: {1}".format(number, error)
+                for error in errors[scenario])
+            self.test.log("info", "Scenario '{0}' phase {1}: {2}".format(
+                scenario.name, number, "FAIL {0}".format(errors[scenario])
+                if errors[scenario] else "PASS"))
+
+    def run(self):
+        """
+        Description:
+            Runs every phase of every scenario, with one shared plan per
+            phase, then fails the test if any scenario failed.
+
+        Returns:
+            dict. Failures per scenario name, empty lists for scenarios
+            that passed.
+        """
+        ms_node = self.test.get_management_node_filename()
+        phase_count = max(len(scenario.phases) for scenario in self.scenarios)
+        for number in range(1, phase_count + 1):
+            phases = [(scenario, scenario.phases[number - 1])
+                      for scenario in self.scenarios
+                      if len(scenario.phases) >= number]
+            if self._apply_phase([phase for _, phase in phases]):
+                self.test.run_and_wait_plan(
+                    ms_node, const.PLAN_COMPLETE,
+                    plan_timeout_mins=self.plan_timeout_mins)
+            self._verify_phase(number, phases)
+
+        failed = dict((name, errors) for name, errors
+                      in self.results.items() if errors)
+        self.test.assertEqual({}, failed, "Failed scenarios: {0}".format(
+            sorted(failed)))
+        return self.results
+
+
+class AliasState(object):
+    """
+    Desired alias items of the alias configs a test manages, per level,
+    and the /etc/hosts checks expected once they are applied. Alias
+    configs that are not declared are left as they are.
+    """
+
+    def __init__(self):
+        # (config_path, config_type, config_id) -> (aliases, nodes)
+        self.configs = {}
+        self.config_order = []
+        self.expectations = []
+
+    def _declare(self, config_path, config_type, config_id, aliases,
+                 nodes):
+        """
+        Declares the aliases of one alias config.
+
+        Returns:
+            AliasState. This state.
+        """
+        key = (config_path, config_type, config_id)
+        if key not in self.configs:
+            self.config_order.append(key)
+        self.configs[key] = ([alias_utils.as_spec(alias)
+                              for alias in aliases], list(nodes))
+        return self
+
+    def cluster(self, config_path, aliases, nodes,
+                config_id=alias_utils.DEFAULT_ALIAS_CONFIG_ID):
+        """
+        Description:
+            Declares the cluster-level aliases of an alias config. An
+            empty list of aliases removes the alias config.
+
+        Args:
+            config_path (str): Path of the collection-of-cluster-config.
+            aliases (list): Aliases in the hosts_test_data format, or
+                            AliasSpecs.
+            nodes (list): Nodes of the cluster.
+
+        Kwargs:
+            config_id (str): Item id of the alias config.
+
+        Returns:
+            AliasState. This state.
+        """
+        return self._declare(config_path, alias_utils.ALIAS_CLUSTER_CONFIG,
+                             config_id, aliases, nodes)
+
+    def node(self, config_path, aliases, node,
+             config_id=alias_utils.DEFAULT_ALIAS_CONFIG_ID):
+        """
+        Description:
+            Declares the aliases of a node-level alias config, as
+            cluster().
+
+        Args:
+            config_path (str): Path of the collection-of-node-config of
+                               the node.
+            aliases (list): Aliases in the hosts_test_data format, or
+                            AliasSpecs.
+            node (str): The node.
+
+        Returns:
+            AliasState. This state.
+        """
+        return self._declare(config_path, alias_utils.ALIAS_NODE_CONFIG,
+                             config_id, aliases, [node])
+
+    def ms(self, config_path, aliases, ms_node,
+           config_id=alias_utils.DEFAULT_ALIAS_CONFIG_ID):
+        """
+        Description:
+            Declares the aliases of an alias config of the MS, as
+            cluster().
+
+        Args:
+            config_path (str): Path of the collection-of-node-config of
+                               the MS.
+            aliases (list): Aliases in the hosts_test_data format, or
+                            AliasSpecs.
+            ms_node (str): The MS.
+
+        Returns:
+            AliasState. This state.
+        """
+        return self._declare(config_path, alias_utils.ALIAS_NODE_CONFIG,
+                             config_id, aliases, [ms_node])
+
+    def expect(self, address, count, names=(), nodes=None):
+        """
+        Description:
+            Adds a HostsExpectation. It replaces the check derived from
+            the aliases for the address on its nodes, e.g. to count a
+            manually added line.
+
+        Returns:
+            AliasState. This state.
+        """
+        self.expectations.append(
+            HostsExpectation(address, count, names, nodes))
+        return self
+
+
+class AliasDiff(object):
+    """
+    Model changes bringing the alias configs to an AliasState.
+    """
+
+    def __init__(self):
+        # (config_path, config_type, config_id, aliases) loaded with one
+        # litp load per alias config, creating or updating the aliases
+        self.loads = []
+        self.removes = []
+        # (alias props, nodes) of the aliases removed
+        self.removed = []
+
+    def __bool__(self):
+        return bool(self.loads or self.removes)
+
+    __nonzero__ = __bool__
+
+
+class ScenarioEngine(object):
+    """
+    Brings the alias configs of the deployment to declared AliasStates:
+    the minimal model changes are run as a one phase Scenario of a
+    ScenarioBatch, i.e. applied with batched CLI calls and one plan, and
+    checked with one snapshot per node.
+    """
+
+    def __init__(self, test, nodes, plan_timeout_mins=10):
+        """
+        Args:
+            test (HostsGenericTest): Test running the scenario.
+            nodes (list): Nodes checked by expectations without nodes.
+
+        Kwargs:
+            plan_timeout_mins (int): Maximum time to wait for each plan.
+        """
+        self.test = test
+        self.nodes = list(nodes)
+        self.plan_timeout_mins = plan_timeout_mins
+        self._converge_count = 0
+
+    def diff(self, state):
+        """
+        Description:
+            Compares an AliasState with the model, read in one call.
+
+        Args:
+            state (AliasState): The desired state.
+
+        Returns:
+            AliasDiff. The model changes to make.
+        """
+        ms_node = self.test.get_management_node_filename()
+        tree = self.test.get_model_subtrees(
+            ms_node, sorted(set(key[0] for key in state.config_order)))
+
+        diff = AliasDiff()
+        for key in state.config_order:
+            config_path, config_type, config_id = key
+            aliases, nodes = state.configs[key]
+            config = "{0}/{1}".format(config_path, config_id)
+            current = dict(
+                (path.rsplit("/", 1)[1], tree.items[path].props)
+                for path in tree.paths
+                if path.startswith(config + "/aliases/") and
+                tree.items[path].item_type == "alias" and
+                tree.items[path].state != "ForRemoval")
+            wanted = dict((alias.name, alias) for alias in aliases)
+
+            loads = [alias for alias in aliases
+                     if current.get(alias.name) != alias.props]
+            if loads:
+                diff.loads.append((config_path, config_type, config_id,
+                                   loads))
+            if not aliases:
+                item = tree.items.get(config)
+                if item is not None and item.state != "ForRemoval":
+                    diff.removes.append(config)
+            else:
+                diff.removes.extend(
+                    "{0}/aliases/{1}".format(config, name)
+                    for name in sorted(current) if name not in wanted)
+            diff.removed.extend((props, nodes) for name, props
+                                in sorted(current.items())
+                                if name not in wanted)
+        return diff
+
+    def get_expectations(self, state, diff):
+        """
+        Description:
+            Returns the checks of /etc/hosts once a state is applied: the
+            expectations of the state, and for every other address of the
+            declared aliases one line per alias on their nodes, or none
+            for the aliases removed.
+
+        Args:
+            state (AliasState): The desired state.
+            diff (AliasDiff): Changes that applied it.
+
+        Returns:
+            list. HostsExpectations.
+        """
+        explicit = set()
+        for expected in state.expectations:
+            for node in expected.nodes or self.nodes:
+                explicit.add((node, canonical_address(expected.address)))
+
+        derived = {}
+        for key in state.config_order:
+            aliases, nodes = state.configs[key]
+            for alias in aliases:
+                for node in nodes:
+                    entry = derived.setdefault(
+                        (node, canonical_address(alias.address)),
+                        [0, [], []])
+                    entry[0] += 1
+                    entry[1].extend(alias.alias_names.split(","))
+        for props, nodes in diff.removed:
+            for node in nodes:
+                entry = derived.setdefault(
+                    (node, canonical_address(props["address"])),
+                    [0, [], []])
+                entry[2].extend(props["alias_names"].split(","))
+
+        expectations = list(state.expectations)
+        for (node, address), (count, names, absent) in \
+                sorted(derived.items()):
+            if (node, address) in explicit:
+                continue
+            expectations.append(HostsExpectation(
+                address, count, names, [node],
+                [name for name in absent if name not in names]))
+        return expectations
+
+    def get_scenario(self, state, diff):
+        """
+        Description:
+            Returns the scenario applying a diff and checking the state.
+
+        Args:
+            state (AliasState): The desired state.
+            diff (AliasDiff): The model changes.
+
+        Returns:
+            Scenario. A scenario of one phase.
+        """
+        self._converge_count += 1
+        scenario = Scenario("converge_{0}".format(self._converge_count))
+        for config_path, config_type, config_id, aliases in diff.loads:
+            scenario.create_aliases(config_path, aliases,
+                                    config_type=config_type,
+                                    config_id=config_id)
+        for path in diff.removes:
+            scenario.remove(path)
+        for expected in self.get_expectations(state, diff):
+            scenario.current.expectations.append(expected)
+        return scenario
+
+    def converge(self, state):
+        """
+        Description:
+            Brings the alias configs to a state: applies the diff, runs a
+            plan if the model changed and waits for /etc/hosts of all
+            nodes to match, failing the test if any check still fails.
+
+        Args:
+            state (AliasState): The desired state.
+
+        Returns:
+            AliasDiff. The model changes that were made.
+        """
+        diff = self.diff(state)
+        self.test.log("info", "Alias changes: {0} loads, {1} removes".format(
+            len(diff.loads), len(diff.removes)))
+        batch = ScenarioBatch(self.test, self.nodes, self.plan_timeout_mins)
+        batch.add(self.get_scenario(state, diff))
+        batch.run()
+        return diff
@@ -0,0 +1,951 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Offline stand-in for a LITP deployment so that the hosts test
+            sets can be run and debugged without hardware. Enable it by
+            setting LITP_HOSTS_SIM=1 (LITP_HOSTS_SIM_NODES sets the number
+            of peer nodes, default 2).
+"""
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import shlex
+import xml.etree.ElementTree as ET
+from hosts_utils import parse_helper_cmd
+from model_utils import ModelTree
+import xml_stream
+import hosts_verifier
+import log_scanner
+import lookup_bench
+import plan_utils
+
+SIM_ENV_VAR = "LITP_HOSTS_SIM"
+SIM_NODES_ENV_VAR = "LITP_HOSTS_SIM_NODES"
+
+LITP_NS = "http://www.ericsson.com/litp"
+ETC_HOSTS = "/etc/hosts"
+LOG_FILE = "/var/log/messages"
+DO_NOTHING_PLAN_ERROR = "DoNothingPlanError    " \
+                        "Create plan failed: no tasks were generated"
+# Files only root can write to
+ROOT_ONLY_DIRS = ("/etc/", "/var/")
+
+LOG = logging.getLogger("hosts_sim")
+ET.register_namespace("litp", LITP_NS)
+
+
+def sim_enabled():
+    """
+    Description:
+        Checks whether the simulated backend has been requested.
+
+    Returns:
+        bool. True if LITP_HOSTS_SIM is set to a true value.
+    """
+    return os.environ.get(SIM_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+class SimNode(object):
+    """
+    A simulated MS or peer node.
+    """
+
+    def __init__(self, filename, ip_address):
+        """
+        Args:
+            filename (str): Node filename, also used as its hostname.
+            ip_address (str): IPv4 address of the node.
+        """
+        self.filename = filename
+        self.hostname = filename
+        self.ip_address = ip_address
+        self.powered_on = True
+        self.files = {ETC_HOSTS: ["127.0.0.1\tlocalhost"], LOG_FILE: []}
+        self.managed_lines = []
+
+
+class SimItem(object):
+    """
+    An item of the simulated LITP model.
+    """
+    __slots__ = ("item_type", "props", "state", "applied_props")
+
+    def __init__(self, item_type, props=None, state="Initial"):
+        """
+        Args:
+            item_type (str): LITP item type.
+
+        Kwargs:
+            props (dict): Item properties.
+            state (str): Item state. Default is Initial.
+        """
+        self.item_type = item_type
+        self.props = dict(props or {})
+        self.state = state
+        self.applied_props = dict(self.props) if state == "Applied" else {}
+
+
+class SimCmdUtils(object):
+    """
+    Minimal replacement for the framework command builders used by the
+    hosts test sets.
+    """
+
+    @staticmethod
+    def get_systemctl_stop_cmd(service):
+        """ Returns the command to stop a service. """
+        return "/bin/systemctl stop {0}".format(service)
+
+    @staticmethod
+    def get_systemctl_start_cmd(service):
+        """ Returns the command to start a service. """
+        return "/bin/systemctl start {0}".format(service)
+
+    @staticmethod
+    def get_ping_cmd(host):
+        """ Returns the command to ping a host once. """
+        return "/bin/ping -c 1 {0}".format(host)
+
+
+class SimulatedCluster(object):
+    """
+    In-memory MS, peer nodes and LITP model answering the GenericTest
+    calls made by the hosts test sets.
+    """
+
+    def __init__(self, peer_count=None):
+        """
+        Kwargs:
+            peer_count (int): Number of peer nodes. Default is taken from
+                              LITP_HOSTS_SIM_NODES, or 2.
+        """
+        if peer_count is None:
+            peer_count = int(os.environ.get(SIM_NODES_ENV_VAR, 2))
+        self.ms = SimNode("ms1", "192.168.0.42")
+        self.peers = [SimNode("node{0}".format(index),
+                              "192.168.0.{0}".format(42 + index))
+                      for index in range(1, peer_count + 1)]
+        self.nodes = dict((node.filename, node)
+                          for node in [self.ms] + self.peers)
+        self.model = {}
+        self.backups = []
+        self.plan = None
+        # Item paths whose plan tasks fail, to simulate a failing plan
+        self.failing_paths = set()
+        self._build_model()
+        self._apply_hosts()
+
+    # ------------------------------------------------------------------
+    # Model helpers
+    # ------------------------------------------------------------------
+    def _build_model(self):
+        """
+        Creates the model of a single cluster deployment.
+        """
+        cluster = "/deployments/d1/clusters/c1"
+        items = [("/", "root"),
+                 ("/deployments", "collection-of-deployment"),
+                 ("/deployments/d1", "deployment"),
+                 ("/deployments/d1/clusters", "collection-of-cluster-base"),
+                 (cluster, "vcs-cluster"),
+                 (cluster + "/configs", "collection-of-cluster-config"),
+                 (cluster + "/services",
+                  "collection-of-clustered-service"),
+                 (cluster + "/services/sg1", "vcs-clustered-service"),
+                 (cluster + "/nodes", "collection-of-node"),
+                 ("/ms", "ms"),
+                 ("/ms/configs", "collection-of-node-config"),
+                 ("/ms/configs/alias_config", "alias-node-config"),
+                 ("/ms/configs/alias_config/aliases", "collection-of-alias")]
+        for path, item_type in items:
+            self.model[path] = SimItem(item_type, state="Applied")
+        self.model["/ms"].props["hostname"] = self.ms.hostname
+
+        for index, node in enumerate(self.peers):
+            node_path = "{0}/nodes/n{1}".format(cluster, index + 1)
+            self.model[node_path] = SimItem(
+                "node", {"hostname": node.hostname}, "Applied")
+            self.model[node_path + "/configs"] = SimItem(
+                "collection-of-node-config", state="Applied")
+
+    def _children(self, path):
+        """
+        Returns the paths of the direct children of an item.
+        """
+        prefix = path.rstrip("/") + "/"
+        return sorted(item_path for item_path in self.model
+                      if item_path.startswith(prefix) and
+                      "/" not in item_path[len(prefix):])
+
+    def _subtree(self, path):
+        """
+        Returns the paths of an item and all its descendants.
+        """
+        prefix = path.rstrip("/") + "/"
+        return sorted(item_path for item_path in self.model
+                      if item_path == path or item_path.startswith(prefix)
+                      or path == "/")
+
+    def _node_for_path(self, node_path):
+        """
+        Returns the SimNode modelled by a node item.
+        """
+        if node_path == "/ms":
+            return self.ms
+        hostname = self.model[node_path].props.get("hostname")
+        return self.nodes.get(hostname)
+
+    @staticmethod
+    def _parse_props(props):
+        """
+        Parses a CLI property string such as 'a="1" b=2'.
+        """
+        parsed = {}
+        for token in shlex.split(props or ""):
+            name, _, value = token.partition("=")
+            parsed[name] = value
+        return parsed
+
+    @staticmethod
+    def _result(stdout=None, stderr=None, rc=0):
+        """
+        Builds a (stdout, stderr, rc) tuple.
+        """
+        return list(stdout or []), list(stderr or []), rc
+
+    @staticmethod
+    def _check(result, expect_positive, description):
+        """
+        Asserts the outcome of a CLI command like GenericTest does.
+        """
+        _, stderr, rc = result
+        if expect_positive and (rc != 0 or stderr):
+            raise AssertionError("{0} failed: {1}".format(description,
+                                                          stderr))
+        if not expect_positive and rc == 0:
+            raise AssertionError("{0} unexpectedly succeeded".format(
+                description))
+        return result
+
+    # ------------------------------------------------------------------
+    # /etc/hosts rendering
+    # ------------------------------------------------------------------
+    def _live(self, path, pending=False):
+        """
+        Returns True if the item is rendered, either as currently applied
+        or, if pending, as it will be after the next plan.
+        """
+        item = self.model.get(path)
+        if item is None:
+            return False
+        if pending:
+            return item.state != "ForRemoval"
+        return item.state != "Initial"
+
+    def _alias_lines(self, configs_path, pending=False):
+        """
+        Renders the aliases of every alias config in a configs
+        collection, stripping any IPv6 prefix from the address.
+        """
+        lines = []
+        for config in self._children(configs_path):
+            if not self._live(config, pending) or \
+                    not self.model[config].item_type.startswith("alias-"):
+                continue
+            for alias in self._children(config + "/aliases"):
+                if not self._live(alias, pending):
+                    continue
+                item = self.model[alias]
+                props = item.props if pending else item.applied_props
+                address = props.get("address", "").split("/")[0]
+                names = props.get("alias_names", "").split(",")
+                lines.append("\t".join([address] + names))
+        return lines
+
+    def _render_hosts(self, node, pending=False):
+        """
+        Returns the LITP managed /etc/hosts lines of a node.
+        """
+        lines = ["{0}\t{1}".format(self.ms.ip_address, self.ms.hostname)]
+        node_paths = sorted(path for path in self.model
+                            if self.model[path].item_type == "node" and
+                            self._live(path, pending))
+        for node_path in node_paths:
+            peer = self._node_for_path(node_path)
+            if peer is not None:
+                lines.append("{0}\t{1}".format(peer.ip_address,
+                                               peer.hostname))
+
+        if node is self.ms:
+            return lines + self._alias_lines("/ms/configs", pending)
+
+        for node_path in node_paths:
+            if self._node_for_path(node_path) is node:
+                lines.extend(self._alias_lines(
+                    "/deployments/d1/clusters/c1/configs", pending))
+                lines.extend(self._alias_lines(node_path + "/configs",
+                                               pending))
+        return lines
+
+    def _apply_hosts(self, nodes=None):
+        """
+        Rewrites the managed lines of /etc/hosts on the given nodes,
+        keeping any line that was added by hand.
+
+        Returns:
+            list. Filenames of the nodes whose file changed.
+        """
+        changed = []
+        for node in nodes or self.nodes.values():
+            if not node.powered_on:
+                continue
+            rendered = self._render_hosts(node)
+            if rendered == node.managed_lines:
+                continue
+            manual = [line for line in node.files[ETC_HOSTS]
+                      if line not in node.managed_lines]
+            node.files[ETC_HOSTS] = manual + rendered
+            node.managed_lines = rendered
+            changed.append(node.filename)
+        return changed
+
+    def _pending_tasks(self):
+        """
+        Calculates the tasks a plan created now would contain.
+
+        Returns:
+            list. (item path, description) per task.
+        """
+        tasks = []
+        for path in sorted(self.model):
+            item = self.model[path]
+            if item.item_type.startswith("alias") or \
+                    item.item_type.startswith("collection-of-alias"):
+                continue
+            if item.state in ("Initial", "Updated", "ForRemoval"):
+                tasks.append((path, "{0} {1}".format(item.state,
+                                                     item.item_type)))
+
+        for node in self.nodes.values():
+            if node.powered_on and \
+                    self._render_hosts(node, True) != node.managed_lines:
+                tasks.append(("/ms" if node is self.ms else
+                              self._node_url(node.filename),
+                              "Update /etc/hosts on {0}".format(
+                                  node.hostname)))
+        return tasks
+
+    def _apply_model(self):
+        """
+        Moves every item to the state it has after a successful plan.
+        """
+        for path in list(self.model):
+            item = self.model[path]
+            if item.state == "ForRemoval":
+                del self.model[path]
+            else:
+                item.state = "Applied"
+                item.applied_props = dict(item.props)
+
+    # ------------------------------------------------------------------
+    # GenericTest node helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def log(level, message):
+        """ GenericTest.log """
+        getattr(LOG, level, LOG.info)(message)
+
+    def get_management_node_filename(self):
+        """ GenericTest.get_management_node_filename """
+        return self.ms.filename
+
+    def get_managed_node_filenames(self):
+        """ GenericTest.get_managed_node_filenames """
+        return [node.filename for node in self.peers]
+
+    def _node_url(self, filename):
+        """
+        Returns the model path of the node with the given filename.
+        """
+        for path, item in self.model.items():
+            if item.item_type == "node" and \
+                    item.props.get("hostname") == filename:
+                return path
+        return None
+
+    def get_node_url_from_filename(self, node, filename):
+        """ GenericTest.get_node_url_from_filename """
+        del node
+        return self._node_url(filename)
+
+    def backup_file(self, node, filepath, *args, **kwargs):
+        """ GenericTest.backup_file, restored by restore_backups """
+        del args, kwargs
+        sim_node = self.nodes[node]
+        self.backups.append((sim_node, filepath,
+                             list(sim_node.files.get(filepath, [])),
+                             list(sim_node.managed_lines)))
+        return True
+
+    def del_file_after_run(self, node, filepath):
+        """ GenericTest.del_file_after_run, deleted by restore_backups """
+        self.backups.append((self.nodes[node], filepath, None, None))
+
+    def restore_backups(self):
+        """
+        Restores every file saved by backup_file, like the cleanup done
+        by GenericTest.tearDown.
+        """
+        while self.backups:
+            sim_node, filepath, lines, managed = self.backups.pop()
+            if lines is None:
+                sim_node.files.pop(filepath, None)
+                continue
+            sim_node.files[filepath] = lines
+            if filepath == ETC_HOSTS:
+                sim_node.managed_lines = managed
+
+    def create_file_on_node(self, node, filepath, file_contents_ls,
+                            su_root=False, empty_file=False,
+                            add_to_cleanup=True, **kwargs):
+        """ GenericTest.create_file_on_node """
+        del su_root, empty_file, kwargs
+        if add_to_cleanup:
+            self.del_file_after_run(node, filepath)
+        self.nodes[node].files[filepath] = list(file_contents_ls)
+        return True
+
+    def get_file_len(self, node, filepath):
+        """ GenericTest.get_file_len """
+        return len(self.nodes[node].files.get(filepath, []))
+
+    def wait_for_log_msg(self, node, msg, log_file=LOG_FILE, log_len=0,
+                         return_log_msgs=False, **kwargs):
+        """ GenericTest.wait_for_log_msg """
+        del kwargs
+        found = [line for line in
+                 self.nodes[node].files.get(log_file, [])[log_len:]
+                 if msg in line]
+        if return_log_msgs:
+            return found
+        return found != []
+
+    def turn_on_litp_debug(self, node):
+        """ GenericTest.turn_on_litp_debug """
+        del node
+
+    def run_puppet_once(self, node, *args, **kwargs):
+        """ GenericTest.run_puppet_once """
+        del node, args, kwargs
+        self._apply_hosts()
+
+    def is_ip_pingable(self, node, target, *args, **kwargs):
+        """ GenericTest.is_ip_pingable """
+        del node, args, kwargs
+        sim_node = self.nodes.get(target)
+        return sim_node is not None and sim_node.powered_on
+
+    def poweroff_peer_node(self, node, target, *args, **kwargs):
+        """ GenericTest.poweroff_peer_node """
+        del node, args, kwargs
+        self.nodes[target].powered_on = False
+
+    def set_pws_new_node(self, node, target):
+        """ GenericTest.set_pws_new_node """
+        del node
+        return self.nodes[target].powered_on
+
+    def get_item_state(self, node, url):
+        """ GenericTest.get_item_state """
+        del node
+        return self.model[url].state
+
+    def _tree(self):
+        """
+        Returns the current model as a ModelTree.
+        """
+        return ModelTree(self.execute_cli_show_cmd(None, "/", "-r")[0])
+
+    def find(self, node, path, resource, rtn_type_children=True,
+             assert_not_empty=True, **kwargs):
+        """ GenericTest.find """
+        del node, kwargs
+        paths = self._tree().find(path, resource, rtn_type_children)
+        if assert_not_empty and not paths:
+            raise AssertionError("Could not find '{0}' items under "
+                                 "'{1}'".format(resource, path))
+        return paths
+
+    def find_children_of_collect(self, node, path, resource, **kwargs):
+        """ GenericTest.find_children_of_collect """
+        del node, kwargs
+        return self._tree().find_children_of_collect(path, resource)
+
+    def get_props_from_url(self, node, url, filter_prop=None, **kwargs):
+        """ GenericTest.get_props_from_url """
+        del node, kwargs
+        props = self._tree().get_props(url) or {}
+        if filter_prop is not None:
+            return props.get(filter_prop)
+        return props
+
+    # ------------------------------------------------------------------
+    # Remote commands
+    # ------------------------------------------------------------------
+    def run_command(self, node, cmd, *args, **kwargs):
+        """ GenericTest.run_command """
+        del args
+        default_asserts = kwargs.get("default_asserts", False)
+        sim_node = self.nodes[node]
+        if not sim_node.powered_on:
+            result = self._result(stderr=["ssh: connect to host {0}: No "
+                                          "route to host".format(node)],
+                                  rc=255)
+        else:
+            result = self._run(sim_node, cmd, kwargs.get("su_root", False))
+
+        if default_asserts:
+            self._check(result, True, "'{0}' on {1}".format(cmd, node))
+        return result
+
+    def _run(self, node, cmd, su_root=False):
+        """
+        Executes a supported shell command against a simulated node.
+        """
+        helper = parse_helper_cmd(cmd)
+        if helper is not None:
+            return self._run_helper(node, *helper)
+
+        if re.match(r"^(\S*litp show -p \S+ -r( && |$))+$", cmd):
+            return self._show_subtrees(
+                re.findall(r"litp show -p (\S+) -r", cmd))
+
+        cat = re.match(r"^\S*cat (\S+)$", cmd)
+        if cat:
+            if cat.group(1) not in node.files:
+                return self._result(stderr=["cat: {0}: No such file or "
+                                            "directory".format(cat.group(1))],
+                                    rc=1)
+            return self._result(node.files[cat.group(1)])
+
+        echo = re.match(r"^\S*echo '(.*)' >> (\S+)$", cmd)
+        if echo:
+            if not su_root and echo.group(2).startswith(ROOT_ONLY_DIRS):
+                return self._permission_denied(echo.group(2))
+            node.files.setdefault(echo.group(2), []).append(echo.group(1))
+            return self._result()
+
+        sed = re.match(r"^\S*sed -i '/(.*)/d' (\S+)$", cmd)
+        if sed:
+            if not su_root and sed.group(2).startswith(ROOT_ONLY_DIRS):
+                return self._permission_denied(sed.group(2))
+            lines = node.files.setdefault(sed.group(2), [])
+            lines[:] = [line for line in lines
+                        if not re.search(sed.group(1), line)]
+            return self._result()
+
+        checksum = re.match(r"^\S*sha256sum (\S+)$", cmd)
+        if checksum:
+            if checksum.group(1) not in node.files:
+                return self._result(stderr=["sha256sum: {0}: No such file "
+                                            "or directory".format(
+                                                checksum.group(1))], rc=1)
+            content = "".join(line + "\n"
+                              for line in node.files[checksum.group(1)])
+            return self._result(["{0}  {1}".format(
+                hashlib.sha256(content.encode("utf-8")).hexdigest(),
+                checksum.group(1))])
+
+        stat = re.match(r"^\S*stat -c %s (\S+)$", cmd)
+        if stat:
+            lines = node.files.get(stat.group(1), [])
+            return self._result([str(sum(len(line) + 1 for line in lines))])
+
+        ping = re.match(r"^\S*ping .*?(\S+)$", cmd)
+        if ping:
+            target = self.nodes.get(ping.group(1))
+            if target is None or self._node_url(target.filename) is None:
+                return self._result(["ping: {0}: Name or service not "
+                                     "known".format(ping.group(1))], rc=2)
+            return self._result(["PING {0}".format(ping.group(1))],
+                                rc=0 if target.powered_on else 1)
+
+        if re.match(r"^\S*(rpm -e|systemctl) ", cmd):
+            return self._result()
+
+        return self._result(stderr=["hosts_sim: unsupported command: "
+                                    "{0}".format(cmd)], rc=127)
+
+    def _permission_denied(self, path):
+        """
+        Returns the result of writing to a root owned file without root.
+        """
+        return self._result(stderr=["{0}: Permission denied".format(path)],
+                            rc=1)
+
+    def _run_helper(self, node, name, args):
+        """
+        Returns the result of a helper script run on a simulated node,
+        dispatched on the helper name the command was built with.
+        """
+        if name == hosts_verifier.HELPER_NAME:
+            command, path, options = args
+            return self._result([hosts_verifier.run(
+                command, node.files.get(path, []), json.loads(options))])
+        if name == xml_stream.HELPER_NAME:
+            return self._transform_xml(node, *args)
+        if name == lookup_bench.HELPER_NAME:
+            return self._result(self._time_lookups(node, args[2:]))
+        if name == log_scanner.HELPER_NAME:
+            return self._result(self._scan_log(node, args))
+        if name == plan_utils.HELPER_NAME:
+            return self._result(self._watch_output())
+        return self._result(stderr=["hosts_sim: unsupported helper: "
+                                    "{0}".format(name)], rc=127)
+
+    def _transform_xml(self, node, in_path, out_path, rules):
+        """
+        Runs the streaming XML transform against a simulated file.
+        """
+        if in_path not in node.files:
+            return self._result(stderr=["IOError: No such file or "
+                                        "directory: '{0}'".format(in_path)],
+                                rc=1)
+        in_stream = io.BytesIO("\n".join(node.files[in_path]).encode("utf-8"))
+        out_stream = io.BytesIO()
+        replaced = xml_stream.transform(in_stream, out_stream,
+                                        json.loads(rules))
+        node.files[out_path] = out_stream.getvalue().decode(
+            "utf-8").splitlines()
+        return self._result(["REPLACED {0} {1}".format(count, path)
+                             for path, count in sorted(replaced.items())])
+
+    @staticmethod
+    def _time_lookups(node, names):
+        """
+        Returns the output of the name lookup timing command, with a
+        latency that grows with the line number of the name.
+        """
+        names = ["localhost"] + list(names)
+        output = []
+        for name in names:
+            lines = [number for number, line
+                     in enumerate(node.files[ETC_HOSTS])
+                     if name in line.split("#", 1)[0].split()[1:]]
+            latency = 1.0 + (lines[0] if lines else
+                             len(node.files[ETC_HOSTS])) * 0.0005
+            output.append("LOOKUP {0} {1} {2}".format(
+                name, 0 if lines else 2,
+                " ".join("{0:.3f}".format(latency * factor)
+                         for factor in (0.9, 1.0, 1.1, 1.2, 1.5))))
+        return output
+
+    @staticmethod
+    def _scan_log(node, args):
+        """
+        Returns the output of the log scan command for a simulated log.
+        """
+        path, offset = args[0], int(args[1])
+        split = args.index(log_scanner.EXCLUDE_SEPARATOR) \
+            if log_scanner.EXCLUDE_SEPARATOR in args else len(args)
+        patterns, excludes = args[2:split], args[split + 1:]
+        output = []
+        position = 0
+        for line in node.files.get(path, []):
+            if position >= offset:
+                for index, pattern in enumerate(patterns):
+                    if pattern in line:
+                        if not [exclude for exclude in excludes
+                                if exclude in line]:
+                            output.append("HIT {0} {1} {2}".format(
+                                index, position, line))
+                        break
+            position += len(line) + 1
+        output.append("OFFSET {0}".format(max(position, offset)))
+        return output
+
+    def _watch_output(self):
+        """
+        Returns the output of the plan watch command for the last plan.
+        """
+        if self.plan is None:
+            return []
+        lines = []
+        for index, (path, _) in enumerate(self.plan["tasks"]):
+            lines.append("TASK 0.000 1 {0} {1} {2}".format(
+                index + 1, "Failed" if path in self.plan["failed"]
+                else "Success", path))
+        lines.append("PLAN 0.000 {0}".format(self.plan["state"]))
+        return lines
+
+    # ------------------------------------------------------------------
+    # LITP CLI
+    # ------------------------------------------------------------------
+    def execute_cli_create_cmd(self, node, url, class_type, props="",
+                               args="", expect_positive=True, **kwargs):
+        """ GenericTest.execute_cli_create_cmd """
+        del node, args, kwargs
+        parent = url.rsplit("/", 1)[0] or "/"
+        props = self._parse_props(props)
+        if url in self.model:
+            error = "ItemExistsError    Item {0} already exists".format(url)
+        elif parent not in self.model:
+            error = "InvalidLocationError    Path not found"
+        elif class_type == "alias" and "address" not in props:
+            error = 'MissingRequiredPropertyError in property: "address"'
+        else:
+            error = None
+            self.model[url] = SimItem(class_type, props)
+            if class_type.startswith("alias-") and \
+                    class_type.endswith("-config"):
+                self.model[url + "/aliases"] = SimItem("collection-of-alias")
+
+        result = self._result(stderr=[error] if error else [],
+                              rc=1 if error else 0)
+        return self._check(result, expect_positive,
+                           "litp create -p {0}".format(url))
+
+    def execute_cli_update_cmd(self, node, url, props, args="",
+                               expect_positive=True, **kwargs):
+        """ GenericTest.execute_cli_update_cmd """
+        del node, args, kwargs
+        item = self.model.get(url)
+        if item is None:
+            result = self._result(stderr=["InvalidLocationError    Path not "
+                                          "found"], rc=1)
+        else:
+            item.props.update(self._parse_props(props))
+            if item.state == "Applied" and item.props != item.applied_props:
+                item.state = "Updated"
+            result = self._result()
+        return self._check(result, expect_positive,
+                           "litp update -p {0}".format(url))
+
+    def execute_cli_remove_cmd(self, node, url, args="",
+                               expect_positive=True, **kwargs):
+        """ GenericTest.execute_cli_remove_cmd """
+        del node, args, kwargs
+        if url not in self.model:
+            result = self._result(stderr=["InvalidLocationError    Path not "
+                                          "found"], rc=1)
+        else:
+            for path in self._subtree(url):
+                if self.model[path].state == "Initial":
+                    del self.model[path]
+                else:
+                    self.model[path].state = "ForRemoval"
+            result = self._result()
+        return self._check(result, expect_positive,
+                           "litp remove -p {0}".format(url))
+
+    def execute_cli_show_cmd(self, node, url, args="", expect_positive=True,
+                             **kwargs):
+        """ GenericTest.execute_cli_show_cmd """
+        del node, kwargs
+        if url not in self.model:
+            result = self._result(stderr=["InvalidLocationError    Path not "
+                                          "found"], rc=1)
+            return self._check(result, expect_positive,
+                               "litp show -p {0}".format(url))
+
+        paths = self._subtree(url) if "-r" in args else [url]
+        lines = []
+        for path in paths:
+            item = self.model[path]
+            lines.extend([path, "    type: {0}".format(item.item_type),
+                          "    state: {0}".format(item.state)])
+            if item.props:
+                lines.append("    properties:")
+                lines.extend("        {0}: {1}".format(name, value)
+                             for name, value in sorted(item.props.items()))
+        return self._result(lines)
+
+    def _show_subtrees(self, paths):
+        """
+        Runs chained recursive litp show commands, stopping at the first
+        one that fails.
+        """
+        lines = []
+        for path in paths:
+            if path not in self.model:
+                return self._result(lines, ["InvalidLocationError    Path "
+                                            "not found"], 1)
+            lines.extend(self.execute_cli_show_cmd(None, path, "-r")[0])
+        return self._result(lines)
+
+    def _export_element(self, path):
+        """
+        Builds the XML element of an item and its descendants.
+        """
+        item = self.model[path]
+        item_id = path.rsplit("/", 1)[1]
+        if item.item_type.startswith("collection-of-"):
+            parent = self.model[path.rsplit("/", 1)[0] or "/"]
+            tag = "{0}-{1}-collection".format(parent.item_type, item_id)
+        else:
+            tag = item.item_type
+        element = ET.Element("{{{0}}}{1}".format(LITP_NS, tag),
+                             {"id": item_id})
+        for name, value in sorted(item.props.items()):
+            ET.SubElement(element, name).text = value
+        for child in self._children(path):
+            element.append(self._export_element(child))
+        return element
+
+    def execute_cli_export_cmd(self, node, url, filepath=None, args="",
+                               expect_positive=True, **kwargs):
+        """ GenericTest.execute_cli_export_cmd """
+        del args, kwargs
+        if url not in self.model:
+            result = self._result(stderr=["InvalidLocationError    Path not "
+                                          "found"], rc=1)
+            return self._check(result, expect_positive,
+                               "litp export -p {0}".format(url))
+
+        xml_lines = ["<?xml version='1.0' encoding='utf-8'?>"] + \
+            ET.tostring(self._export_element(url)).decode().splitlines()
+        if filepath:
+            self.nodes[node].files[filepath] = xml_lines
+            return self._result()
+        return self._result(xml_lines)
+
+    def _load_element(self, parent_path, element):
+        """
+        Creates or merges an item, and its descendants, from XML.
+        """
+        path = "{0}/{1}".format(parent_path.rstrip("/"), element.get("id"))
+        tag = element.tag.split("}", 1)[-1]
+        items = [child for child in element if child.tag.startswith("{")]
+        props = dict((child.tag, (child.text or "").strip())
+                     for child in element if not child.tag.startswith("{"))
+
+        item = self.model.get(path)
+        if item is None:
+            if tag.endswith("-collection"):
+                child_type = items[0].tag.split("}", 1)[-1] if items else ""
+                tag = "collection-of-{0}".format(child_type)
+            self.model[path] = SimItem(tag, props)
+        else:
+            if item.state == "ForRemoval":
+                item.state = "Applied"
+            item.props.update(props)
+            if item.state == "Applied" and item.props != item.applied_props:
+                item.state = "Updated"
+
+        for child in items:
+            self._load_element(path, child)
+
+    def execute_cli_load_cmd(self, node, url, filepath, args="",
+                             expect_positive=True, **kwargs):
+        """ GenericTest.execute_cli_load_cmd """
+        del kwargs
+        xml_lines = self.nodes[node].files.get(filepath)
+        root = None
+        if xml_lines is not None:
+            root = ET.fromstring("\n".join(xml_lines[1:]))
+        path = "{0}/{1}".format(url.rstrip("/"), root.get("id")) \
+            if root is not None else url
+        if root is None or url not in self.model:
+            error = "InvalidLocationError    Path not found"
+        elif path in self.model and "--merge" not in args and \
+                "--replace" not in args:
+            error = "ItemExistsError    Item {0} already exists".format(path)
+        else:
+            error = None
+            self._load_element(url, root)
+        result = self._result(stderr=[error] if error else [],
+                              rc=1 if error else 0)
+        return self._check(result, expect_positive,
+                           "litp load -p {0}".format(url))
+
+    def execute_cli_createplan_cmd(self, node, args="", expect_positive=True,
+                                   **kwargs):
+        """ GenericTest.execute_cli_createplan_cmd """
+        del node, args, kwargs
+        tasks = self._pending_tasks()
+        if not tasks:
+            self.plan = None
+            result = self._result(stderr=[DO_NOTHING_PLAN_ERROR], rc=1)
+        else:
+            self.plan = {"tasks": tasks, "state": "Initial", "failed": []}
+            result = self._result()
+        return self._check(result, expect_positive, "litp create_plan")
+
+    def execute_cli_runplan_cmd(self, node, args="", expect_positive=True,
+                                **kwargs):
+        """ GenericTest.execute_cli_runplan_cmd """
+        del node, args, kwargs
+        if self.plan is None:
+            result = self._result(stderr=["InvalidLocationError    Plan "
+                                          "does not exist"], rc=1)
+            return self._check(result, expect_positive, "litp run_plan")
+
+        self.plan["failed"] = [path for path, _ in self.plan["tasks"]
+                               if self._is_failing(path)]
+        if self.plan["failed"]:
+            self.ms.files[LOG_FILE].append(
+                "litpd: ERROR: Plan execution failed")
+            self.plan["state"] = "Failed"
+            return self._check(self._result(), expect_positive,
+                               "litp run_plan")
+
+        added = [self._node_for_path(path) for path, item
+                 in self.model.items()
+                 if item.item_type == "node" and item.state == "Initial"]
+        self._apply_model()
+        for sim_node in added:
+            if sim_node is not None and not sim_node.powered_on:
+                # The node is reinstalled when it is added back
+                sim_node.powered_on = True
+                sim_node.files[ETC_HOSTS] = ["127.0.0.1\tlocalhost"]
+                sim_node.managed_lines = []
+        self._apply_hosts()
+        self.ms.files[LOG_FILE].extend([
+            "litpd: INFO: Plan execution successful",
+            "postgres[1]: ERROR: could not receive data from client"])
+        self.plan["state"] = "Successful"
+        return self._check(self._result(), expect_positive, "litp run_plan")
+
+    def _is_failing(self, path):
+        """
+        Checks whether the task for an item path fails, i.e. whether the
+        path is in, or under a path in, failing_paths.
+        """
+        return bool([failing for failing in self.failing_paths
+                     if path == failing or
+                     path.startswith(failing.rstrip("/") + "/")])
+
+    def execute_cli_stopplan_cmd(self, node, args="", expect_positive=True,
+                                 **kwargs):
+        """ GenericTest.execute_cli_stopplan_cmd """
+        del node, args, kwargs
+        if self.plan is None:
+            result = self._result(stderr=["InvalidLocationError    Plan "
+                                          "does not exist"], rc=1)
+        else:
+            if self.plan["state"] == "Running":
+                self.plan["state"] = "Stopped"
+            result = self._result()
+        return self._check(result, expect_positive, "litp stop_plan")
+
+    def run_and_check_plan(self, node, expected_plan_state, *args,
+                           **kwargs):
+        """ GenericTest.run_and_check_plan """
+        del args, kwargs
+        self.execute_cli_createplan_cmd(node)
+        self.execute_cli_runplan_cmd(node)
+        expected_state = plan_utils.PLAN_STATES[expected_plan_state]
+        if self.plan["state"] != expected_state:
+            raise AssertionError("Plan ended {0}, expected {1}".format(
+                self.plan["state"], expected_state))
+        return True
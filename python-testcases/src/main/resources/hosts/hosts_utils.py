@@ -0,0 +1,100 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Commands run on the nodes by the hosts tests: fetching
+            /etc/hosts, parsed into a HostsFile, and running the helper
+            scripts.
+"""
+import pipes
+import re
+import shlex
+import test_constants as const
+from hosts_verifier import HostsFile
+
+# Interpreter used for the helper scripts run on the nodes
+PYTHON_PATH = "/usr/bin/python"
+SHA256SUM_PATH = "/usr/bin/sha256sum"
+
+# Environment variable naming the helper script a command runs, so that
+# the command can be recognised without looking at the script itself
+HELPER_ENV_VAR = "LITP_HOSTS_HELPER"
+HELPER_CMD_REGEX = re.compile(r"^{0}=(\S+) \S+ -(.*?) <<'EOF'\n".format(
+    HELPER_ENV_VAR))
+
+
+def get_helper_cmd(name, script, args):
+    """
+    Description:
+        Returns the command running a helper script on a node. The script
+        is sent on stdin and the command starts with the helper name,
+        e.g. "LITP_HOSTS_HELPER=log_scan /usr/bin/python - <args>".
+
+    Args:
+        name (str): Name of the helper.
+        script (str): Python source of the helper.
+        args (list): Command line arguments of the helper.
+
+    Returns:
+        str. The command.
+    """
+    return "{0}={1} {2} - {3} <<'EOF'\n{4}\nEOF".format(
+        HELPER_ENV_VAR, name, PYTHON_PATH,
+        " ".join(pipes.quote(str(arg)) for arg in args), script.strip("\n"))
+
+
+def parse_helper_cmd(cmd):
+    """
+    Description:
+        Reads the helper name and arguments back from a command built by
+        get_helper_cmd.
+
+    Args:
+        cmd (str): The command.
+
+    Returns:
+        tuple. (name, list of arguments), or None if the command does not
+        run a helper script.
+    """
+    match = HELPER_CMD_REGEX.match(cmd)
+    if match is None:
+        return None
+    return match.group(1), shlex.split(match.group(2))
+
+
+class HostsUtils(object):
+    """
+    Commands and parsers for verifying /etc/hosts files.
+    """
+
+    @staticmethod
+    def get_cat_hosts_cmd():
+        """
+        Description:
+            Returns the command used to fetch the whole /etc/hosts file
+            in a single remote call.
+
+        Returns:
+            str. The cat command.
+        """
+        return "{0} {1}".format(const.CAT_PATH, const.ETC_HOSTS)
+
+    @staticmethod
+    def parse_hosts(lines):
+        """
+        Description:
+            Parses /etc/hosts content into a HostsFile.
+
+        Args:
+            lines (list): Lines of the /etc/hosts file.
+
+        Returns:
+            HostsFile. The parsed file.
+        """
+        return HostsFile(lines)
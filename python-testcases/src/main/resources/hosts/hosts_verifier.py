@@ -0,0 +1,378 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Indexed model of /etc/hosts content, checks of it against a
+            list of expectations, and digests of the LITP managed entries
+            for comparing nodes.
+            This module only uses the standard library: its source is
+            also run as a script on the nodes, so that only the failed
+            expectations, or a digest, are sent back.
+"""
+import hashlib
+import json
+import socket
+import sys
+
+HELPER_NAME = "hosts_verifier"
+MANUAL_ENTRY_MARKER = "manually added"
+
+
+def canonical_address(address):
+    """
+    Description:
+        Returns the canonical text form of an IPv4 or IPv6 address so
+        that e.g. "2001:0db8::0001" and "2001:db8::1" compare equal.
+
+    Args:
+        address (str): Address to canonicalise.
+
+    Returns:
+        str. The canonical address, or the address unchanged if it is
+        not a valid IPv4 or IPv6 address (e.g. it carries a prefix).
+    """
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            return socket.inet_ntop(family, socket.inet_pton(family, address))
+        except (socket.error, ValueError):
+            continue
+    return address
+
+
+class HostsEntry(object):
+    """
+    A single address line of an /etc/hosts file.
+    """
+    __slots__ = ("address", "canonical", "names", "comment", "line_number",
+                 "line")
+
+    def __init__(self, address, names, comment, line_number, line):
+        """
+        Args:
+            address (str): Address as written in the file.
+            names (tuple): Hostnames and aliases listed for the address.
+            comment (str): Trailing comment, without the leading '#'.
+            line_number (int): Zero based line number in the file.
+            line (str): The line as written in the file.
+        """
+        self.address = address
+        self.canonical = canonical_address(address)
+        self.names = names
+        self.comment = comment
+        self.line_number = line_number
+        self.line = line
+
+    @property
+    def manual(self):
+        """
+        bool. True if the entry was added by hand rather than by LITP.
+        """
+        return MANUAL_ENTRY_MARKER in self.comment
+
+    def __repr__(self):
+        return "HostsEntry({0!r}, {1!r}, {2!r})".format(
+            self.address, self.names, self.comment)
+
+
+class HostsFile(object):
+    """
+    Parsed /etc/hosts file indexed by address and by name.
+    """
+    __slots__ = ("entries", "comments", "_by_address", "_by_name")
+
+    def __init__(self, lines):
+        """
+        Args:
+            lines (list): Lines of the /etc/hosts file as returned by
+                          run_command.
+        """
+        self.entries = []
+        self.comments = []
+        self._by_address = {}
+        self._by_name = {}
+
+        for line_number, line in enumerate(lines):
+            ip_and_aliases, _, comment = line.partition('#')
+            fields = ip_and_aliases.split()
+            if not fields:
+                if comment:
+                    self.comments.append(comment.strip())
+                continue
+
+            entry = HostsEntry(fields[0], tuple(fields[1:]), comment.strip(),
+                               line_number, line)
+            self.entries.append(entry)
+            self._by_address.setdefault(entry.canonical, []).append(entry)
+            for name in entry.names:
+                self._by_name.setdefault(name, []).append(entry)
+
+    def get_entries(self, address=None, name=None):
+        """
+        Description:
+            Returns the entries for an address and/or name. If neither
+            is given every entry is returned.
+
+        Kwargs:
+            address (str): Address to filter by.
+            name (str): Hostname or alias name to filter by.
+
+        Returns:
+            list. Matching HostsEntry objects in file order.
+        """
+        if address is not None:
+            entries = self._by_address.get(canonical_address(address), [])
+            if name is not None:
+                entries = [entry for entry in entries if name in entry.names]
+            return list(entries)
+        if name is not None:
+            return list(self._by_name.get(name, []))
+        return list(self.entries)
+
+    def count_address(self, address):
+        """
+        Description:
+            Counts the entries in the file for the given address.
+
+        Args:
+            address (str): IP address to count.
+
+        Returns:
+            int. Number of entries for the address.
+        """
+        return len(self._by_address.get(canonical_address(address), []))
+
+    def get_names(self, address):
+        """
+        Description:
+            Returns every name listed for the given address.
+
+        Args:
+            address (str): IP address to look up.
+
+        Returns:
+            list. Names in file order.
+        """
+        return [name for entry in self.get_entries(address=address)
+                for name in entry.names]
+
+    def get_addresses(self, name):
+        """
+        Description:
+            Returns the canonical addresses of every entry listing the
+            given name.
+
+        Args:
+            name (str): Hostname or alias name to look up.
+
+        Returns:
+            list. Canonical addresses in file order.
+        """
+        return [entry.canonical for entry in self._by_name.get(name, [])]
+
+    def has_name(self, name):
+        """
+        Description:
+            Checks whether any entry in the file lists the given name.
+
+        Args:
+            name (str): Hostname or alias name to look up.
+
+        Returns:
+            bool. True if the name is present, otherwise False.
+        """
+        return name in self._by_name
+
+    def get_manual_entries(self):
+        """
+        Description:
+            Returns the entries added by hand rather than by LITP.
+
+        Returns:
+            list. Manually added HostsEntry objects in file order.
+        """
+        return [entry for entry in self.entries if entry.manual]
+
+    def get_managed_entries(self):
+        """
+        Description:
+            Returns the entries written by LITP.
+
+        Returns:
+            list. LITP managed HostsEntry objects in file order.
+        """
+        return [entry for entry in self.entries if not entry.manual]
+
+
+def as_hosts_file(lines):
+    """
+    Description:
+        Returns /etc/hosts content as a HostsFile.
+
+    Args:
+        lines (list or HostsFile): Lines of /etc/hosts, or the parsed
+                                   file.
+
+    Returns:
+        HostsFile. The parsed file.
+    """
+    if isinstance(lines, HostsFile):
+        return lines
+    return HostsFile(lines)
+
+
+def expectation(address=None, count=None, names=(), present=(), absent=()):
+    """
+    Description:
+        Builds an expectation on the content of /etc/hosts.
+
+    Kwargs:
+        address (str): Address the expectation is about.
+        count (int): Number of lines expected for address.
+        names (list): Names that, wherever listed, must be listed for
+                      address only.
+        present (list): Names that must be listed at least once.
+        absent (list): Names that must not be listed.
+
+    Returns:
+        dict. The expectation, ready to be sent to a node as JSON.
+    """
+    return {"address": address, "count": count, "names": list(names),
+            "present": list(present), "absent": list(absent)}
+
+
+def verify(lines, expectations):
+    """
+    Description:
+        Checks /etc/hosts content against expectations.
+
+    Args:
+        lines (list or HostsFile): Lines of /etc/hosts, or the parsed
+                                   file.
+        expectations (list): Expectations built by expectation().
+
+    Returns:
+        list. One dict per failed check, with the index of the
+        expectation, the reason and the lines concerned.
+    """
+    hosts = as_hosts_file(lines)
+    failures = []
+    for index, expected in enumerate(expectations):
+        address = expected.get("address")
+        canonical = canonical_address(address) if address else None
+        if address is not None and expected.get("count") is not None:
+            found = hosts.get_entries(address=canonical)
+            if len(found) != expected["count"]:
+                failures.append({
+                    "index": index,
+                    "reason": "{0} lines for {1}, expected {2}".format(
+                        len(found), address, expected["count"]),
+                    "lines": [entry.line for entry in found]})
+        for name in expected.get("names", ()):
+            wrong = [entry.line for entry in hosts.get_entries(name=name)
+                     if entry.canonical != canonical]
+            if wrong:
+                failures.append({
+                    "index": index,
+                    "reason": "{0} is listed for another address than "
+                              "{1}".format(name, address),
+                    "lines": wrong})
+        for name in expected.get("present", ()):
+            if not hosts.has_name(name):
+                failures.append({"index": index,
+                                 "reason": "{0} is not listed".format(name),
+                                 "lines": []})
+        for name in expected.get("absent", ()):
+            if hosts.has_name(name):
+                failures.append({
+                    "index": index,
+                    "reason": "{0} is listed".format(name),
+                    "lines": [entry.line for entry
+                              in hosts.get_entries(name=name)]})
+    return failures
+
+
+def managed_lines(lines, ignore_names=(), ordered=False):
+    """
+    Description:
+        Normalises the LITP managed entries of /etc/hosts: manually added
+        entries, comments and blank lines are dropped, addresses are made
+        canonical and whitespace is collapsed.
+
+    Args:
+        lines (list or HostsFile): Lines of /etc/hosts, or the parsed
+                                   file.
+
+    Kwargs:
+        ignore_names (list): Entries listing any of these names are
+                             dropped, e.g. node-level aliases.
+        ordered (bool): If True, keep the file order so that nodes only
+                        match if their entries are in the same order.
+                        Otherwise the entries are sorted.
+
+    Returns:
+        list. Normalised entries.
+    """
+    ignore_names = set(ignore_names)
+    normalised = []
+    for entry in as_hosts_file(lines).get_managed_entries():
+        if ignore_names.intersection(entry.names):
+            continue
+        normalised.append(" ".join((entry.canonical,) + entry.names))
+    return normalised if ordered else sorted(normalised)
+
+
+def digest(lines, ignore_names=(), ordered=False):
+    """
+    Description:
+        Returns a digest of the normalised LITP managed entries, see
+        managed_lines.
+
+    Returns:
+        dict. "digest" (SHA-256 hex) and "count" (number of entries).
+    """
+    entries = managed_lines(lines, ignore_names, ordered)
+    text = "\n".join(entries).encode("utf-8")
+    return {"digest": hashlib.sha256(text).hexdigest(),
+            "count": len(entries)}
+
+
+def run(command, lines, options):
+    """
+    Description:
+        Runs a command of the script against /etc/hosts lines.
+
+    Args:
+        command (str): "verify", "digest" or "lines".
+        lines (list): Lines of /etc/hosts.
+        options: Expectations for verify, digest or lines options
+                 ("ignore_names", "ordered") otherwise.
+
+    Returns:
+        str. The JSON output of the script.
+    """
+    if command == "verify":
+        return json.dumps(verify(lines, options))
+    if command == "digest":
+        return json.dumps(digest(lines, **options))
+    return json.dumps(managed_lines(lines, **options))
+
+
+def main(argv):
+    """
+    Description:
+        Command line entry point: <command> <hosts file> <options as
+        JSON>. Prints the result as JSON.
+    """
+    with open(argv[2]) as hosts_file:
+        lines = hosts_file.read().splitlines()
+    print(run(argv[1], lines, json.loads(argv[3])))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,271 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Selection of the hosts tests impacted by the LITP packages
+            that changed, using their @attr tags, ordered by past
+            outcome and duration. Full runs are kept on a schedule.
+
+            Usage:
+                impact_select.py select <package> [<package> ...]
+                    [--history <file>] [--full-every-days <days>]
+                impact_select.py record <nosetests xunit report>
+                    [--history <file>] [--full]
+
+            "select" prints the nose names of the tests to run, one per
+            line. When a full run is due it says so on stderr and notes it
+            in the history, so that recording the run's report counts it
+            as the full run. "record" adds the outcomes and durations of
+            a run to the history. Only the standard library is used, so
+            that the selection runs wherever the suite is started.
+"""
+import argparse
+import ast
+import glob
+import json
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+TESTSET_PATTERN = "testset_*.py"
+DEFAULT_HISTORY_FILE = "hosts_test_history.json"
+DEFAULT_FULL_EVERY_DAYS = 7
+# Tests are only selected from this @attr tag, as in a full run
+RUN_TAG = "all"
+
+# @attr tags of the tests exercising each package. "*" selects every
+# test carrying RUN_TAG.
+IMPACT_MAP = {
+    # The hosts plugin renders every alias and node to /etc/hosts
+    "ERIClitphosts": ["*"],
+    # Alias item types and their validation
+    "ERIClitphostsapi": ["story54", "story349676", "story7534"],
+    # Model, plan, export/load and node removal
+    "ERIClitpcore": ["story54_tc06", "story7534", "story194485"],
+    "ERIClitpcli": ["story54_tc06", "story7534"],
+    # IPv6 address validation of alias addresses
+    "ERIClitpnetworkapi": ["story349676"],
+    # Puppet applies /etc/hosts on the nodes
+    "ERIClitppuppet": ["*"],
+}
+
+
+def find_tests(directory):
+    """
+    Description:
+        Finds the test methods of the test sets and their @attr tags
+        without importing them.
+
+    Args:
+        directory (str): Directory of the test sets.
+
+    Returns:
+        dict. Tags keyed by nose test name, e.g.
+        "testset_story54:Story54.test_01_p_create_update_remove_alias".
+    """
+    tests = {}
+    for path in sorted(glob.glob(os.path.join(directory, TESTSET_PATTERN))):
+        module = os.path.splitext(os.path.basename(path))[0]
+        with open(path) as source:
+            tree = ast.parse(source.read(), path)
+        for cls in [node for node in tree.body
+                    if isinstance(node, ast.ClassDef)]:
+            for method in [node for node in cls.body
+                           if isinstance(node, ast.FunctionDef) and
+                           node.name.startswith("test")]:
+                tags = set()
+                for decorator in method.decorator_list:
+                    if isinstance(decorator, ast.Call) and \
+                            getattr(decorator.func, "id", None) == "attr":
+                        tags.update(arg.s for arg in decorator.args
+                                    if isinstance(arg, ast.Str))
+                if RUN_TAG in tags:
+                    tests["{0}:{1}.{2}".format(module, cls.name,
+                                               method.name)] = tags
+    return tests
+
+
+def impacted_tests(tests, packages):
+    """
+    Description:
+        Returns the tests exercising any of the packages. Packages not in
+        IMPACT_MAP select every test, as their impact is not known.
+
+    Args:
+        tests (dict): Tags keyed by test name, see find_tests.
+        packages (list): Names of the changed packages.
+
+    Returns:
+        set. Names of the impacted tests.
+    """
+    tags = set()
+    for package in packages:
+        tags.update(IMPACT_MAP.get(package, ["*"]))
+    if "*" in tags:
+        return set(tests)
+    return set(name for name, test_tags in tests.items()
+               if test_tags & tags)
+
+
+def load_history(path):
+    """
+    Description:
+        Reads the run history.
+
+    Args:
+        path (str): History file.
+
+    Returns:
+        dict. "tests": outcome, duration and date of the last run keyed
+        by test name; "last_full_run": time of the last full run;
+        "full_run_selected": time a full run was last selected, until
+        its report is recorded.
+    """
+    if not os.path.exists(path):
+        return {"tests": {}, "last_full_run": 0}
+    with open(path) as history_file:
+        return json.load(history_file)
+
+
+def order_tests(names, history):
+    """
+    Description:
+        Orders tests so that problems show early: tests that failed last
+        time or never ran first, then the quickest.
+
+    Args:
+        names (iterable): Test names.
+        history (dict): Run history, see load_history.
+
+    Returns:
+        list. Ordered test names.
+    """
+    def key(name):
+        """ Sort key of a test. """
+        past = history["tests"].get(name)
+        if past is None:
+            return (0, 0, name)
+        return (0 if past["outcome"] != "pass" else 1,
+                past["duration_secs"], name)
+    return sorted(names, key=key)
+
+
+def full_run_due(history, full_every_days):
+    """
+    Description:
+        Checks whether the next run has to be a full run.
+
+    Args:
+        history (dict): Run history, see load_history.
+        full_every_days (float): Days after which a full run is due.
+
+    Returns:
+        bool. True if a full run is due.
+    """
+    return time.time() - history.get("last_full_run", 0) >= \
+        full_every_days * 24 * 3600
+
+
+def select(directory, packages, history, full_every_days):
+    """
+    Description:
+        Selects the tests to run for changed packages.
+
+    Args:
+        directory (str): Directory of the test sets.
+        packages (list): Names of the changed packages.
+        history (dict): Run history, see load_history.
+        full_every_days (float): Days after which a full run is due.
+
+    Returns:
+        list. Ordered names of the tests to run.
+    """
+    tests = find_tests(directory)
+    if full_run_due(history, full_every_days) or not packages:
+        return order_tests(tests, history)
+    return order_tests(impacted_tests(tests, packages), history)
+
+
+def record(history, report_path, full=False):
+    """
+    Description:
+        Adds the outcome and duration of every test of a nosetests xunit
+        report to the history.
+
+    Args:
+        history (dict): Run history, see load_history.
+        report_path (str): nosetests xunit XML report.
+
+    Kwargs:
+        full (bool): True if the report is of a full run. Default is
+                     whether select last chose a full run.
+
+    Returns:
+        dict. The updated history.
+    """
+    now = time.time()
+    for case in ET.parse(report_path).getroot().iter("testcase"):
+        module, _, cls = case.get("classname").rpartition(".")
+        outcome = "pass"
+        for child in case:
+            if child.tag in ("failure", "error", "skipped"):
+                outcome = child.tag
+        history["tests"]["{0}:{1}.{2}".format(module, cls, case.get(
+            "name"))] = {"outcome": outcome,
+                         "duration_secs": float(case.get("time", 0)),
+                         "last_run": now}
+    if history.pop("full_run_selected", None) is not None:
+        full = True
+    if full:
+        history["last_full_run"] = now
+    return history
+
+
+def main(argv):
+    """
+    Description:
+        Command line entry point, see the module description.
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--history", default=DEFAULT_HISTORY_FILE)
+    parser = argparse.ArgumentParser(description="Hosts test selection")
+    commands = parser.add_subparsers(dest="command")
+    select_parser = commands.add_parser("select", parents=[common])
+    select_parser.add_argument("packages", nargs="*")
+    select_parser.add_argument("--full-every-days", type=float,
+                               default=DEFAULT_FULL_EVERY_DAYS)
+    record_parser = commands.add_parser("record", parents=[common])
+    record_parser.add_argument("report")
+    record_parser.add_argument("--full", action="store_true")
+    args = parser.parse_args(argv[1:])
+
+    history = load_history(args.history)
+    if args.command == "select":
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for name in select(directory, args.packages, history,
+                           args.full_every_days):
+            print(name)
+        if full_run_due(history, args.full_every_days) or \
+                not args.packages:
+            sys.stderr.write("Full run selected; record its report to "
+                             "reset the schedule\n")
+            history["full_run_selected"] = time.time()
+        else:
+            return 0
+    else:
+        history = record(history, args.report, args.full)
+
+    with open(args.history, "w") as history_file:
+        json.dump(history, history_file, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,210 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Recording of the GenericTest calls a test makes against a
+            deployment, and their replay from the recorded fixture so
+            that test logic can be rerun without the deployment.
+"""
+import collections
+import gzip
+import json
+import os
+from hosts_utils import parse_helper_cmd
+
+RECORD_ENV_VAR = "LITP_HOSTS_RECORD"
+REPLAY_ENV_VAR = "LITP_HOSTS_REPLAY"
+FIXTURE_SUFFIX = ".json.gz"
+
+
+class ReplayError(AssertionError):
+    """
+    Raised when a replayed test makes a call that was not recorded.
+    """
+
+
+def get_interaction_log(test_id):
+    """
+    Description:
+        Returns the interaction log requested by the environment:
+        LITP_HOSTS_RECORD or LITP_HOSTS_REPLAY set to the fixture
+        directory.
+
+    Args:
+        test_id (str): Id of the test, which names its fixture file.
+
+    Returns:
+        InteractionLog. The log, or None if neither is set.
+    """
+    for env_var, replaying in ((REPLAY_ENV_VAR, True),
+                               (RECORD_ENV_VAR, False)):
+        fixture_dir = os.environ.get(env_var)
+        if fixture_dir:
+            return InteractionLog(
+                os.path.join(fixture_dir, test_id + FIXTURE_SUFFIX),
+                replaying)
+    return None
+
+
+def _key_arg(arg):
+    """
+    Returns a command running a helper script as the helper name and
+    arguments, so that the key does not change with the script source.
+    Other arguments are returned unchanged.
+    """
+    helper = parse_helper_cmd(arg) if isinstance(arg, str) else None
+    if helper is None:
+        return arg
+    return {"helper": helper[0], "args": helper[1]}
+
+
+def _call_key(name, args, kwargs):
+    """
+    Returns the key identifying a call in the fixture.
+    """
+    return json.dumps([name, [_key_arg(arg) for arg in args], kwargs],
+                      sort_keys=True, separators=(",", ":"), default=repr)
+
+
+class InteractionLog(object):
+    """
+    Calls and results of one test. The fixture is a gzipped JSON list of
+    [key, result, is_tuple, error] entries in call order; on replay it
+    is indexed by key, and repeated calls with the same key get the
+    recorded results in turn, e.g. the successive polls of a plan.
+    """
+
+    def __init__(self, path, replaying):
+        """
+        Args:
+            path (str): Fixture file.
+            replaying (bool): True to replay the fixture, False to record
+                              it.
+        """
+        self.path = path
+        self.replaying = replaying
+        self.entries = []
+        self._index = {}
+        if replaying:
+            with gzip.open(path, "rb") as fixture:
+                self.entries = json.loads(fixture.read().decode("utf-8"))
+            for entry in self.entries:
+                self._index.setdefault(entry[0], collections.deque()).append(
+                    entry)
+
+    def record(self, name, args, kwargs, result=None, error=None):
+        """
+        Description:
+            Records a call and its result, or the assertion it failed
+            with.
+
+        Args:
+            name (str): Name of the called method.
+            args (tuple): Positional arguments of the call.
+            kwargs (dict): Keyword arguments of the call.
+
+        Kwargs:
+            result: Value returned by the call.
+            error (AssertionError): Assertion raised by the call.
+        """
+        self.entries.append([_call_key(name, args, kwargs), result,
+                             isinstance(result, tuple),
+                             None if error is None else str(error)])
+
+    def replay(self, name, args, kwargs):
+        """
+        Description:
+            Returns the recorded result of a call.
+
+        Args:
+            name (str): Name of the called method.
+            args (tuple): Positional arguments of the call.
+            kwargs (dict): Keyword arguments of the call.
+
+        Returns:
+            The recorded result.
+
+        Raises:
+            ReplayError. If no (more) results were recorded for the call.
+            AssertionError. If the recorded call failed an assertion.
+        """
+        key = _call_key(name, args, kwargs)
+        recorded = self._index.get(key)
+        if not recorded:
+            raise ReplayError("No recorded result in {0} for {1}".format(
+                self.path, key))
+        _, result, is_tuple, error = recorded.popleft()
+        if error is not None:
+            raise AssertionError(error)
+        return tuple(result) if is_tuple else result
+
+    def wrap(self, name, func):
+        """
+        Description:
+            Returns a callable standing in for func: it records the calls
+            to func, or replays them without calling func.
+
+        Args:
+            name (str): Name the calls are recorded under.
+            func (callable): The recorded function, None when replaying.
+
+        Returns:
+            callable. The wrapper.
+        """
+        def wrapper(*args, **kwargs):
+            """ Records or replays one call. """
+            if self.replaying:
+                return self.replay(name, args, kwargs)
+            try:
+                result = func(*args, **kwargs)
+            except AssertionError as err:
+                self.record(name, args, kwargs, error=err)
+                raise
+            self.record(name, args, kwargs, result)
+            return result
+        return wrapper
+
+    def save(self):
+        """
+        Description:
+            Writes the recorded calls to the fixture file.
+        """
+        if self.replaying:
+            return
+        fixture_dir = os.path.dirname(self.path)
+        if fixture_dir and not os.path.isdir(fixture_dir):
+            os.makedirs(fixture_dir)
+        with gzip.open(self.path, "wb") as fixture:
+            fixture.write(json.dumps(self.entries,
+                                     separators=(",", ":")).encode("utf-8"))
+
+
+class InteractionProxy(object):
+    """
+    Records or replays the method calls made on a framework helper
+    object such as self.rhc.
+    """
+
+    def __init__(self, log, prefix, target=None):
+        """
+        Args:
+            log (InteractionLog): Log the calls go to.
+            prefix (str): Prefix of the recorded method names.
+
+        Kwargs:
+            target: The helper object, None when replaying.
+        """
+        self._log = log
+        self._prefix = prefix
+        self._target = target
+
+    def __getattr__(self, name):
+        return self._log.wrap(
+            "{0}.{1}".format(self._prefix, name),
+            None if self._target is None else getattr(self._target, name))
@@ -0,0 +1,136 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Incremental log scanning. The log is read once on the node,
+            from the byte offset the previous scan stopped at, and every
+            pattern is matched in that single pass.
+"""
+from hosts_utils import get_helper_cmd
+
+HELPER_NAME = "log_scan"
+STAT_SIZE_CMD = "/usr/bin/stat -c %s {0}"
+EXCLUDE_SEPARATOR = "--"
+
+# Runs on the node. Reads the log from the given byte offset, starting
+# again from 0 if the log has been rotated, and prints one HIT line per
+# matching line followed by the offset to resume the next scan from. A
+# trailing line still being written is left for the next scan.
+SCAN_SCRIPT = """
+import os, sys
+path, offset = sys.argv[1], int(sys.argv[2])
+args = sys.argv[3:]
+split = args.index("--") if "--" in args else len(args)
+patterns, excludes = args[:split], args[split + 1:]
+if os.path.getsize(path) < offset:
+    offset = 0
+log = open(path, "rb")
+log.seek(offset)
+for raw in log:
+    if not raw.endswith(b"\\n"):
+        break
+    line = raw if isinstance(raw, str) else raw.decode("utf-8", "replace")
+    for index, pattern in enumerate(patterns):
+        if pattern in line:
+            if not [exclude for exclude in excludes if exclude in line]:
+                sys.stdout.write("HIT %d %d %s" % (index, offset, line))
+            break
+    offset += len(raw)
+print("OFFSET %d" % offset)
+"""
+
+
+class LogHit(object):
+    """
+    A log line matched by a scan.
+    """
+    __slots__ = ("pattern", "offset", "line")
+
+    def __init__(self, pattern, offset, line):
+        """
+        Args:
+            pattern (str): First pattern found in the line.
+            offset (int): Byte offset of the line in the log.
+            line (str): The log line.
+        """
+        self.pattern = pattern
+        self.offset = offset
+        self.line = line
+
+    def __repr__(self):
+        return "LogHit({0!r}, {1}, {2!r})".format(self.pattern,
+                                                  self.offset, self.line)
+
+
+class LogScanner(object):
+    """
+    Patterns to look for in one log file, and how far it has been read.
+    """
+
+    def __init__(self, log_path, patterns, excludes=(), offset=0):
+        """
+        Args:
+            log_path (str): Log file on the node.
+            patterns (list): Substrings of the lines to report.
+
+        Kwargs:
+            excludes (list): Substrings of the lines to ignore even if
+                             they contain a pattern.
+            offset (int): Byte offset to start the first scan from.
+        """
+        self.log_path = log_path
+        self.patterns = list(patterns)
+        self.excludes = list(excludes)
+        self.offset = offset
+
+    def get_size_cmd(self):
+        """
+        Description:
+            Returns the command printing the current size of the log, the
+            offset from which a scan only sees new lines.
+
+        Returns:
+            str. The command.
+        """
+        return STAT_SIZE_CMD.format(self.log_path)
+
+    def get_scan_cmd(self):
+        """
+        Description:
+            Returns the command scanning the log from the current offset.
+
+        Returns:
+            str. The command.
+        """
+        args = [self.log_path, str(self.offset)] + self.patterns
+        if self.excludes:
+            args += [EXCLUDE_SEPARATOR] + self.excludes
+        return get_helper_cmd(HELPER_NAME, SCAN_SCRIPT, args)
+
+    def parse_scan_output(self, lines):
+        """
+        Description:
+            Parses the output of the scan command and moves the offset to
+            where the scan stopped.
+
+        Args:
+            lines (list): stdout of the scan command.
+
+        Returns:
+            list. LogHit per matching line, in log order.
+        """
+        hits = []
+        for line in lines:
+            if line.startswith("HIT "):
+                _, index, offset, text = line.split(" ", 3)
+                hits.append(LogHit(self.patterns[int(index)], int(offset),
+                                   text))
+            elif line.startswith("OFFSET "):
+                self.offset = int(line.split()[1])
+        return hits
@@ -0,0 +1,108 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Name resolution latency measured on a node. Each name is
+            resolved repeatedly with "getent hosts" on the node itself and
+            only the latency percentiles are sent back.
+"""
+from hosts_utils import get_helper_cmd
+
+HELPER_NAME = "name_lookup"
+GETENT_PATH = "/usr/bin/getent"
+DEFAULT_LOOKUPS = 50
+PERCENTILES = (50, 90, 99)
+
+# Runs on the node. Times every "getent hosts <name>" and prints, per
+# name, "LOOKUP <name> <rc> <min> <p50> <p90> <p99> <max>" in
+# milliseconds. localhost is timed first: as it is the first line of
+# /etc/hosts, its latency is the cost of starting getent, which the
+# other names can be compared against.
+LOOKUP_SCRIPT = """
+import subprocess, sys, time
+getent, lookups = sys.argv[1], int(sys.argv[2])
+percentiles = {percentiles!r}
+devnull = open("/dev/null", "w")
+for name in ["localhost"] + sys.argv[3:]:
+    samples, rc = [], 0
+    for _ in range(lookups):
+        start = time.time()
+        rc = subprocess.call([getent, "hosts", name], stdout=devnull)
+        samples.append((time.time() - start) * 1000)
+    samples.sort()
+    values = [samples[0]] + [
+        samples[min(len(samples) - 1, len(samples) * pct // 100)]
+        for pct in percentiles] + [samples[-1]]
+    print("LOOKUP %s %d %s" % (name, rc,
+                               " ".join("%.3f" % value for value in values)))
+"""
+
+
+class LookupLatency(object):
+    """
+    Latency percentiles of resolving one name on one node.
+    """
+    __slots__ = ("name", "rc", "min_ms", "percentiles_ms", "max_ms")
+
+    def __init__(self, name, rc, min_ms, percentiles_ms, max_ms):
+        """
+        Args:
+            name (str): Resolved name.
+            rc (int): Return code of the last getent call.
+            min_ms (float): Fastest lookup.
+            percentiles_ms (dict): Latency per percentile in PERCENTILES.
+            max_ms (float): Slowest lookup.
+        """
+        self.name = name
+        self.rc = rc
+        self.min_ms = min_ms
+        self.percentiles_ms = percentiles_ms
+        self.max_ms = max_ms
+
+
+def get_lookup_cmd(names, lookups=DEFAULT_LOOKUPS):
+    """
+    Description:
+        Returns the command timing the resolution of names on a node.
+
+    Args:
+        names (list): Names to resolve.
+
+    Kwargs:
+        lookups (int): Number of times each name is resolved.
+
+    Returns:
+        str. The command.
+    """
+    script = LOOKUP_SCRIPT.format(percentiles=PERCENTILES)
+    return get_helper_cmd(HELPER_NAME, script,
+                          [GETENT_PATH, lookups] + list(names))
+
+
+def parse_lookup_output(lines):
+    """
+    Description:
+        Parses the output of the lookup command.
+
+    Args:
+        lines (list): stdout of the lookup command.
+
+    Returns:
+        dict. LookupLatency keyed by name, including "localhost".
+    """
+    latencies = {}
+    for line in lines:
+        fields = line.split()
+        if fields[:1] != ["LOOKUP"]:
+            continue
+        values = [float(value) for value in fields[3:]]
+        latencies[fields[1]] = LookupLatency(
+            fields[1], int(fields[2]), values[0],
+            dict(zip(PERCENTILES, values[1:-1])), values[-1])
+    return latencies
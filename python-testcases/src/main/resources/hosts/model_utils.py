@@ -0,0 +1,240 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   In-memory copy of the LITP model built from one recursive
+            litp show, indexed by item type.
+"""
+
+INHERITED_MARKER = " [*]"
+LITP_PATH = "/usr/bin/litp"
+
+
+def get_show_cmd(paths):
+    """
+    Description:
+        Returns one command dumping several subtrees of the model with
+        a recursive litp show each, so that they are read with a single
+        remote call. The output of the command can be parsed with
+        ModelTree.
+
+    Args:
+        paths (list): Paths of the subtrees.
+
+    Returns:
+        str. The command.
+    """
+    return " && ".join("{0} show -p {1} -r".format(LITP_PATH, path)
+                       for path in paths)
+
+
+class ModelItem(object):
+    """
+    A single item of the LITP model.
+    """
+    __slots__ = ("path", "item_type", "state", "props")
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Path of the item in the model.
+        """
+        self.path = path
+        self.item_type = None
+        self.state = None
+        self.props = {}
+
+    @property
+    def parent(self):
+        """
+        str. Path of the parent item, or None for the root item.
+        """
+        if self.path == "/":
+            return None
+        return self.path.rsplit("/", 1)[0] or "/"
+
+
+class ModelTree(object):
+    """
+    Parsed output of "litp show -p <path> -r".
+    """
+
+    def __init__(self, lines):
+        """
+        Args:
+            lines (list): stdout of a recursive litp show.
+        """
+        self.items = {}
+        self.paths = []
+        self._by_type = {}
+        self._children = {}
+
+        item = None
+        in_props = False
+        for line in lines:
+            if not line.strip():
+                continue
+            if line.startswith("/"):
+                item = self._add_item(ModelItem(line.strip()))
+                in_props = False
+                continue
+            if item is None:
+                continue
+
+            key, _, value = line.strip().partition(":")
+            value = value.strip()
+            indent = len(line) - len(line.lstrip())
+            if in_props and indent > 4:
+                if value.endswith(INHERITED_MARKER):
+                    value = value[:-len(INHERITED_MARKER)]
+                item.props[key] = value
+                continue
+
+            in_props = key == "properties"
+            if key == "type":
+                item.item_type = value
+                self._by_type.setdefault(value, []).append(item.path)
+            elif key == "state":
+                item.state = value
+
+    def __contains__(self, path):
+        return (path.rstrip("/") or "/") in self.items
+
+    def _add_item(self, item):
+        """
+        Adds an item to the path and parent indexes.
+        """
+        self.items[item.path] = item
+        self.paths.append(item.path)
+        if item.parent is not None:
+            self._children.setdefault(item.parent, []).append(item.path)
+        return item
+
+    def replace_subtrees(self, roots, fresh):
+        """
+        Description:
+            Replaces subtrees of the tree with a newer dump of them, so
+            that only the part of the model that changed is read again.
+
+        Args:
+            roots (list): Paths of the subtrees, none under another.
+            fresh (ModelTree): Parsed recursive litp show of the subtrees.
+        """
+        for root in roots:
+            position = None
+            kept = []
+            for path in self.paths:
+                if self._is_under(path, root):
+                    if position is None:
+                        position = len(kept)
+                    del self.items[path]
+                else:
+                    kept.append(path)
+            if position is None:
+                position = len(kept)
+            new_paths = [path for path in fresh.paths
+                         if self._is_under(path, root)]
+            for path in new_paths:
+                self.items[path] = fresh.items[path]
+            self.paths = kept[:position] + new_paths + kept[position:]
+
+        self._by_type = {}
+        self._children = {}
+        for path in self.paths:
+            item = self.items[path]
+            self._by_type.setdefault(item.item_type, []).append(path)
+            if item.parent is not None:
+                self._children.setdefault(item.parent, []).append(path)
+
+    @staticmethod
+    def _is_under(path, root):
+        """
+        Returns True if path is root or a descendant of root.
+        """
+        root = root.rstrip("/")
+        return path == root or path.startswith(root + "/") or root == ""
+
+    def find(self, path, resource, rtn_type_children=True):
+        """
+        Description:
+            Equivalent of GenericTest.find answered from the tree.
+
+        Args:
+            path (str): Path to search under.
+            resource (str): Item type to search for.
+
+        Kwargs:
+            rtn_type_children (bool): If True returns the paths of the
+                                      items of the type, otherwise the
+                                      paths of the collections of that
+                                      type. Default is True.
+
+        Returns:
+            list. Matching paths in model order.
+        """
+        if not rtn_type_children:
+            resource = "collection-of-{0}".format(resource)
+        return [item_path for item_path in self._by_type.get(resource, [])
+                if self._is_under(item_path, path)]
+
+    def find_children_of_collect(self, path, resource):
+        """
+        Description:
+            Equivalent of GenericTest.find_children_of_collect answered
+            from the tree.
+
+        Args:
+            path (str): Path to search under.
+            resource (str): Item type the collection is a collection of,
+                            either directly or through its base type,
+                            e.g. "cluster" for collection-of-cluster-base.
+
+        Returns:
+            list. Paths of the children of matching collections.
+        """
+        collection_type = "collection-of-{0}".format(resource)
+        collection_types = (collection_type,
+                            "{0}-base".format(collection_type))
+        children = []
+        for item_path in self.paths:
+            if self.items[item_path].item_type in collection_types and \
+                    self._is_under(item_path, path):
+                children.extend(self._children.get(item_path, []))
+        return children
+
+    def get_props(self, path):
+        """
+        Description:
+            Returns the properties of an item.
+
+        Args:
+            path (str): Path of the item.
+
+        Returns:
+            dict. Item properties, or None if the item is not in the tree.
+        """
+        item = self.items.get(path.rstrip("/") or "/")
+        if item is None:
+            return None
+        return dict(item.props)
+
+    def get_props_under(self, path):
+        """
+        Description:
+            Returns the properties of an item and of all its descendants.
+
+        Args:
+            path (str): Path of the subtree.
+
+        Returns:
+            dict. Item properties keyed by item path.
+        """
+        return dict((item_path, dict(self.items[item_path].props))
+                    for item_path in self.paths
+                    if self._is_under(item_path, path))
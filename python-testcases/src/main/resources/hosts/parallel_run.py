@@ -0,0 +1,198 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Runs the hosts test sets concurrently against one deployment.
+            Each test set runs in its own nosetests process, and each
+            running test takes an alias namespace from a pool as large as
+            the number of jobs, see alias_namespace. The tests take turns
+            to change the model and run plans. Tests that cannot share the
+            deployment, tagged 'serial', are left out of the concurrent
+            run and run afterwards, one at a time, in a single nosetests
+            process.
+
+            Usage:
+                parallel_run.py [--jobs <n>] [--attr <tag>]
+                    [--report-dir <dir>] [--nosetests <path>]
+                    [<test set> ...]
+
+            By default every testset_*.py in this directory is run with
+            the 'all' attribute. The output and the xunit report of each
+            test set, and of the serial run, are written to the report
+            directory. Only the
+            standard library is used, so that the runner works wherever
+            the suite is started.
+"""
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import time
+from alias_namespace import NAMESPACES_ENV_VAR, STATE_FILE_ENV_VAR
+
+TESTSET_PATTERN = "testset_*.py"
+DEFAULT_JOBS = 2
+DEFAULT_REPORT_DIR = "/tmp/litp_hosts_parallel"
+RUN_TAG = "all"
+SERIAL_TAG = "serial"
+# Name of the output and report of the serial run
+SERIAL_RUN = "serial"
+NOSETESTS_PATH = "nosetests"
+POLL_INTERVAL_SECS = 1
+
+
+def find_test_sets(directory):
+    """
+    Description:
+        Finds the test set modules of a directory.
+
+    Args:
+        directory (str): Directory of the test sets.
+
+    Returns:
+        list. Module names, e.g. "testset_story54".
+    """
+    return [os.path.splitext(os.path.basename(path))[0] for path
+            in sorted(glob.glob(os.path.join(directory, TESTSET_PATTERN)))]
+
+
+def get_nose_cmd(test_sets, attr, report_file, nosetests=NOSETESTS_PATH):
+    """
+    Description:
+        Returns the command running test sets in one nosetests process.
+
+    Args:
+        test_sets (list): Module names of the test sets.
+        attr (str): Attribute expression selecting the tests, e.g.
+                    "all,!serial".
+        report_file (str): Path of the xunit report.
+
+    Kwargs:
+        nosetests (str): nosetests executable.
+
+    Returns:
+        list. The command arguments.
+    """
+    return [nosetests, "-v", "-a", attr, "--with-xunit", "--xunit-file",
+            report_file] + [test_set + ".py" for test_set in test_sets]
+
+
+def run_jobs(cmds, jobs, env, report_dir, directory):
+    """
+    Description:
+        Runs commands, at most jobs of them at a time, writing the output
+        of each to <name>.log in the report directory.
+
+    Args:
+        cmds (list): (name, command arguments) per command.
+        jobs (int): Number of commands run at the same time.
+        env (dict): Environment of the commands.
+        report_dir (str): Directory of the output.
+        directory (str): Working directory of the commands.
+
+    Returns:
+        dict. (return code, duration in seconds) keyed by name.
+    """
+    pending = list(cmds)
+    running = {}
+    results = {}
+    while pending or running:
+        while pending and len(running) < jobs:
+            name, cmd = pending.pop(0)
+            output = open(os.path.join(report_dir, name + ".log"), "w")
+            process = subprocess.Popen(cmd, cwd=directory, env=env,
+                                       stdout=output,
+                                       stderr=subprocess.STDOUT)
+            running[name] = (process, output, time.time())
+
+        for name, (process, output, start) in list(running.items()):
+            if process.poll() is None:
+                continue
+            output.close()
+            del running[name]
+            results[name] = (process.returncode,
+                             round(time.time() - start, 1))
+            print("{0}: {1} in {2}s".format(
+                name, "passed" if process.returncode == 0 else "FAILED",
+                results[name][1]))
+            sys.stdout.flush()
+        time.sleep(POLL_INTERVAL_SECS)
+    return results
+
+
+def run(test_sets, jobs, attr, report_dir, directory,
+        nosetests=NOSETESTS_PATH):
+    """
+    Description:
+        Runs test sets, at most jobs of them at a time, each with its
+        tests in their own alias namespaces, then the 'serial' tests of
+        all of them one at a time, outside any namespace.
+
+    Args:
+        test_sets (list): Module names of the test sets.
+        jobs (int): Number of test sets run at the same time.
+        attr (str): Attribute selecting the tests.
+        report_dir (str): Directory of the output and reports.
+        directory (str): Directory of the test sets.
+
+    Kwargs:
+        nosetests (str): nosetests executable.
+
+    Returns:
+        dict. (return code, duration in seconds) keyed by test set, and
+        by SERIAL_RUN for the serial tests.
+    """
+    env = dict(os.environ)
+    env[NAMESPACES_ENV_VAR] = str(jobs)
+    env.setdefault(STATE_FILE_ENV_VAR,
+                   os.path.join(report_dir, "namespaces.json"))
+    concurrent_attr = "{0},!{1}".format(attr, SERIAL_TAG)
+    results = run_jobs(
+        [(test_set, get_nose_cmd(
+            [test_set], concurrent_attr,
+            os.path.join(report_dir, test_set + ".xml"), nosetests))
+         for test_set in test_sets], jobs, env, report_dir, directory)
+
+    env = dict(os.environ)
+    env.pop(NAMESPACES_ENV_VAR, None)
+    serial_attr = "{0},{1}".format(attr, SERIAL_TAG)
+    results.update(run_jobs(
+        [(SERIAL_RUN, get_nose_cmd(
+            test_sets, serial_attr,
+            os.path.join(report_dir, SERIAL_RUN + ".xml"), nosetests))],
+        1, env, report_dir, directory))
+    return results
+
+
+def main(argv):
+    """
+    Description:
+        Command line entry point, see the module description.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Parallel hosts test run")
+    parser.add_argument("test_sets", nargs="*")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS)
+    parser.add_argument("--attr", default=RUN_TAG)
+    parser.add_argument("--report-dir", default=DEFAULT_REPORT_DIR)
+    parser.add_argument("--nosetests", default=NOSETESTS_PATH)
+    args = parser.parse_args(argv[1:])
+
+    if not os.path.isdir(args.report_dir):
+        os.makedirs(args.report_dir)
+    test_sets = [os.path.splitext(os.path.basename(test_set))[0]
+                 for test_set in args.test_sets] or find_test_sets(directory)
+    results = run(test_sets, args.jobs, args.attr, args.report_dir,
+                  directory, args.nosetests)
+    return 1 if [rc for rc, _ in results.values() if rc != 0] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
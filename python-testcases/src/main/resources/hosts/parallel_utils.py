@@ -0,0 +1,101 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Thread pool fan-out for running the same helper against
+            several nodes at once.
+"""
+import sys
+import traceback
+from multiprocessing.pool import ThreadPool
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class ParallelExecutionError(AssertionError):
+    """
+    Raised when the call failed for one or more items. Subclasses
+    AssertionError so a failing node is reported as a test failure.
+    """
+
+    def __init__(self, errors):
+        """
+        Args:
+            errors (list): (item, formatted traceback) for every failed
+                           item, in input order.
+        """
+        self.errors = errors
+        message = "{0} call(s) failed:\n".format(len(errors))
+        message += "\n".join("[{0}] {1}".format(item, error)
+                             for item, error in errors)
+        super(ParallelExecutionError, self).__init__(message)
+
+
+def _call(func, item, args, kwargs):
+    """
+    Description:
+        Runs func for a single item and captures any exception so
+        that one failing item does not hide the result of the others.
+
+    Returns:
+        tuple. (True, result) on success, (False, traceback) on error.
+    """
+    try:
+        return True, func(item, *args, **kwargs)
+    except Exception:  # pylint: disable=broad-except
+        exc_type, exc_value, exc_tb = sys.exc_info()
+        return False, "".join(traceback.format_exception(exc_type,
+                                                         exc_value, exc_tb))
+
+
+def run_in_parallel(func, items, *args, **kwargs):
+    """
+    Description:
+        Calls func(item, *args, **kwargs) for every item using a
+        bounded pool of threads.
+
+    Args:
+        func (callable): Function to run, taking the item as its first
+                         argument.
+        items (list): Items, usually node filenames, to run func for.
+
+    Kwargs:
+        max_workers (int): Maximum number of concurrent calls.
+                           Default is DEFAULT_MAX_WORKERS.
+        Any other positional and keyword arguments are passed to func.
+
+    Returns:
+        list. Result of func for each item, in the order of items.
+
+    Raises:
+        ParallelExecutionError if func raised for any item. Every item
+        is still run to completion before the errors are raised.
+    """
+    max_workers = kwargs.pop("max_workers", DEFAULT_MAX_WORKERS)
+    items = list(items)
+    if not items:
+        return []
+
+    if len(items) == 1 or max_workers <= 1:
+        outcomes = [_call(func, item, args, kwargs) for item in items]
+    else:
+        pool = ThreadPool(min(max_workers, len(items)))
+        try:
+            outcomes = pool.map(lambda item: _call(func, item, args, kwargs),
+                                items)
+        finally:
+            pool.close()
+            pool.join()
+
+    errors = [(item, outcome) for item, (success, outcome)
+              in zip(items, outcomes) if not success]
+    if errors:
+        raise ParallelExecutionError(errors)
+
+    return [outcome for _, outcome in outcomes]
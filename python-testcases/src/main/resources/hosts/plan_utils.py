@@ -0,0 +1,162 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Watching a running plan from the MS itself, so the test
+            learns about task transitions and the final plan state as
+            soon as they happen instead of on its next poll.
+"""
+import test_constants as const
+from hosts_utils import get_helper_cmd
+
+HELPER_NAME = "plan_watch"
+PLAN_STATES = {const.PLAN_COMPLETE: "Successful",
+               const.PLAN_FAILED: "Failed",
+               const.PLAN_STOPPED: "Stopped"}
+TERMINAL_PLAN_STATES = ("Successful", "Failed", "Stopped", "Invalid")
+TASK_STATES = ("Initial", "Running", "Success", "Failed", "Stopped")
+
+# Runs on the MS. Polls "litp show_plan" locally and prints one line per
+# task or plan state transition, exiting as soon as the plan reaches a
+# terminal state or, if asked to, on the first failed task.
+WATCH_SCRIPT = """
+import subprocess, sys, time
+timeout, interval, fail_fast = float(sys.argv[1]), float(sys.argv[2]), \\
+    sys.argv[3] == "1"
+terminal = {terminal!r}
+task_states = {task_states!r}
+start = time.time()
+seen = {{}}
+plan_state = None
+while time.time() - start < timeout:
+    out = subprocess.Popen(["litp", "show_plan"], stdout=subprocess.PIPE,
+                           stderr=subprocess.STDOUT).communicate()[0]
+    now = time.time() - start
+    phase, index, failed = 0, 0, False
+    for line in out.splitlines():
+        fields = line.split(None, 1)
+        if line.startswith("Phase ") and len(fields) == 2:
+            phase, index = int(fields[1]), 0
+        elif line.startswith("Plan Status:"):
+            state = line.split(":", 1)[1].strip()
+            if state != plan_state:
+                plan_state = state
+                print("PLAN %.3f %s" % (now, state))
+        elif len(fields) == 2 and fields[0] in task_states and \\
+                fields[1].startswith("/"):
+            index += 1
+            if seen.get((phase, index)) != fields[0]:
+                seen[(phase, index)] = fields[0]
+                print("TASK %.3f %d %d %s %s" % (now, phase, index,
+                                                 fields[0], fields[1]))
+            failed = failed or fields[0] == "Failed"
+    sys.stdout.flush()
+    if plan_state in terminal or (fail_fast and failed):
+        break
+    time.sleep(interval)
+"""
+
+
+def get_watch_plan_cmd(timeout_secs, interval_secs=1, fail_fast=True):
+    """
+    Description:
+        Returns the command that watches the current plan on the MS.
+
+    Args:
+        timeout_secs (int): Maximum time the command watches the plan.
+
+    Kwargs:
+        interval_secs (float): Time between two local show_plan calls.
+        fail_fast (bool): If True, stop watching on the first failed task
+                          instead of waiting for the plan to finish.
+
+    Returns:
+        str. The command to run on the MS.
+    """
+    script = WATCH_SCRIPT.format(terminal=TERMINAL_PLAN_STATES,
+                                 task_states=TASK_STATES)
+    return get_helper_cmd(HELPER_NAME, script,
+                          [timeout_secs, interval_secs, 1 if fail_fast else 0])
+
+
+class PlanWatchResult(object):
+    """
+    Transitions reported by the watch command for one plan.
+    """
+
+    def __init__(self):
+        self.plan_state = None
+        self.elapsed = 0.0
+        # (time, phase, task number, state, item path)
+        self.task_events = []
+        self._task_states = {}
+
+    def add_output(self, lines, offset=0.0):
+        """
+        Description:
+            Adds the output of one run of the watch command.
+
+        Args:
+            lines (list): stdout of the watch command.
+
+        Kwargs:
+            offset (float): Time at which this run of the command started,
+                            relative to the first run.
+        """
+        for line in lines:
+            fields = line.split(None, 5)
+            if fields[:1] == ["PLAN"] and len(fields) >= 3:
+                self.elapsed = offset + float(fields[1])
+                self.plan_state = fields[2]
+            elif fields[:1] == ["TASK"] and len(fields) == 6:
+                event_time = offset + float(fields[1])
+                self.elapsed = max(self.elapsed, event_time)
+                task = (int(fields[2]), int(fields[3]))
+                # Each run of the command reports every task once more
+                if self._task_states.get(task) == fields[4]:
+                    continue
+                self._task_states[task] = fields[4]
+                self.task_events.append((event_time, task[0], task[1],
+                                         fields[4], fields[5]))
+
+    @property
+    def finished(self):
+        """
+        bool. True once the plan reached a terminal state.
+        """
+        return self.plan_state in TERMINAL_PLAN_STATES
+
+    @property
+    def failed_tasks(self):
+        """
+        list. Item paths of the tasks that failed, in failure order.
+        """
+        return [event[4] for event in self.task_events
+                if event[3] == "Failed"]
+
+    def get_phase_durations(self):
+        """
+        Description:
+            Calculates how long each phase took, from the first task of
+            the phase leaving Initial to the last task of the phase
+            finishing.
+
+        Returns:
+            dict. Duration in seconds per phase number.
+        """
+        started = {}
+        ended = {}
+        for event_time, phase, _, state, _ in self.task_events:
+            if state == "Initial":
+                continue
+            started.setdefault(phase, event_time)
+            if state != "Running":
+                ended[phase] = event_time
+        return dict((phase, round(ended.get(phase, self.elapsed) - start, 3))
+                    for phase, start in started.items())
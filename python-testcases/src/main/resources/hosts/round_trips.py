@@ -0,0 +1,253 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Counts of the remote operations of a test, per kind and per
+            helper, a decorator declaring the budget a test must stay
+            within and a decorator naming the helpers operations are
+            counted for.
+"""
+import contextlib
+import functools
+import threading
+
+SSH = "ssh"
+CLI = "cli"
+FIND = "find"
+KINDS = (SSH, CLI, FIND)
+# Suffix of the limits allowed once per managed node, e.g. "ssh_per_node"
+PER_NODE_SUFFIX = "_per_node"
+
+# Kind of each GenericTest method counted as a remote operation
+OPERATION_KINDS = {"run_command": SSH,
+                   "backup_file": SSH,
+                   "create_file_on_node": SSH,
+                   "del_file_after_run": SSH,
+                   "get_file_len": SSH,
+                   "wait_for_log_msg": SSH,
+                   "run_puppet_once": SSH,
+                   "is_ip_pingable": SSH,
+                   "poweroff_peer_node": SSH,
+                   "get_item_state": CLI,
+                   "run_and_check_plan": CLI,
+                   "find": FIND,
+                   "find_children_of_collect": FIND,
+                   "get_props_from_url": FIND}
+
+
+def get_kind(name):
+    """
+    Description:
+        Returns the kind of remote operation a GenericTest method is.
+
+    Args:
+        name (str): Method name.
+
+    Returns:
+        str. One of KINDS, or None if the method is not counted.
+    """
+    if name.startswith("execute_cli_"):
+        return CLI
+    return OPERATION_KINDS.get(name)
+
+
+def round_trip_budget(warn_only=False, **limits):
+    """
+    Description:
+        Declares the most remote operations the decorated test may make,
+        not counting setUp and tearDown. For use on HostsGenericTest test
+        methods, next to @attr.
+
+    Kwargs:
+        warn_only (bool): If True, log a warning instead of failing the
+                          test when the budget is exceeded.
+        limits (int): Limits per kind ("ssh", "cli", "find") and/or in
+                      "total", plus an allowance per managed node for
+                      the operations made on every node, e.g.
+                      ssh=8, ssh_per_node=12.
+
+    Returns:
+        callable. The decorator.
+
+    Raises:
+        ValueError. If a limit is not for a known kind.
+    """
+    unknown = set(limit.rsplit(PER_NODE_SUFFIX, 1)[0]
+                  if limit.endswith(PER_NODE_SUFFIX) else limit
+                  for limit in limits) - set(KINDS + ("total",))
+    if unknown:
+        raise ValueError("Unknown round trip kinds: {0}".format(
+            sorted(unknown)))
+
+    def decorator(test_method):
+        """ Wraps the test method with the budget check. """
+        @functools.wraps(test_method)
+        def wrapper(test, *args, **kwargs):
+            """ Runs the test method, then checks its budget. """
+            before = test.round_trips.get_totals()
+            result = test_method(test, *args, **kwargs)
+            test.check_round_trip_budget(limits, before, warn_only)
+            return result
+        wrapper.round_trip_budget = dict(limits)
+        return wrapper
+    return decorator
+
+
+def counted_helper(method):
+    """
+    Description:
+        Counts the remote operations of the decorated HostsGenericTest
+        method for it, by name, unless it is called by another counted
+        helper, whose operations they then are.
+
+    Args:
+        method (callable): The helper method.
+
+    Returns:
+        callable. The wrapped method.
+    """
+    @functools.wraps(method)
+    def wrapper(test, *args, **kwargs):
+        """ Runs the method as the current helper. """
+        with test.round_trips.helper(method.__name__):
+            return method(test, *args, **kwargs)
+    return wrapper
+
+
+def get_limits(limits, node_count):
+    """
+    Description:
+        Works out the limits of a budget for a deployment.
+
+    Args:
+        limits (dict): Limits as given to round_trip_budget.
+        node_count (int): Number of managed nodes.
+
+    Returns:
+        dict. Most operations allowed per kind or in total.
+    """
+    resolved = {}
+    for name, limit in limits.items():
+        if name.endswith(PER_NODE_SUFFIX):
+            name = name[:-len(PER_NODE_SUFFIX)]
+            limit *= node_count
+        resolved[name] = resolved.get(name, 0) + limit
+    return resolved
+
+
+class RoundTripCounter(object):
+    """
+    Remote operations of one test, per kind and per helper. The helper
+    of an operation is the outermost counted_helper it was made by, e.g.
+    "check_etc_hosts_file", or the operation itself when the test calls
+    it directly. When an operation is made of others, e.g. a CLI call
+    running a command, only the outer operation is counted.
+    """
+
+    def __init__(self):
+        self.by_helper = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def get_helper(self):
+        """
+        Description:
+            Returns the helper the operations of this thread are counted
+            for.
+
+        Returns:
+            str. Name of the helper, or None outside any helper.
+        """
+        return getattr(self._local, "helper", None)
+
+    @contextlib.contextmanager
+    def helper(self, name):
+        """
+        Description:
+            Counts the operations of the enclosed block for the given
+            helper, unless they are already counted for another one.
+            Also used to count the operations of another thread for the
+            helper that started it.
+
+        Args:
+            name (str): Helper name, see get_helper. None keeps the
+                        current helper.
+        """
+        previous = self.get_helper()
+        if previous is None:
+            self._local.helper = name
+        try:
+            yield
+        finally:
+            self._local.helper = previous
+
+    def wrap(self, name, func):
+        """
+        Description:
+            Returns func, counted as an operation of the kind of the
+            method name if it is a remote operation.
+
+        Args:
+            name (str): GenericTest method name.
+            func (callable): The method.
+
+        Returns:
+            callable. The counted function.
+        """
+        kind = get_kind(name)
+        if kind is None:
+            return func
+
+        def counted(*args, **kwargs):
+            """ Counts the call unless it is part of another operation. """
+            depth = getattr(self._local, "depth", 0)
+            if not depth:
+                self.add(kind, self.get_helper() or name)
+            self._local.depth = depth + 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.depth = depth
+        return counted
+
+    def add(self, kind, helper):
+        """
+        Description:
+            Counts one operation.
+
+        Args:
+            kind (str): One of KINDS.
+            helper (str): Helper that made the operation.
+        """
+        with self._lock:
+            counts = self.by_helper.setdefault(
+                helper, dict((each, 0) for each in KINDS))
+            counts[kind] += 1
+
+    def get_totals(self):
+        """
+        Returns:
+            dict. Operations per kind, and in "total".
+        """
+        with self._lock:
+            totals = dict((kind, sum(counts[kind] for counts
+                                     in self.by_helper.values()))
+                          for kind in KINDS)
+        totals["total"] = sum(totals.values())
+        return totals
+
+    def get_profile(self):
+        """
+        Returns:
+            dict. Totals and counts per helper, for the test profile.
+        """
+        with self._lock:
+            by_helper = dict((helper, dict(counts))
+                             for helper, counts in self.by_helper.items())
+        return {"totals": self.get_totals(), "by_helper": by_helper}
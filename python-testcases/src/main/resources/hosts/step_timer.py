@@ -0,0 +1,187 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Per step timing of a test. Steps start at the "# N. ...",
+            "N. ..." and "N-M. ..." log markers the tests already write,
+            and each step records its wall clock time, remote round trips
+            and bytes transferred.
+"""
+import contextlib
+import json
+import os
+import re
+import threading
+import time
+
+# "# 1. Title", "1. Title" or "4-6. Title" for a step covering steps 4 to 6
+STEP_MARKER = re.compile(
+    r"^(?:#\s*)?(\d+)(?:\s*-\s*(\d+))?\.(?!\d)\s*(.*)$", re.DOTALL)
+
+
+class StepTimer(object):
+    """
+    Timings of the steps of one test.
+    """
+
+    def __init__(self, test_id):
+        """
+        Args:
+            test_id (str): Id of the test, e.g. "module.Class.test_01".
+        """
+        self.test_id = test_id
+        self.started = time.time()
+        self.steps = []
+        self._current = None
+        self._lock = threading.Lock()
+
+    def start_step(self, number, title, last_number=None):
+        """
+        Description:
+            Ends the current step and starts a new one.
+
+        Args:
+            number (int): Step number, None for unnumbered phases such as
+                          setUp.
+            title (str): Step title.
+
+        Kwargs:
+            last_number (int): Number of the last step covered, if the step
+                               covers a range of steps. Default is number.
+        """
+        now = time.time()
+        with self._lock:
+            self._end_step(now)
+            if last_number is None:
+                last_number = number
+            self._current = {"number": number,
+                             "last_number": last_number,
+                             "title": " ".join(title.split()),
+                             "start_secs": round(now - self.started, 3),
+                             "round_trips": 0,
+                             "bytes_sent": 0,
+                             "bytes_received": 0,
+                             "_start": now}
+
+    def _end_step(self, now):
+        """
+        Closes the current step, if any.
+        """
+        if self._current is not None:
+            step = self._current
+            step["duration_secs"] = round(now - step.pop("_start"), 3)
+            self.steps.append(step)
+            self._current = None
+
+    def mark(self, message):
+        """
+        Description:
+            Starts a new step if message is a step marker, e.g.
+            "# N. ...", "N. ..." or "N-M. ...".
+
+        Args:
+            message (str): Logged message.
+        """
+        match = STEP_MARKER.match(message.strip())
+        if match:
+            first, last, title = match.groups()
+            self.start_step(int(first), title,
+                            int(last) if last is not None else None)
+
+    @contextlib.contextmanager
+    def step(self, title, number=None):
+        """
+        Description:
+            Times the enclosed block as a step of its own.
+
+        Args:
+            title (str): Step title.
+
+        Kwargs:
+            number (int): Step number.
+        """
+        self.start_step(number, title)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._end_step(time.time())
+
+    def record_round_trip(self, cmd, stdout=(), stderr=()):
+        """
+        Description:
+            Adds one remote command to the current step.
+
+        Args:
+            cmd (str): Command sent to the node.
+
+        Kwargs:
+            stdout (list): stdout lines received.
+            stderr (list): stderr lines received.
+        """
+        received = sum(len(line) + 1 for line in stdout) + \
+            sum(len(line) + 1 for line in stderr)
+        with self._lock:
+            if self._current is None:
+                return
+            self._current["round_trips"] += 1
+            self._current["bytes_sent"] += len(cmd)
+            self._current["bytes_received"] += received
+
+    def finish(self):
+        """
+        Description:
+            Ends the current step.
+        """
+        with self._lock:
+            self._end_step(time.time())
+
+    def get_profile(self, **extra):
+        """
+        Description:
+            Returns the profile of the test.
+
+        Kwargs:
+            extra: Additional top level values, e.g. plan phase durations.
+
+        Returns:
+            dict. The profile.
+        """
+        profile = {"test": self.test_id,
+                   "started": time.strftime("%Y-%m-%dT%H:%M:%S",
+                                            time.localtime(self.started)),
+                   "total_secs": round(sum(step["duration_secs"]
+                                           for step in self.steps), 3),
+                   "round_trips": sum(step["round_trips"]
+                                      for step in self.steps),
+                   "steps": self.steps}
+        profile.update(extra)
+        return profile
+
+    def write_profile(self, directory, **extra):
+        """
+        Description:
+            Writes the profile as <test id>.json in directory.
+
+        Args:
+            directory (str): Output directory, created if missing.
+
+        Kwargs:
+            extra: Additional top level values, e.g. plan phase durations.
+
+        Returns:
+            str. Path of the profile.
+        """
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        path = os.path.join(directory, "{0}.json".format(self.test_id))
+        with open(path, "w") as profile_file:
+            json.dump(self.get_profile(**extra), profile_file, indent=2,
+                      sort_keys=True)
+        return path
@@ -0,0 +1,251 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Benchmark of how LITP hosts handling scales with the number
+            of cluster-level and node-level aliases. Not part of the
+            'all' run: select with the 'bench' or 'alias_scale' attributes.
+"""
+import time
+from litp_generic_test import attr
+from hosts_base import HostsGenericTest
+import test_constants as const
+import alias_utils
+import hosts_verifier
+from round_trips import counted_helper
+
+BENCH_CONFIG_ID = "bench_alias_config"
+RESULTS_FILE = "alias_scale_results.csv"
+RESULTS_COLUMNS = ("date", "nodes", "aliases", "cluster_aliases",
+                   "node_aliases", "load_secs", "create_plan_secs",
+                   "run_plan_secs", "propagation_secs", "node",
+                   "hosts_file_bytes")
+
+
+class AliasScaleBench(HostsGenericTest):
+    """
+        Measures plan times, /etc/hosts propagation time and /etc/hosts
+        size for growing numbers of aliases
+    """
+
+    def setUp(self):
+        """
+            Runs before every single test
+        """
+        super(AliasScaleBench, self).setUp()
+        self.ms_node = self.get_management_node_filename()
+        self.peer_nodes = self.get_managed_node_filenames()
+        self.all_nodes = [self.ms_node] + self.peer_nodes
+        cluster_path = self.find(self.ms_node, "/deployments",
+                                 "collection-of-cluster-base")[0]
+        self.cluster_config_path = self.find(
+            self.ms_node, cluster_path, "collection-of-cluster-config")[0]
+        # Node-level aliases are spread over the MS and the peer nodes
+        self.node_config_paths = [(self.ms_node, "/ms/configs")] + [
+            (node, "{0}/configs".format(
+                self.get_node_url_from_filename(self.ms_node, node)))
+            for node in self.peer_nodes]
+
+        self.snapshot_file_on_nodes(self.all_nodes, const.ETC_HOSTS)
+
+    def tearDown(self):
+        """
+            Runs after every single test
+        """
+        super(AliasScaleBench, self).tearDown()
+
+    @counted_helper
+    def get_hosts_file_sizes(self, nodes):
+        """
+        Description:
+            Returns the size of /etc/hosts on each node.
+        Args:
+            nodes (list): Nodes to check.
+        Returns:
+            list. Size in bytes per node, in the order given.
+        """
+        cmd = "/usr/bin/stat -c %s {0}".format(const.ETC_HOSTS)
+        results = self.run_on_nodes(nodes, self.run_command, cmd,
+                                    default_asserts=True)
+        return [int(stdout[0]) for stdout, _, _ in results]
+
+    def run_alias_scale(self, alias_count):
+        """
+        Description:
+            Creates alias_count aliases, half at cluster level and half
+            spread over the node-level configs, every fourth with an IPv6
+            address and prefix. Times the load, create plan, run plan and
+            /etc/hosts propagation to each node, then removes the aliases
+            again.
+        Args:
+            alias_count (int): Total number of aliases to create.
+        """
+        cluster_count = alias_count // 2
+        node_count = alias_count - cluster_count
+        plan_timeout_mins = max(10, alias_count // 100)
+        expected_names = dict((node, []) for node in self.all_nodes)
+        created_configs = []
+
+        try:
+            self.log("info", "# 1. Generate and load {0} cluster-level and "
+                             "{1} node-level aliases".format(cluster_count,
+                                                             node_count))
+            start = time.time()
+            if cluster_count:
+                aliases = alias_utils.AliasRange(cluster_count,
+                                                 "bench_cluster")
+                self.create_aliases(self.cluster_config_path, aliases,
+                                    config_id=BENCH_CONFIG_ID)
+                created_configs.append("{0}/{1}".format(
+                    self.cluster_config_path, BENCH_CONFIG_ID))
+                for node in self.peer_nodes:
+                    expected_names[node].append(aliases[-1].alias_names)
+
+            per_node, extra = divmod(node_count, len(self.node_config_paths))
+            first_index = 0
+            for position, (node, config_path) in enumerate(
+                    self.node_config_paths):
+                count = per_node + (1 if position < extra else 0)
+                if not count:
+                    continue
+                aliases = alias_utils.AliasRange(count, "bench_node",
+                                                 first_index=first_index)
+                first_index += count
+                self.create_aliases(config_path, aliases,
+                                    config_type=alias_utils.ALIAS_NODE_CONFIG,
+                                    config_id=BENCH_CONFIG_ID)
+                created_configs.append("{0}/{1}".format(config_path,
+                                                        BENCH_CONFIG_ID))
+                expected_names[node].append(aliases[-1].alias_names)
+            load_secs = time.time() - start
+
+            self.log("info", "# 2. Create plan")
+            start = time.time()
+            self.execute_cli_createplan_cmd(self.ms_node)
+            create_plan_secs = time.time() - start
+
+            self.log("info", "# 3. Run plan")
+            start = time.time()
+            self.execute_cli_runplan_cmd(self.ms_node)
+            self.wait_for_plan(self.ms_node, const.PLAN_COMPLETE,
+                               plan_timeout_mins)
+            run_plan_secs = time.time() - start
+
+            self.log("info", "# 4. Wait for the last alias of each config "
+                             "to be in /etc/hosts on every node")
+            expected = dict(
+                (node, [hosts_verifier.expectation(present=names)])
+                for node, names in expected_names.items() if names)
+            propagation = self.wait_for_hosts_state(
+                expected, sorted(expected), plan_timeout_mins * 60)
+
+            self.log("info", "# 5. Record /etc/hosts size on every node")
+            sizes = self.get_hosts_file_sizes(self.all_nodes)
+            date = time.strftime("%Y-%m-%dT%H:%M:%S")
+            self.write_bench_results(
+                RESULTS_FILE, RESULTS_COLUMNS,
+                [(date, len(self.all_nodes), alias_count, cluster_count,
+                  node_count, round(load_secs, 3), round(create_plan_secs, 3),
+                  round(run_plan_secs, 3), propagation.get(node, ""),
+                  node, size) for node, size in zip(self.all_nodes, sizes)])
+        finally:
+            self.log("info", "# 6. Remove the generated aliases")
+            if created_configs:
+                for config in created_configs:
+                    self.execute_cli_remove_cmd(self.ms_node, config)
+                self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                                       plan_timeout_mins)
+
+    @attr('bench', 'alias_scale', 'alias_scale_10')
+    def test_01_p_alias_scale_10(self):
+        """
+        @tms_id: hosts_bench_alias_scale_10
+        @tms_requirements_id: NA
+        @tms_title: Alias scale benchmark with 10 aliases
+        @tms_description: Measures plan times, /etc/hosts propagation
+         time and /etc/hosts size with 10 aliases
+        @tms_test_steps:
+            @step: Load 5 cluster-level and 5 node-level aliases
+            @result: Aliases are created in the LITP model
+            @step: Create and run plan
+            @result: Plan executes successfully
+            @step: Wait for the aliases in /etc/hosts of every node
+            @result: Aliases are in /etc/hosts, timings are recorded
+            @step: Remove the aliases. Create and run plan
+            @result: Plan executes successfully
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self.run_alias_scale(10)
+
+    @attr('bench', 'alias_scale', 'alias_scale_100')
+    def test_02_p_alias_scale_100(self):
+        """
+        @tms_id: hosts_bench_alias_scale_100
+        @tms_requirements_id: NA
+        @tms_title: Alias scale benchmark with 100 aliases
+        @tms_description: Measures plan times, /etc/hosts propagation
+         time and /etc/hosts size with 100 aliases
+        @tms_test_steps:
+            @step: Load 50 cluster-level and 50 node-level aliases
+            @result: Aliases are created in the LITP model
+            @step: Create and run plan
+            @result: Plan executes successfully
+            @step: Wait for the aliases in /etc/hosts of every node
+            @result: Aliases are in /etc/hosts, timings are recorded
+            @step: Remove the aliases. Create and run plan
+            @result: Plan executes successfully
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self.run_alias_scale(100)
+
+    @attr('bench', 'alias_scale', 'alias_scale_1000')
+    def test_03_p_alias_scale_1000(self):
+        """
+        @tms_id: hosts_bench_alias_scale_1000
+        @tms_requirements_id: NA
+        @tms_title: Alias scale benchmark with 1000 aliases
+        @tms_description: Measures plan times, /etc/hosts propagation
+         time and /etc/hosts size with 1000 aliases
+        @tms_test_steps:
+            @step: Load 500 cluster-level and 500 node-level aliases
+            @result: Aliases are created in the LITP model
+            @step: Create and run plan
+            @result: Plan executes successfully
+            @step: Wait for the aliases in /etc/hosts of every node
+            @result: Aliases are in /etc/hosts, timings are recorded
+            @step: Remove the aliases. Create and run plan
+            @result: Plan executes successfully
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self.run_alias_scale(1000)
+
+    @attr('bench', 'alias_scale', 'alias_scale_10000')
+    def test_04_p_alias_scale_10000(self):
+        """
+        @tms_id: hosts_bench_alias_scale_10000
+        @tms_requirements_id: NA
+        @tms_title: Alias scale benchmark with 10000 aliases
+        @tms_description: Measures plan times, /etc/hosts propagation
+         time and /etc/hosts size with 10000 aliases
+        @tms_test_steps:
+            @step: Load 5000 cluster-level and 5000 node-level aliases
+            @result: Aliases are created in the LITP model
+            @step: Create and run plan
+            @result: Plan executes successfully
+            @step: Wait for the aliases in /etc/hosts of every node
+            @result: Aliases are in /etc/hosts, timings are recorded
+            @step: Remove the aliases. Create and run plan
+            @result: Plan executes successfully
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self.run_alias_scale(10000)
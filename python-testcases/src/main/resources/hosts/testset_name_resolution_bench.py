@@ -0,0 +1,204 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Benchmark of name resolution latency on the peer nodes once
+            LITP has rendered tens of thousands of aliases to /etc/hosts.
+            Not part of the 'all' run: select with the 'bench' or
+            'name_resolution' attributes.
+"""
+import time
+from litp_generic_test import attr
+from hosts_base import HostsGenericTest
+import test_constants as const
+import alias_utils
+import lookup_bench
+from round_trips import counted_helper
+
+BENCH_CONFIG_ID = "bench_lookup_config"
+ALIAS_PREFIX = "bench_lookup"
+RESULTS_FILE = "name_resolution_results.csv"
+RESULTS_COLUMNS = ("date", "aliases", "node", "family", "position", "name",
+                   "line", "min_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms")
+
+
+class NameResolutionBench(HostsGenericTest):
+    """
+        Measures "getent hosts" latency for aliases at the start, middle
+        and end of a large /etc/hosts
+    """
+
+    def setUp(self):
+        """
+            Runs before every single test
+        """
+        super(NameResolutionBench, self).setUp()
+        self.ms_node = self.get_management_node_filename()
+        self.peer_nodes = self.get_managed_node_filenames()
+        cluster_path = self.find(self.ms_node, "/deployments",
+                                 "collection-of-cluster-base")[0]
+        self.cluster_config_path = self.find(
+            self.ms_node, cluster_path, "collection-of-cluster-config")[0]
+        self.alias_name_prefix = "{0}-".format(ALIAS_PREFIX.replace("_", "-"))
+
+        self.snapshot_file_on_nodes([self.ms_node] + self.peer_nodes,
+                                    const.ETC_HOSTS)
+
+    def tearDown(self):
+        """
+            Runs after every single test
+        """
+        super(NameResolutionBench, self).tearDown()
+
+    def get_sample_names(self, hosts):
+        """
+        Description:
+            Picks the first, middle and last generated IPv4 and IPv6
+            alias in the order they are written to /etc/hosts.
+        Args:
+            hosts (HostsFile): /etc/hosts of a node.
+        Returns:
+            list. (family, position, name, line number) per sample.
+        """
+        samples = []
+        entries = [entry for entry in hosts.get_managed_entries()
+                   if entry.names and
+                   entry.names[0].startswith(self.alias_name_prefix)]
+        for family in ("IPv4", "IPv6"):
+            family_entries = [entry for entry in entries
+                              if (":" in entry.canonical) ==
+                              (family == "IPv6")]
+            self.assertNotEqual([], family_entries,
+                                "No generated {0} aliases in "
+                                "/etc/hosts".format(family))
+            for position, index in (("first", 0),
+                                    ("middle", len(family_entries) // 2),
+                                    ("last", -1)):
+                entry = family_entries[index]
+                samples.append((family, position, entry.names[0],
+                                entry.line_number + 1))
+        return samples
+
+    @counted_helper
+    def measure_lookups(self, node, samples):
+        """
+        Description:
+            Times the resolution of the sample names on a node.
+        Args:
+            node (str): Node to resolve the names on.
+            samples (list): Samples returned by get_sample_names.
+        Returns:
+            dict. LookupLatency keyed by name, including "localhost".
+        """
+        cmd = lookup_bench.get_lookup_cmd([sample[2] for sample in samples])
+        stdout, _, _ = self.run_command(node, cmd, default_asserts=True)
+        return lookup_bench.parse_lookup_output(stdout)
+
+    def run_lookup_bench(self, alias_count):
+        """
+        Description:
+            Renders alias_count cluster-level aliases, every fourth with
+            an IPv6 address, to /etc/hosts of the peer nodes and measures
+            the latency of resolving some of them on every peer node.
+        Args:
+            alias_count (int): Number of aliases to create.
+        """
+        plan_timeout_mins = max(10, alias_count // 100)
+        config_path = "{0}/{1}".format(self.cluster_config_path,
+                                       BENCH_CONFIG_ID)
+        created = False
+
+        try:
+            self.log("info", "# 1. Generate and load {0} cluster-level "
+                             "aliases. Create and run plan".format(
+                                 alias_count))
+            aliases = alias_utils.AliasRange(alias_count, ALIAS_PREFIX)
+            self.create_aliases(self.cluster_config_path, aliases,
+                                config_id=BENCH_CONFIG_ID)
+            created = True
+            self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                                   plan_timeout_mins)
+
+            self.log("info", "# 2. Pick the first, middle and last IPv4 and "
+                             "IPv6 alias in /etc/hosts of each peer node")
+            samples = dict(
+                (node, self.get_sample_names(hosts)) for node, hosts in
+                zip(self.peer_nodes, self.get_hosts_snapshots(
+                    self.peer_nodes)))
+
+            self.log("info", "# 3. Time 'getent hosts' for each picked alias "
+                             "on every peer node")
+            latencies = self.run_on_nodes(
+                self.peer_nodes,
+                lambda node: self.measure_lookups(node, samples[node]))
+
+            self.log("info", "# 4. Check every alias resolved and record "
+                             "the latencies")
+            date = time.strftime("%Y-%m-%dT%H:%M:%S")
+            rows = []
+            for node, node_latencies in zip(self.peer_nodes, latencies):
+                for family, position, name, line in \
+                        [("-", "baseline", "localhost", 1)] + samples[node]:
+                    latency = node_latencies[name]
+                    self.assertEqual(0, latency.rc, "{0} did not resolve "
+                                     "on {1}".format(name, node))
+                    rows.append((date, alias_count, node, family, position,
+                                 name, line, latency.min_ms) +
+                                tuple(latency.percentiles_ms[pct]
+                                      for pct in lookup_bench.PERCENTILES) +
+                                (latency.max_ms,))
+            self.write_bench_results(RESULTS_FILE, RESULTS_COLUMNS, rows)
+        finally:
+            self.log("info", "# 5. Remove the generated aliases")
+            if created:
+                self.execute_cli_remove_cmd(self.ms_node, config_path)
+                self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                                       plan_timeout_mins)
+
+    @attr('bench', 'name_resolution', 'name_resolution_10000')
+    def test_01_p_name_resolution_10000_aliases(self):
+        """
+        @tms_id: hosts_bench_name_resolution_10000
+        @tms_requirements_id: NA
+        @tms_title: Name resolution latency with 10000 aliases
+        @tms_description: Measures getent hosts latency percentiles on
+         each peer node with 10000 aliases in /etc/hosts
+        @tms_test_steps:
+            @step: Load 10000 cluster-level aliases. Create and run plan
+            @result: Plan executes successfully
+            @step: Time getent hosts for the first, middle and last IPv4
+             and IPv6 alias on each peer node
+            @result: Every alias resolves, latencies are recorded
+            @step: Remove the aliases. Create and run plan
+            @result: Plan executes successfully
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self.run_lookup_bench(10000)
+
+    @attr('bench', 'name_resolution', 'name_resolution_30000')
+    def test_02_p_name_resolution_30000_aliases(self):
+        """
+        @tms_id: hosts_bench_name_resolution_30000
+        @tms_requirements_id: NA
+        @tms_title: Name resolution latency with 30000 aliases
+        @tms_description: Measures getent hosts latency percentiles on
+         each peer node with 30000 aliases in /etc/hosts
+        @tms_test_steps:
+            @step: Load 30000 cluster-level aliases. Create and run plan
+            @result: Plan executes successfully
+            @step: Time getent hosts for the first, middle and last IPv4
+             and IPv6 alias on each peer node
+            @result: Every alias resolves, latencies are recorded
+            @step: Remove the aliases. Create and run plan
+            @result: Plan executes successfully
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self.run_lookup_bench(30000)
@@ -13,11 +13,14 @@ program(s) have been supplied.
             removed from the model to also be removed from the /etc/hosts
             file of all remaining nodes in the deployment
 """
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from hosts_base import HostsGenericTest
+from hosts_verifier import expectation
 import test_constants as const
+from round_trips import counted_helper
 
 
-class Story194485(GenericTest):
+class Story194485(HostsGenericTest):
     """
         As a LITP user I want the node entry of a node which is being
         removed from the model to also be removed from the /etc/hosts
@@ -51,29 +54,24 @@ class Story194485(GenericTest):
         """ Runs after every single test """
         super(Story194485, self).tearDown()
 
-    def assert_no_errors_msgs(self, start_pos):
+    @counted_helper
+    def assert_no_errors_msgs(self, log_scanner):
         """
         Description:
-            Ensures that no "ERROR" or "WARNING:" messages are
-            logged to /var/log/messages on the MS from the
-            line specified to the end of the file.
+            Ensures that no "ERROR" or "WARNING:" messages were logged
+            to /var/log/messages on the MS since the scanner last read it.
         Args:
-            start_pos (int): Line of file to check from.
+            log_scanner (LogScanner): Scanner of /var/log/messages
+                                      returned by start_log_scan.
         """
-        msgs_to_check = ["WARNING:", "ERROR"]
-        for msg in msgs_to_check:
-            msg_found = self.wait_for_log_msg(
-                self.ms_node, msg, log_len=start_pos, timeout_sec=1,
-                return_log_msgs=True)
-
-            if msg_found:
-                # Ignoring postgres errors due to TORF-252951
-                errors = [err_msg for err_msg in msg_found
-                          if "postgres" not in err_msg]
-
-                self.assertTrue(errors == [], "'{0}' message(s) found in {1}"
-                                .format(msg, const.GEN_SYSTEM_LOG_PATH))
-
+        hits = self.scan_log(self.ms_node, log_scanner)
+        self.assertEqual([], [hit.line for hit in hits],
+                         "'{0}' message(s) found in {1}".format(
+                             "', '".join(sorted(set(hit.pattern
+                                                    for hit in hits))),
+                             const.GEN_SYSTEM_LOG_PATH))
+
+    @counted_helper
     def check_path_not_in_model(self, path_to_check, item_type):
         """
         Description:
@@ -85,6 +83,7 @@ class Story194485(GenericTest):
         self.assertEqual([], self.find(self.ms_node, path_to_check,
                                        item_type, assert_not_empty=False))
 
+    @counted_helper
     def check_hosts_file(self, node_hostname, nodes_to_check,
                          expected_present=True):
         """
@@ -100,17 +99,15 @@ class Story194485(GenericTest):
              should be referenced, otherwise False.
              Default is True
         """
-        cmd = '{0} {1} {2}'.format(const.GREP_PATH, node_hostname,
-                                   const.ETC_HOSTS)
-        for node in nodes_to_check:
-            stdout, _, rc = self.run_command(node, cmd)
-            if expected_present:
-                self.assertNotEqual([], stdout)
-            else:
-                self.assertEqual([], stdout)
-                self.assertNotEqual(0, rc)
-
-    @attr('all', 'revert', 'story194485', 'story194485_tc02')
+        if expected_present:
+            check = expectation(present=[node_hostname])
+        else:
+            check = expectation(absent=[node_hostname])
+        self.assert_hosts_on_nodes(nodes_to_check, [check])
+
+    # Serial: the node is powered off while other test sets would check
+    # /etc/hosts on it
+    @attr('all', 'revert', 'serial', 'story194485', 'story194485_tc02')
     def test_02_p_remove_node_hosts_files(self):
         """
             @tms_id: torf_194485_tc02
@@ -200,8 +197,8 @@ class Story194485(GenericTest):
                 self.log("info", "Removing '{0}'".format(service_group))
                 self.execute_cli_remove_cmd(self.ms_node, service_group)
 
-            self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                    plan_timeout_mins=25)
+            self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                                   plan_timeout_mins=25)
 
             self.log("info", "# 3. Verify that the service group items "
                              "have been deleted from model and that the "
@@ -211,8 +208,10 @@ class Story194485(GenericTest):
                                          'vcs-clustered-service')
             self.check_hosts_file(self.removed_node, self.healthy_nodes)
 
-            start_log_pos = self.get_file_len(
-                self.ms_node, const.GEN_SYSTEM_LOG_PATH)
+            # Ignoring postgres errors due to TORF-252951
+            log_scanner = self.start_log_scan(
+                self.ms_node, const.GEN_SYSTEM_LOG_PATH,
+                ["WARNING:", "ERROR"], excludes=["postgres"])
 
             self.turn_on_litp_debug(self.ms_node)
 
@@ -223,8 +222,8 @@ class Story194485(GenericTest):
 
             self.execute_cli_remove_cmd(self.ms_node, self.removed_node_url)
 
-            self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                    plan_timeout_mins=25)
+            self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                                   plan_timeout_mins=25)
 
             self.log("info", "# 5. Verify that the node item "
                              "has been deleted from the model. "
@@ -260,7 +259,7 @@ class Story194485(GenericTest):
                              .format(self.removed_node))
             self.assertNotEqual(0, rc)
 
-            self.assert_no_errors_msgs(start_log_pos)
+            self.assert_no_errors_msgs(log_scanner)
 
             start_puppet_cmd = self.rhc.get_systemctl_start_cmd("puppet")
             self.run_command(self.ms_node, start_puppet_cmd, su_root=True,
@@ -273,8 +272,8 @@ class Story194485(GenericTest):
             self.execute_cli_load_cmd(self.ms_node, self.node_path,
                                       self.node_xml_file)
 
-            self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                    plan_timeout_mins=25)
+            self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                                   plan_timeout_mins=25)
 
             self.assertEqual('Applied', self.get_item_state(
                 self.ms_node, self.removed_node_url))
@@ -299,8 +298,8 @@ class Story194485(GenericTest):
             self.execute_cli_load_cmd(self.ms_node, self.vcs_cluster_path,
                                       self.services_xml_file, args="--merge")
 
-            self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                    plan_timeout_mins=30)
+            self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                                   plan_timeout_mins=30)
 
             for service_group in service_groups:
                 self.assertEqual('Applied', self.get_item_state(self.ms_node,
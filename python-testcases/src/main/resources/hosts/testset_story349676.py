@@ -12,12 +12,16 @@ program(s) have been supplied.
             aliases so that they can be successfully written to
             /etc/hosts
 """
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from hosts_base import HostsGenericTest
+from hosts_verifier import expectation
 import test_constants as const
 import hosts_test_data as data
+import alias_utils
+from round_trips import counted_helper
 
 
-class Story349676(GenericTest):
+class Story349676(HostsGenericTest):
     """
        As a LITP engineer, I need to update IPv6 aliases so that they
        can be successfully written to /etc/hosts
@@ -36,22 +40,24 @@ class Story349676(GenericTest):
                                       "collection-of-cluster-base")
         self.cluster_config_path = self.find(self.ms_node,
              self.cluster_path[0], "collection-of-cluster-config")
-        self.alias_cluster_config_path = '{0}/alias_config'.format(
-            self.cluster_config_path[0])
+        self.alias_config_id = self.alias_ns.config_id("alias_config")
+        self.alias_cluster_config_path = '{0}/{1}'.format(
+            self.cluster_config_path[0], self.alias_config_id)
         self.alias_ms_config_path = self.find(
             self.ms_node, "/ms", "alias-node-config")[0]
         self.alias_ms_path = "{0}/{1}".format(self.alias_ms_config_path,
                                               "aliases")
-        self.cluster_alias_item_id = "clusterAlias"
-        self.ms_alias_item_id = "msAlias"
-        self.alias_name = "story349676-service"
-        self.ipv6_address = "2001:0db8:85a3:0000:0000:8a2e:0370:7334"
-        self.ipv6_address_update = "2001:0db8:85a3:0000:0000:8a2e:0370:9874"
+        self.cluster_alias_item_id = self.alias_ns.name("clusterAlias")
+        self.ms_alias_item_id = self.alias_ns.name("msAlias")
+        self.alias_name = self.alias_ns.name("story349676-service")
+        self.ipv6_address = self.alias_ns.address(
+            "2001:0db8:85a3:0000:0000:8a2e:0370:7334")
+        self.ipv6_address_update = self.alias_ns.address(
+            "2001:0db8:85a3:0000:0000:8a2e:0370:9874")
         self.ipv6_prefix = "64"
         self.ipv6_prefix_update = "128"
 
-        for node in self.all_nodes:
-            self.backup_file(node, const.ETC_HOSTS)
+        self.snapshot_file_on_nodes(self.all_nodes, const.ETC_HOSTS)
 
     def tearDown(self):
         """
@@ -59,6 +65,7 @@ class Story349676(GenericTest):
         """
         super(Story349676, self).tearDown()
 
+    @counted_helper
     def check_host_file(self, ip_address, expected_value, node_alias=""):
         """
         Description:
@@ -79,46 +86,26 @@ class Story349676(GenericTest):
         if node_alias in self.all_nodes:
             nodes = [node_alias]
 
-        cat_hosts_ipv6_alias_cmd = "{0} {1} {2} | {3} '{{print $1}}'".\
-            format(const.GREP_PATH, self.alias_name, const.ETC_HOSTS,
-                   const.AWK_PATH)
+        alias_names = [self.alias_name] if expected_value != "0" else []
+        self.assert_hosts_on_nodes(nodes, [expectation(
+            address=ip_address, count=int(expected_value),
+            names=alias_names, present=alias_names)])
 
-        cat_hosts_ipv6address_count_cmd = "{0} {1} {2} | wc -l".format(
-            const.GREP_PATH, ip_address, const.ETC_HOSTS)
-
-        for node in nodes:
-            ipaddress = self.run_command(node, cat_hosts_ipv6_alias_cmd,
-                                         su_root=True, default_asserts=True)[0]
-
-            count = self.run_command(node, cat_hosts_ipv6address_count_cmd,
-                                     su_root=True, default_asserts=True)[0]
-            self.assertEqual(expected_value, count[0],
-                             "Number of aliases in host file is not as "
-                             "expected")
-
-            if expected_value != "0":
-                self.assertEqual(ip_address, ipaddress[0],
-                    "Expected IP address is not the same as actual IP address")
-
-    def create_alias(self, url, alias, address):
+    def get_alias_data(self, item_id, address):
         """
         Description:
-            Create alias in LITP model.
+            Builds the alias data used to create an alias in LITP model.
         Args:
-            url (str): LITP path to create alias
-            alias (str): Name of the alias for the LITP model url.
+            item_id (str): Name of the alias for the LITP model url.
             address (str) : Value for the IP address property of the
                             alias.
-        Return: link_url(str): LITP path to created alias
+        Return: dict: Alias data in the hosts_test_data format
         """
-        link_url = "{0}/aliases/{1}".format(url, alias)
-        props = "address={0} alias_names={1}".format(address, self.alias_name)
-
-        self.execute_cli_create_cmd(
-            self.ms_node, link_url, "alias", props)
-
-        return link_url
+        return {"NAME": item_id,
+                "PROPS": {"address": address,
+                          "alias_names": self.alias_name}}
 
+    @counted_helper
     def assert_alias_props_model(self, alias_cluster_path, ipv6address,
                                  ipv6prefix):
         """
@@ -130,10 +117,12 @@ class Story349676(GenericTest):
             ipv6prefix (str): IP address prefix of the alias
         """
 
-        alias_cluster_props_in_model = self.get_props_from_url(self.ms_node,
-            "{0}/{1}".format(alias_cluster_path, self.cluster_alias_item_id))
-        alias_ms_props_in_model = self.get_props_from_url(self.ms_node,
-            "{0}/{1}".format(self.alias_ms_path, self.ms_alias_item_id))
+        props_in_model = self.get_props_from_urls(
+            self.ms_node, [alias_cluster_path, self.alias_ms_path])
+        alias_cluster_props_in_model = props_in_model["{0}/{1}".format(
+            alias_cluster_path, self.cluster_alias_item_id)]
+        alias_ms_props_in_model = props_in_model["{0}/{1}".format(
+            self.alias_ms_path, self.ms_alias_item_id)]
 
         values_to_compare = {
             "alias_names": self.alias_name,
@@ -153,7 +142,9 @@ class Story349676(GenericTest):
             self.assertNotEqual(value, ipv6address, "IP address in model is "
                                         "the same as IP address in host file")
 
-    @attr('all', 'revert', 'story349676', 'story349676_tc01')
+    # Serial: the DoNothingPlanError of step 3 needs a model without the
+    # pending changes of other test sets
+    @attr('all', 'revert', 'serial', 'story349676', 'story349676_tc01')
     def test_01_p_create_update_remove_alias_ipv6_address_with_prefix(self):
         """
         @tms_id: torf_349676_tc01
@@ -197,19 +188,20 @@ class Story349676(GenericTest):
 
         self.log("info", "# 1. Create a cluster-level and ms-level alias item."
                          " Create and run plan")
-        self.execute_cli_create_cmd(self.ms_node, "{0}/{1}".format(
-            self.cluster_config_path[0], "alias_config"),
-                                    "alias-cluster-config")
-
-        create_alias_details = {self.alias_cluster_config_path: self.
-            cluster_alias_item_id, self.alias_ms_config_path: self.
-            ms_alias_item_id}
+        address = "{0}/{1}".format(self.ipv6_address, self.ipv6_prefix)
+        cluster_alias = self.get_alias_data(self.cluster_alias_item_id,
+                                            address)
+        self.create_aliases(self.cluster_config_path[0], [cluster_alias],
+                            config_id=self.alias_config_id)
 
-        for path, item_id in create_alias_details.iteritems():
-            self.create_alias(path, item_id, "{0}/{1}".format(
-                self.ipv6_address, self.ipv6_prefix))
+        ms_config_path, ms_config_id = self.alias_ms_config_path.rsplit(
+            "/", 1)
+        ms_alias = self.get_alias_data(self.ms_alias_item_id, address)
+        self.create_aliases(ms_config_path, [ms_alias],
+                            config_type=alias_utils.ALIAS_NODE_CONFIG,
+                            config_id=ms_config_id)
 
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE, 10)
+        self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE, 10)
 
         self.log("info", "# 2. Check /etc/hosts file is updated with ipv6 "
                          "address without prefix and model contains "
@@ -251,7 +243,7 @@ class Story349676(GenericTest):
             self.execute_cli_update_cmd(self.ms_node, "{0}/{1}".format(path,
                 item_id), "address={0}/{1}".format(self.ipv6_address_update,
                                                 self.ipv6_prefix))
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE, 10)
+        self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE, 10)
 
         self.log("info", "# 6. Check /etc/hosts file is updated with ipv6 "
             "address without prefix and model contains ipv6 address with "
@@ -269,7 +261,7 @@ class Story349676(GenericTest):
                                                     item_id))
         self.execute_cli_remove_cmd(self.ms_node, self.
                                     alias_cluster_config_path)
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE, 10)
+        self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE, 10)
 
         self.log("info", "# 8. Check entries have been removed from "
                          "/etc/hosts file")
@@ -13,12 +13,18 @@ program(s) have been supplied.
             I can configure my nodes to access the service (Service aliasing)
             Agile: STORY LITPCDS-54
 """
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
+from hosts_base import HostsGenericTest
+from hosts_verifier import expectation
 import test_constants as const
 import hosts_test_data as data
+import alias_utils
+from hosts_scenarios import (Scenario, ScenarioBatch, ScenarioEngine,
+                             AliasState)
+from round_trips import counted_helper, round_trip_budget
 
 
-class Story54(GenericTest):
+class Story54(HostsGenericTest):
     """
        As a site engineer I want to create a service alias
        for external network accessible services so
@@ -33,13 +39,14 @@ class Story54(GenericTest):
         self.ms_node = self.get_management_node_filename()
         self.peer_nodes = self.get_managed_node_filenames()
         self.node_urls = self.find(self.ms_node, '/deployments', 'node')
+        self.data = self.alias_ns.wrap_data(data)
 
         self.cluster_path = self.find_children_of_collect(
             self.ms_node, "/deployments", "cluster")[0]
         self.cluster_config_path = self.find(self.ms_node, self.cluster_path,
                                              "collection-of-cluster-config")[0]
-        self.alias_cluster_config_path = '{0}/alias_config'.format(
-            self.cluster_config_path)
+        self.alias_cluster_config_path = '{0}/{1}'.format(
+            self.cluster_config_path, self.alias_ns.config_id('alias_config'))
 
         self.ms_config_path = self.find(
             self.ms_node, "/ms", "collection-of-node-config")[0]
@@ -48,13 +55,13 @@ class Story54(GenericTest):
         self.node2_config_path = self.find(
             self.ms_node, self.node_urls[1], "collection-of-node-config")[0]
 
-        self.alias_node1_config_path = '{0}/alias_node_config'.format(
-                                                self.node1_config_path)
-        self.alias_node2_config_path = '{0}/alias_node_config'.format(
-                                                self.node2_config_path)
+        node_config_id = self.alias_ns.config_id('alias_node_config')
+        self.alias_node1_config_path = '{0}/{1}'.format(
+            self.node1_config_path, node_config_id)
+        self.alias_node2_config_path = '{0}/{1}'.format(
+            self.node2_config_path, node_config_id)
 
-        for node in self.peer_nodes:
-            self.backup_file(node, const.ETC_HOSTS)
+        self.snapshot_file_on_nodes(self.peer_nodes, const.ETC_HOSTS)
 
     def tearDown(self):
         """
@@ -62,6 +69,7 @@ class Story54(GenericTest):
         """
         super(Story54, self).tearDown()
 
+    @counted_helper
     def check_etc_hosts_file(self, ip_address, expected_value, alias_names,
                              node_alias=""):
         """
@@ -89,72 +97,35 @@ class Story54(GenericTest):
         if node_alias in self.peer_nodes:
             nodes = [node_alias]
 
-        cmd = "{0} {1} {2} | wc -l".format(const.GREP_PATH, ip_address,
-                                           const.ETC_HOSTS)
-
-        for node in nodes:
-            stdout, _, _ = self.run_command(node, cmd, su_root=True,
-                                            default_asserts=True)
-            self.assertEqual(expected_value, stdout[0])
+        self.assert_hosts_on_nodes(nodes, [expectation(
+            address=ip_address, count=int(expected_value),
+            names=alias_names)])
 
-        for node in nodes:
-            for name in alias_names:
-                cmd = "{0} {1} {2}".format(const.GREP_PATH, name,
-                                           const.ETC_HOSTS)
-                stdout, _, _ = self.run_command(node, cmd,
-                                                default_asserts=True)
-                for line in stdout:
-                    ip_and_aliases, _, _ = line.partition('#')
-                    address = ip_and_aliases.split()[0:1][0]
-                    self.assertTrue(address == ip_address)
-
-    def ensure_alias_config_exists(self, alias_data, node_config=False):
+    @counted_helper
+    def get_node_alias_names(self):
         """
         Description:
-            Checks if alias cluster/node config exists and, if
-            not, creates it and returns the path to it.
-
-        Args:
-            alias_data (dict): dictionary of information about alias
-                               to be created
+            Returns the names of the node-level aliases of the peer nodes,
+            whose /etc/hosts entries legitimately differ between nodes.
 
-        Kwargs:
-            node_config (bool): If True, will check for an alias-node-config
-                               item under the node in the given dictionary.
-                               If False, will check for an alias-cluster-config
-                               item. If the item being searched for does not
-                               exist, it will be created.
-                               Default value is False.
         Returns:
-            str. Path to (created) alias cluster/node config.
+            list. Alias names.
         """
-        if node_config:
-            config_path = alias_data["PATH"]
-            alias_path = alias_data["ALIAS_PATH"]
-            resource = "alias-node-config"
-
-        else:
-            config_path = self.cluster_config_path
-            alias_path = self.alias_cluster_config_path
-            resource = "alias-cluster-config"
-
-        alias_config = self.find(self.ms_node,
-                                 config_path,
-                                 resource,
-                                 assert_not_empty=False)
-
-        if not alias_config:
-            self.execute_cli_create_cmd(self.ms_node, alias_path, resource)
-            alias_config = self.find(self.ms_node,
-                                     config_path,
-                                     resource,
-                                     assert_not_empty=False)
-        return alias_config[0]
-
+        names = []
+        for path, props in sorted(self.get_props_from_urls(
+                self.ms_node, self.node_urls).items()):
+            if "/aliases/" in path and "alias_names" in props:
+                names.extend(props["alias_names"].split(","))
+        return names
+
+    @counted_helper
     def create_update_alias(self, alias_data, update=False, node_alias=False):
         """
         Description:
-            Creates/updates aliases in the LITP model
+            Creates/updates aliases in the LITP model, in the existing
+            alias cluster/node config if there is one. Aliases are created
+            with a single litp load, which also creates the alias
+            cluster/node config if it does not exist yet.
 
         Args:
             alias_data (dict): Information about the alias to be created/
@@ -170,23 +141,33 @@ class Story54(GenericTest):
         Returns:
             str. Path to created/updated alias
         """
-        alias_config = self.ensure_alias_config_exists(alias_data, node_alias)
+        if node_alias:
+            config_path = alias_data["PATH"]
+            alias_config = alias_data["ALIAS_PATH"]
+            config_type = alias_utils.ALIAS_NODE_CONFIG
+        else:
+            config_path = self.cluster_config_path
+            alias_config = self.alias_cluster_config_path
+            config_type = alias_utils.ALIAS_CLUSTER_CONFIG
+        alias_config = self.get_alias_config_path(config_path, config_type,
+                                                  alias_config)
+
+        if not update:
+            config_id = alias_config.split('/')[-1]
+            return self.create_aliases(config_path, [alias_data],
+                                       config_type=config_type,
+                                       config_id=config_id)[0]
 
         alias_path = '{0}/aliases/{1}'.format(alias_config,
                                               alias_data["NAME"])
 
-        alias_props = ""
-        for prop_name, prop_value in alias_data["PROPS"].iteritems():
-            alias_props += '{0}="{1}" '.format(prop_name, prop_value)
-
-        if update:
-            self.execute_cli_update_cmd(self.ms_node, alias_path, alias_props)
-        else:
-            self.execute_cli_create_cmd(self.ms_node, alias_path, "alias",
-                                        alias_props)
+        self.execute_cli_update_cmd(
+            self.ms_node, alias_path,
+            alias_utils.AliasSpec.from_dict(alias_data).cli_props)
 
         return alias_path
 
+    @counted_helper
     def _create_alias(self, alias, alias_names, address):
         """
         Description:
@@ -207,6 +188,7 @@ class Story54(GenericTest):
         return link_url
 
     @attr('all', 'revert', 'story54', 'story54_tc01', 'cdb_priority1')
+    @round_trip_budget(cli=24, ssh=16, ssh_per_node=12)
     def test_01_p_create_update_remove_alias(self):
         """
         @tms_id: litpcds_54_tc01
@@ -244,77 +226,94 @@ class Story54(GenericTest):
             @result: Plan runs to completion successfully.
             @step: Check /etc/hosts file contains expected aliases.
             @result: /etc/hosts file contains expected aliases.
+            @step: Check the LITP managed entries of /etc/hosts are the
+                   same on every peer node.
+            @result: /etc/hosts is consistent across the peer nodes.
         @tms_test_precondition:NA
         @tms_execution_type: Automated
         """
+        ns = self.alias_ns
+        svn_ip = ns.address("122.122.54.51")
+        apache_ip = ns.address("122.122.54.151")
+        ipv6_ip = ns.address("fe80::a00:27ff:febc:c8e1")
+
         self.log("info", "# 1. Create a cluster-level alias item.")
         self.execute_cli_create_cmd(self.ms_node,
                                     self.alias_cluster_config_path,
                                     "alias-cluster-config")
 
         svn_alias = self._create_alias(
-            "svn", "svn-service", "122.122.54.51")
+            ns.name("svn"), ns.name("svn-service"), svn_ip)
 
         self.log("info", "# 2. Create and Run plan. Check /etc/hosts file "
                          "contains the alias.")
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                plan_timeout_mins=10)
+        self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                               plan_timeout_mins=10)
 
-        self.check_etc_hosts_file("122.122.54.51", "1", ["svn-service"])
+        self.check_etc_hosts_file(svn_ip, "1", [ns.name("svn-service")])
 
         self.log("info", "# 3. Update alias item with a new IP address."
                          "Create another alias item with the same IP address"
                          "and alias_names as the original.")
 
-        props = "address=122.122.54.151"
+        props = "address={0}".format(apache_ip)
         self.execute_cli_update_cmd(self.ms_node, svn_alias, props)
 
         self.log("info", "# 4. Create another alias item with the same IP "
                          "address and different alias_names.")
         apache_alias = self._create_alias(
-            "apache", "apache-service", "122.122.54.151")
+            ns.name("apache"), ns.name("apache-service"), apache_ip)
 
         self.log("info", "# 5. Create and Run plan. Check /etc/hosts file "
                          "contains expected aliases.")
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                plan_timeout_mins=10)
+        self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                               plan_timeout_mins=10)
 
-        self.check_etc_hosts_file("122.122.54.151", "2",
-                                  ["apache-service", "svn-service"])
+        self.check_etc_hosts_file(apache_ip, "2",
+                                  [ns.name("apache-service"),
+                                   ns.name("svn-service")])
 
         self.log("info", "# 6. Remove an alias item from LITP model.")
         self.execute_cli_remove_cmd(self.ms_node, apache_alias)
 
         self.log("info", "# 7. Create and Run plan.")
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                plan_timeout_mins=10)
+        self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                               plan_timeout_mins=10)
 
         self.log("info", "8. Check alias removed from /etc/hosts file.")
-        self.check_etc_hosts_file("122.122.54.151", "1", [])
+        self.check_etc_hosts_file(apache_ip, "1", [])
 
         self.log("info", "# 9. Update existing alias item to have comma "
                          "separated list in alias_names. "
                          "Create new alias with specified IPv6.")
 
-        props = "alias_names='apache-service,svn-service'"
+        props = "alias_names='{0}'".format(
+            ns.names("apache-service,svn-service"))
         self.execute_cli_update_cmd(self.ms_node, svn_alias, props)
 
-        self._create_alias("aliasipv6", "ipv6-service",
-                           "fe80::a00:27ff:febc:c8e1")
+        self._create_alias(ns.name("aliasipv6"), ns.name("ipv6-service"),
+                           ipv6_ip)
 
         self.log("info", "# 10. Create and Run plan.")
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                plan_timeout_mins=10)
+        self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                               plan_timeout_mins=10)
 
         self.log("info", "# 11. Check /etc/hosts file contains expected "
                          "aliases ")
-        alias_names = "apache-service,svn-service".split(',')
-        self.check_etc_hosts_file("122.122.54.151", "1", alias_names)
+        alias_names = ns.names("apache-service,svn-service").split(',')
+        self.check_etc_hosts_file(apache_ip, "1", alias_names)
 
-        self.check_etc_hosts_file("fe80::a00:27ff:febc:c8e1", "1",
-                                  ["ipv6-service"])
+        self.check_etc_hosts_file(ipv6_ip, "1", [ns.name("ipv6-service")])
 
-    @attr('all', 'revert', 'story54', 'story54_tc02')
+        self.log("info", "# 12. Check the LITP managed entries of "
+                         "/etc/hosts are the same on every peer node.")
+        self.assert_hosts_consistent(
+            self.peer_nodes, ignore_names=self.get_node_alias_names())
+
+    # Covered by test_09 in the 'all' and 'story54' runs, which shares its
+    # plans with test_05 and test_08: select it with its own attribute.
+    @attr('revert', 'story54_tc02')
+    @round_trip_budget(cli=18, ssh=12, ssh_per_node=8)
     def test_02_p_ip_with_multiple_names(self):
         """
         @tms_id: litpcds_54_tc02
@@ -351,18 +350,20 @@ class Story54(GenericTest):
 
         self.log("info", "1. Create two aliases at cluster-level with the"
                          "same IP address")
-        mail_alias = self.create_update_alias(data.MAIL_ALIAS_4)
-        web_alias = self.create_update_alias(data.WEB_ALIAS_5)
+        mail_alias, web_alias = self.create_aliases(
+            self.cluster_config_path,
+            [self.data.MAIL_ALIAS_4, self.data.WEB_ALIAS_5],
+            config_id=self.alias_cluster_config_path.split('/')[-1])
 
         self.log("info", "2. Create and Run plan.")
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                plan_timeout_mins=10)
+        self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                               plan_timeout_mins=10)
 
         self.log("info", "3. Check /etc/hosts file for two aliases with the "
                          "same IP address.")
-        address = data.WEB_ALIAS_5["PROPS"]["address"]
-        alias_names = [data.MAIL_ALIAS_4["PROPS"]["alias_names"],
-                       data.WEB_ALIAS_5["PROPS"]["alias_names"]]
+        address = self.data.WEB_ALIAS_5["PROPS"]["address"]
+        alias_names = [self.data.MAIL_ALIAS_4["PROPS"]["alias_names"],
+                       self.data.WEB_ALIAS_5["PROPS"]["alias_names"]]
         self.check_etc_hosts_file(address, "2", alias_names)
 
         self.log("info", "4. Remove aliases and cluster config.")
@@ -372,26 +373,27 @@ class Story54(GenericTest):
                                     self.alias_cluster_config_path)
 
         self.log("info", "5. Create and Run plan.")
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                plan_timeout_mins=10)
+        self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                               plan_timeout_mins=10)
 
         self.log("info", "6. Check /etc/hosts file contains no aliases.")
-        address = data.WEB_ALIAS_5["PROPS"]["address"]
+        address = self.data.WEB_ALIAS_5["PROPS"]["address"]
         alias_names = []
         self.check_etc_hosts_file(address, "0", alias_names)
 
         self.log("info", "7. Create cluster alias with two alias names and "
                          "one IP. ")
-        self.create_update_alias(data.COMMS_ALIAS_6)
+        self.create_update_alias(self.data.COMMS_ALIAS_6)
 
         self.log("info", "8. Create and Run plan.")
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                plan_timeout_mins=10)
+        self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                               plan_timeout_mins=10)
 
         self.log("info", "9. Check /etc/hosts file to verify alias with two "
                          "names and one IP is present.")
-        address = data.COMMS_ALIAS_6["PROPS"]["address"]
-        alias_names = data.COMMS_ALIAS_6["PROPS"]["alias_names"].split(',')
+        address = self.data.COMMS_ALIAS_6["PROPS"]["address"]
+        alias_names = \
+            self.data.COMMS_ALIAS_6["PROPS"]["alias_names"].split(',')
         self.check_etc_hosts_file(address, "1", alias_names)
 
     # @attr('pre-reg', 'revert', 'story54', 'story54_tc03')
@@ -442,7 +444,10 @@ class Story54(GenericTest):
         @tms_execution_type: Automated
         """
 
-    @attr('all', 'revert', 'story54', 'story54_tc05')
+    # Covered by test_09 in the 'all' and 'story54' runs, which shares its
+    # plans with test_02 and test_08: select it with its own attribute.
+    @attr('revert', 'story54_tc05')
+    @round_trip_budget(cli=6, ssh=6, ssh_per_node=6)
     def test_05_n_manual_file_update(self):
         """
         @tms_id: litpcds_54_tc05
@@ -468,37 +473,40 @@ class Story54(GenericTest):
                          "with same ip as manual alias.")
         cmd = "{0} '{1} {2} # manually added by {3}' >> {4}".format(
             const.ECHO_PATH,
-            data.MANUAL_ALIAS["ADDRESS"],
-            data.MANUAL_ALIAS["NAME"],
+            self.data.MANUAL_ALIAS["ADDRESS"],
+            self.data.MANUAL_ALIAS["NAME"],
             "test_05_n_manual_file_update",
             const.ETC_HOSTS)
 
-        for node in self.peer_nodes:
-            _, _, rc = self.run_command(node, cmd, su_root=True)
+        results = self.run_on_nodes(self.peer_nodes, self.run_command, cmd,
+                                    su_root=True)
+        for _, _, rc in results:
             self.assertEquals(0, rc)
 
-        self.create_update_alias(data.CRABLOUIE_ALIAS_7)
+        self.create_update_alias(self.data.CRABLOUIE_ALIAS_7)
 
         self.log("info", "# 2. Create and Run plan.")
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                plan_timeout_mins=10)
+        self.run_and_wait_plan(self.ms_node, const.PLAN_COMPLETE,
+                               plan_timeout_mins=10)
 
         self.log("info", "# 3. Check /etc/hosts to ensure created aliases "
                          "are present.")
-        address = data.CRABLOUIE_ALIAS_7["PROPS"]["address"]
-        alias_names = [data.CRABLOUIE_ALIAS_7["PROPS"]["alias_names"]]
+        address = self.data.CRABLOUIE_ALIAS_7["PROPS"]["address"]
+        alias_names = [self.data.CRABLOUIE_ALIAS_7["PROPS"]["alias_names"]]
 
         self.check_etc_hosts_file(address, "2", alias_names)
 
         self.log("info", "# 4. Remove the manual alias from all peer nodes.")
         cmd = "{0} -i '/{1}/d' {2}".format(const.SED_PATH,
-                                           data.MANUAL_ALIAS["NAME"],
+                                           self.data.MANUAL_ALIAS["NAME"],
                                            const.ETC_HOSTS)
-        for node in self.peer_nodes:
-            _, _, rc = self.run_command(node, cmd, su_root=True)
+        results = self.run_on_nodes(self.peer_nodes, self.run_command, cmd,
+                                    su_root=True)
+        for _, _, rc in results:
             self.assertEquals(0, rc)
 
     @attr('all', 'revert', 'story54', 'story54_tc06', 'cdb_tmp')
+    @round_trip_budget(cli=9, ssh=6)
     def test_06_p_service_alias_export_load_xml(self):
         """
         @tms_id: litpcds_54_tc06
@@ -523,7 +531,9 @@ class Story54(GenericTest):
                                     "alias-cluster-config")
         # Create service alias
         export_alias = self._create_alias(
-            "exportalias", "exportalias", "122.122.54.56")
+            self.alias_ns.name("exportalias"),
+            self.alias_ns.name("exportalias"),
+            self.alias_ns.address("122.122.54.56"))
 
         # Export the service alias
         xml_file = "expected_06_story54.xml"
@@ -532,8 +542,7 @@ class Story54(GenericTest):
         # Delete created alias
         self.execute_cli_remove_cmd(self.ms_node, export_alias)
 
-        items_path = self.find(
-            self.ms_node, "/deployments", "alias", False)[0]
+        items_path = "{0}/aliases".format(self.alias_cluster_config_path)
 
         # Load the service alias
         self.execute_cli_load_cmd(self.ms_node, items_path, xml_file)
@@ -568,7 +577,10 @@ class Story54(GenericTest):
         """
         pass
 
-    @attr('all', 'revert', 'story54', 'story54_tc08')
+    # Covered by test_09 in the 'all' and 'story54' runs, which shares its
+    # plans with test_02 and test_05: select it with its own attribute.
+    @attr('revert', 'story54_tc08')
+    @round_trip_budget(cli=9, ssh=16)
     def test_08_p_create_two_node_level_aliases(self):
         """
         @tms_id: litpcds_54_tc08
@@ -594,47 +606,131 @@ class Story54(GenericTest):
         @tms_execution_type: Automated
         """
 
-        spaghetti = data.SPAGHETTI_ALIAS_8
-        spaghetti["NODE"] = self.peer_nodes[0]
-        spaghetti["PATH"] = self.node1_config_path
-        spaghetti["ALIAS_PATH"] = self.alias_node1_config_path
-
-        linguini = data.LINGUINI_ALIAS_9
-        linguini["NODE"] = self.peer_nodes[1]
-        linguini["PATH"] = self.node2_config_path
-        linguini["ALIAS_PATH"] = self.alias_node2_config_path
-        node_aliases = [spaghetti, linguini]
+        spaghetti = self.data.SPAGHETTI_ALIAS_8
+        linguini = self.data.LINGUINI_ALIAS_9
+        config_id = self.alias_node1_config_path.split("/")[-1]
+        engine = ScenarioEngine(self, self.peer_nodes)
 
-        self.log("info", "1. Create two node-level aliases with the same "
-                         "alias name; one on each peer node.")
-        for alias in node_aliases:
-            self.create_update_alias(alias, node_alias=True)
-
-        self.log("info", "2. Create and Run plan.")
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                plan_timeout_mins=10)
-
-        self.log("info", "3. Check /etc/hosts to ensure created aliases are "
-                         "present.")
-        address = data.SPAGHETTI_ALIAS_8["PROPS"]["address"]
-        alias_names = [data.SPAGHETTI_ALIAS_8["PROPS"]["alias_names"]]
-        self.check_etc_hosts_file(address, "1", alias_names,
-                                  node_alias=spaghetti["NODE"])
-
-        address = data.LINGUINI_ALIAS_9["PROPS"]["address"]
-        alias_names = [data.LINGUINI_ALIAS_9["PROPS"]["alias_names"]]
-        self.check_etc_hosts_file(address, "1", alias_names,
-                                  node_alias=linguini["NODE"])
-
-        self.log("info", "4. Remove Node Config.")
-        self.execute_cli_remove_cmd(self.ms_node, spaghetti["ALIAS_PATH"])
-
-        self.log("info", "5. Create and Run plan.")
-        self.run_and_check_plan(self.ms_node, const.PLAN_COMPLETE,
-                                plan_timeout_mins=10)
-
-        self.log("info", "6. Check etc/hosts to ensure there are no aliases "
+        self.log("info", "1-3. Create two node-level aliases with the same "
+                         "alias name; one on each peer node. Create and Run "
+                         "plan. Check /etc/hosts to ensure created aliases "
+                         "are present.")
+        state = AliasState()
+        state.node(self.node1_config_path, [spaghetti], self.peer_nodes[0],
+                   config_id=config_id)
+        state.node(self.node2_config_path, [linguini], self.peer_nodes[1],
+                   config_id=config_id)
+        engine.converge(state)
+
+        self.log("info", "4-6. Remove Node Config. Create and Run plan. "
+                         "Check etc/hosts to ensure there are no aliases "
                          "present.")
-        alias_names = []
-        self.check_etc_hosts_file(address, "0", alias_names,
-                                  node_alias=spaghetti["NODE"])
+        state.node(self.node1_config_path, [], self.peer_nodes[0],
+                   config_id=config_id)
+        diff = engine.converge(state)
+        self.assertEqual([self.alias_node1_config_path], diff.removes)
+
+    # Runs test_02, test_05 and test_08 behind shared plans, in their
+    # place in the 'all' and 'story54' runs.
+    @attr('all', 'revert', 'story54', 'story54_batch')
+    @round_trip_budget(cli=18, ssh=12, ssh_per_node=8)
+    def test_09_p_batched_alias_scenarios(self):
+        """
+        @tms_id: litpcds_54_batch
+        @tms_requirements_id: LITPCDS-54
+        @tms_title: test_09_p_batched_alias_scenarios
+        @tms_description: Runs the scenarios of test_02, test_05 and
+            test_08 together, sharing one plan per phase
+        @tms_test_steps:
+            @step: Create two cluster-level aliases with the same IP,
+                   a cluster-level alias with the IP of a manually added
+                   /etc/hosts line and a node-level alias on each of two
+                   peer nodes. Create and Run plan.
+            @result: Plan runs to completion successfully.
+            @step: Check /etc/hosts of every peer node.
+            @result: /etc/hosts contains the expected aliases.
+            @step: Remove the two aliases with the same IP and their
+                   config, the manually added line and the first
+                   node-level alias config. Create and Run plan.
+            @result: Plan runs to completion successfully.
+            @step: Check /etc/hosts of every peer node.
+            @result: Removed aliases are no longer present.
+            @step: Create a cluster-level alias with two names and one IP.
+                   Create and Run plan.
+            @result: Plan runs to completion successfully.
+            @step: Check /etc/hosts of every peer node.
+            @result: Alias with two names and one IP is present.
+        @tms_test_precondition:NA
+        @tms_execution_type: Automated
+        """
+        self.log("info", "# 1. Define the scenarios of test_02, test_05 and "
+                         "test_08")
+        names = Scenario("ip_with_multiple_names")
+        address = self.data.WEB_ALIAS_5["PROPS"]["address"]
+        config_id = self.alias_ns.config_id("batch_names_config")
+        aliases = names.create_aliases(
+            self.cluster_config_path,
+            [self.data.MAIL_ALIAS_4, self.data.WEB_ALIAS_5],
+            config_id=config_id)
+        names.expect(address, 2,
+                     [self.data.MAIL_ALIAS_4["PROPS"]["alias_names"],
+                      self.data.WEB_ALIAS_5["PROPS"]["alias_names"]])
+        names.next_phase()
+        for path in aliases:
+            names.remove(path)
+        names.remove("{0}/{1}".format(self.cluster_config_path, config_id))
+        names.expect(address, 0)
+        names.next_phase()
+        names.create_aliases(self.cluster_config_path,
+                             [self.data.COMMS_ALIAS_6],
+                             config_id=config_id)
+        names.expect(
+            address, 1,
+            self.data.COMMS_ALIAS_6["PROPS"]["alias_names"].split(","))
+
+        manual = Scenario("manual_file_update")
+        address = self.data.CRABLOUIE_ALIAS_7["PROPS"]["address"]
+        manual.run_command(self.peer_nodes,
+                           "{0} '{1} {2} # manually added by {3}' >> "
+                           "{4}".format(const.ECHO_PATH,
+                                        self.data.MANUAL_ALIAS["ADDRESS"],
+                                        self.data.MANUAL_ALIAS["NAME"],
+                                        "test_09_p_batched_alias_scenarios",
+                                        const.ETC_HOSTS))
+        manual.create_aliases(self.cluster_config_path,
+                              [self.data.CRABLOUIE_ALIAS_7],
+                              config_id=self.alias_ns.config_id(
+                                  "batch_manual_config"))
+        manual.expect(address, 2,
+                      [self.data.CRABLOUIE_ALIAS_7["PROPS"]["alias_names"]])
+        manual.next_phase()
+        manual.run_command(self.peer_nodes,
+                           "{0} -i '/{1}/d' {2}".format(
+                               const.SED_PATH, self.data.MANUAL_ALIAS["NAME"],
+                               const.ETC_HOSTS))
+        manual.expect(address, 1)
+
+        node_level = Scenario("two_node_level_aliases")
+        config_id = self.alias_node1_config_path.split("/")[-1]
+        for alias, config_path, node in (
+                (self.data.SPAGHETTI_ALIAS_8, self.node1_config_path,
+                 self.peer_nodes[0]),
+                (self.data.LINGUINI_ALIAS_9, self.node2_config_path,
+                 self.peer_nodes[1])):
+            node_level.create_aliases(
+                config_path, [alias],
+                config_type=alias_utils.ALIAS_NODE_CONFIG,
+                config_id=config_id)
+            node_level.expect(alias["PROPS"]["address"], 1,
+                              [alias["PROPS"]["alias_names"]], [node])
+        node_level.next_phase()
+        node_level.remove(self.alias_node1_config_path)
+        node_level.expect(self.data.SPAGHETTI_ALIAS_8["PROPS"]["address"], 0,
+                          nodes=[self.peer_nodes[0]])
+
+        self.log("info", "# 2. Run all scenarios, with one plan and one "
+                         "/etc/hosts snapshot per node for each phase")
+        batch = ScenarioBatch(self, self.peer_nodes)
+        for scenario in (names, manual, node_level):
+            batch.add(scenario)
+        batch.run()
@@ -14,12 +14,15 @@ program(s) have been supplied.
             Agile: STORY LITPCDS-7534
 """
 
-from litp_generic_test import GenericTest, attr
-from xml_utils import XMLUtils
+from litp_generic_test import attr
+from hosts_base import HostsGenericTest
 import hosts_test_data as hosts_data
+import test_constants as const
+import alias_utils
+from round_trips import counted_helper
 
 
-class Story7534(GenericTest):
+class Story7534(HostsGenericTest):
     """
        As a LITP User, I want the XSD validation to allow
        for property annotation, so that I can use external
@@ -33,7 +36,6 @@ class Story7534(GenericTest):
 
         super(Story7534, self).setUp()
         self.ms_node = self.get_management_node_filename()
-        self.xml = XMLUtils()
 
         self.cluster_path = self.find_children_of_collect(
             self.ms_node, "/deployments", "cluster")[0]
@@ -41,13 +43,17 @@ class Story7534(GenericTest):
         self.cluster_config_path = self.find(self.ms_node, self.cluster_path,
                                              "collection-of-cluster-config")[0]
 
-        self.alias_cluster_config_path = '{0}/alias_config'.format(
-            self.cluster_config_path)
+        self.alias_config_id = self.alias_ns.config_id("alias_config")
+        self.alias_cluster_config_path = '{0}/{1}'.format(
+            self.cluster_config_path, self.alias_config_id)
 
         self.alias_path = '{0}/aliases'.format(self.alias_cluster_config_path)
+        self.data = self.alias_ns.wrap_data(hosts_data)
 
         self.new_name_value = "%%SITE_SPECIFIC%%"
-        self.xml_file = "/tmp/test1.xml"
+        self.export_file = "/tmp/{0}test1_export.xml".format(
+            self.alias_ns.prefix)
+        self.xml_file = "/tmp/{0}test1.xml".format(self.alias_ns.prefix)
 
     def tearDown(self):
         """
@@ -55,10 +61,13 @@ class Story7534(GenericTest):
         """
         super(Story7534, self).tearDown()
 
+    @counted_helper
     def create_alias(self, alias_data):
         """
         Description:
-            Creates aliases in the litp model
+            Creates aliases in the litp model, in the existing alias
+            cluster config if there is one, otherwise together with a new
+            one
 
         Args:
             alias_data (dict): information about the alias to be created
@@ -67,26 +76,12 @@ class Story7534(GenericTest):
         Returns:
             str. Path to created alias
         """
-        alias_config = self.find(self.ms_node,
-                                 self.cluster_config_path,
-                                 "alias-cluster-config",
-                                 assert_not_empty=False)
-        if not alias_config:
-            self.execute_cli_create_cmd(self.ms_node,
-                                        self.alias_cluster_config_path,
-                                        "alias-cluster-config")
-
-        alias_path = '{0}/aliases/{1}'.format(self.alias_cluster_config_path,
-                                              alias_data["NAME"])
-
-        alias_props = ""
-        for prop_name, prop_value in alias_data["PROPS"].iteritems():
-            alias_props += '{0}="{1}" '.format(prop_name, prop_value)
-
-        self.execute_cli_create_cmd(self.ms_node, alias_path, "alias",
-                                    alias_props)
-
-        return alias_path
+        alias_config = self.get_alias_config_path(
+            self.cluster_config_path, alias_utils.ALIAS_CLUSTER_CONFIG,
+            self.alias_cluster_config_path)
+        config_path, config_id = alias_config.rsplit("/", 1)
+        return self.create_aliases(config_path, [alias_data],
+                                   config_id=config_id)[0]
 
     @attr('all', 'revert', 'story7534', 'story7534_tc09')
     def test_09_n_load_annotated_value_with_accept_all_regex(self):
@@ -102,13 +97,10 @@ class Story7534(GenericTest):
             @result: alias is exported
             @step: Remove the service alias
             @result: Service alias is removed
-            @step: Load the xml into an object using the xml utilities
-            @result: xml is loaded
-            @step: Search and update the address property
+            @step: Stream the exported xml on the MS, updating the
+             address property
             @result: Property is updated
-            @step: Convert the object back to XML
-            @result: Object is converted back to XML
-            @step: Output the xml into a file on the MS
+            @step: Check the updated xml is in a file on the MS
             @result: xml outputted to a file
         @tms_test_precondition:NA
         @tms_execution_type: Automated
@@ -116,32 +108,27 @@ class Story7534(GenericTest):
 
         self.log("info", "# 1. Create, export and remove cluster-level "
                          "service alias")
-        alias = self.create_alias(hosts_data.EXPORT_ALIAS)
+        alias = self.create_alias(self.data.EXPORT_ALIAS)
 
-        stdout, _, _ = self.execute_cli_export_cmd(self.ms_node, alias)
-        self.assertNotEqual([], stdout)
+        self.execute_cli_export_cmd(self.ms_node, alias, self.export_file)
+        self.del_file_after_run(self.ms_node, self.export_file)
 
         self.execute_cli_remove_cmd(self.ms_node, alias)
 
-        self.log("info", "# 2. Load the XML into an object. Search and update "
+        self.log("info", "# 2. Stream the exported XML on the MS, updating "
                          "the address property")
-        xml_object = self.xml.load_xml_dataobject(stdout)
-
-        name_found = False
-        for child in xml_object:
-            if child.tag == 'address':
-                child.text = self.new_name_value
-                name_found = True
-                break
-
-        self.assertTrue(name_found,
-                        "Could not find 'address' property in xml object")
-
-        self.log("info", "# 3. Convert the object back to XML and output the "
-                         "XML into a file on the MS")
-        xml_string = self.xml.output_xml_dataobject(xml_object)
-
-        self.assertTrue(self.create_file_on_node(self.ms_node,
-                                                 self.xml_file,
-                                                 xml_string.split("\n")),
+        address_path = "{0}/address".format(alias.rsplit("/", 1)[1])
+        rules = {address_path: self.new_name_value}
+        replaced = self.rewrite_xml_on_node(self.ms_node, self.export_file,
+                                            self.xml_file, rules)
+        self.del_file_after_run(self.ms_node, self.xml_file)
+
+        self.assertEqual({address_path: 1}, replaced,
+                         "Could not find 'address' property in xml")
+
+        self.log("info", "# 3. Check the updated XML is in a file on the MS")
+        stdout, _, _ = self.run_command(self.ms_node, "{0} {1}".format(
+            const.CAT_PATH, self.xml_file), default_asserts=True)
+        self.assertTrue([line for line in stdout
+                         if self.new_name_value in line],
                         "Failed to output xml to a file on the MS")
@@ -0,0 +1,140 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Hosts Team
+@summary:   Streaming rewrite of properties in exported LITP XML. The
+            document is parsed and written back event by event, so an
+            export of any size is edited without a tree of it in memory.
+            This module only uses the standard library: its source is
+            also run as a script on the MS, next to the exported file.
+"""
+import json
+import sys
+import xml.sax
+from xml.sax.saxutils import XMLGenerator
+
+HELPER_NAME = "xml_rewrite"
+CHUNK_SIZE = 65536
+WILDCARD = "*"
+
+
+def parse_rules(rules):
+    """
+    Description:
+        Splits the rule paths into segments.
+
+    Args:
+        rules (dict): New property text keyed by path. A path lists the
+                      ids of the items from the exported item down,
+                      then the property name, e.g. "my_alias/address".
+                      "*" matches any single item id.
+
+    Returns:
+        list. (path segments, new text) per rule.
+    """
+    return [(tuple(path.strip("/").split("/")), text)
+            for path, text in sorted(rules.items())]
+
+
+class PropertyRewriter(XMLGenerator):
+    """
+    Writes the SAX events it receives, replacing the text of the
+    properties that match a rule.
+    """
+
+    def __init__(self, out, rules, encoding="utf-8"):
+        """
+        Args:
+            out (file): Stream the document is written to.
+            rules (dict): New property text keyed by path, see
+                          parse_rules.
+
+        Kwargs:
+            encoding (str): Output encoding.
+        """
+        XMLGenerator.__init__(self, out, encoding)
+        self.rules = parse_rules(rules)
+        self.path = []
+        self.replacing = []
+        self.replaced = {}
+
+    def _match(self):
+        """
+        Returns the new text for the current element, or None.
+        """
+        for segments, text in self.rules:
+            if len(segments) == len(self.path) and all(
+                    segment in (WILDCARD, name)
+                    for segment, name in zip(segments, self.path)):
+                key = "/".join(self.path)
+                self.replaced[key] = self.replaced.get(key, 0) + 1
+                return text
+        return None
+
+    def startElement(self, name, attrs):
+        self.path.append(attrs.get("id", name.split(":")[-1]))
+        XMLGenerator.startElement(self, name, attrs)
+        self.replacing.append(self._match())
+
+    def characters(self, content):
+        if self.replacing[-1] is None:
+            XMLGenerator.characters(self, content)
+
+    def ignorableWhitespace(self, content):
+        self.characters(content)
+
+    def endElement(self, name):
+        text = self.replacing.pop()
+        if text is not None:
+            XMLGenerator.characters(self, text)
+        self.path.pop()
+        XMLGenerator.endElement(self, name)
+
+
+def transform(in_stream, out_stream, rules):
+    """
+    Description:
+        Copies an exported LITP document from in_stream to out_stream,
+        replacing the text of the properties matched by rules.
+
+    Args:
+        in_stream (file): Stream to read the document from.
+        out_stream (file): Stream to write the document to.
+        rules (dict): New property text keyed by path, see parse_rules.
+
+    Returns:
+        dict. Number of replacements keyed by the matched path.
+    """
+    rewriter = PropertyRewriter(out_stream, rules)
+    parser = xml.sax.make_parser()
+    parser.setContentHandler(rewriter)
+    for chunk in iter(lambda: in_stream.read(CHUNK_SIZE), b""):
+        parser.feed(chunk)
+    parser.close()
+    out_stream.write(b"\n")
+    return rewriter.replaced
+
+
+def main(argv):
+    """
+    Description:
+        Command line entry point: <input file> <output file> <rules as
+        JSON>. Prints one "REPLACED <count> <path>" line per matched
+        path.
+    """
+    in_path, out_path, rules = argv[1], argv[2], json.loads(argv[3])
+    with open(in_path, "rb") as in_stream:
+        with open(out_path, "wb") as out_stream:
+            replaced = transform(in_stream, out_stream, rules)
+    for path, count in sorted(replaced.items()):
+        print("REPLACED {0} {1}".format(count, path))
+
+
+if __name__ == "__main__":
+    main(sys.argv)